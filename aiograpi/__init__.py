@@ -8,12 +8,14 @@ from aiograpi.mixins.album import DownloadAlbumMixin, UploadAlbumMixin
 from aiograpi.mixins.attestation import DeviceAttestationMixin
 from aiograpi.mixins.auth import LoginMixin
 from aiograpi.mixins.bloks import BloksMixin
+from aiograpi.mixins.cache import CacheMixin
 from aiograpi.mixins.challenge import ChallengeResolveMixin
 from aiograpi.mixins.clip import ClipMixin, DownloadClipMixin, UploadClipMixin
 from aiograpi.mixins.collection import CollectionMixin
 from aiograpi.mixins.comment import CommentMixin
 from aiograpi.mixins.crossposting import CrossPostingMixin
 from aiograpi.mixins.direct import DirectMixin
+from aiograpi.mixins.download import DownloadManagerMixin
 from aiograpi.mixins.explore import ExploreMixin
 from aiograpi.mixins.fbsearch import FbSearchMixin
 from aiograpi.mixins.fundraiser import FundraiserMixin
@@ -36,6 +38,7 @@ from aiograpi.mixins.public import (
     TopSearchesPublicMixin,
 )
 from aiograpi.mixins.realtime import RealtimeMixin
+from aiograpi.mixins.rupload import RuploadMixin
 from aiograpi.mixins.share import ShareMixin
 from aiograpi.mixins.signup import SignUpMixin
 from aiograpi.mixins.story import StoryMixin
@@ -59,6 +62,7 @@ class Client(
     PublicRequestMixin,
     ChallengeResolveMixin,
     PrivateRequestMixin,
+    CacheMixin,
     TopSearchesPublicMixin,
     ProfilePublicMixin,
     LoginMixin,
@@ -71,6 +75,8 @@ class Client(
     DownloadVideoMixin,
     UploadVideoMixin,
     DownloadAlbumMixin,
+    DownloadManagerMixin,
+    RuploadMixin,
     NotificationMixin,
     UploadAlbumMixin,
     DownloadIGTVMixin,
@@ -110,9 +116,18 @@ class Client(
         **kwargs,
     ):
         self.tls_verify = kwargs.pop("tls_verify", True)
+        self.http2 = kwargs.pop("http2", False)
+        self.pool_limits = kwargs.pop("pool_limits", None) or {}
         self.timezone_offset = kwargs.pop("timezone_offset", -14400)
         self.timezone_name = kwargs.pop("timezone_name", "")
         self.push_disabled = kwargs.pop("push_disabled", True)
+        self.set_upload_state(kwargs.pop("upload_state", None))
+        self.set_image_executor(kwargs.pop("image_executor", None))
+        self.set_upload_segments(
+            kwargs.pop("upload_segment_size", self.upload_segment_size),
+            kwargs.pop("upload_parallelism", self.upload_parallelism),
+            kwargs.pop("upload_segmented_min_size", self.upload_segmented_min_size),
+        )
         super().__init__(**kwargs)
         self.settings = deepcopy(settings or {})
         self.override_app_version = override_app_version
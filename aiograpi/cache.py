@@ -0,0 +1,459 @@
+import hashlib
+import os
+import shutil
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from copy import deepcopy
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Type, TypeVar, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from pydantic import BaseModel, ConfigDict
+
+T = TypeVar("T")
+
+# Per-entity defaults. Profiles and media change slowly; follower lists and
+# stories go stale quickly and can be large, so they get shorter TTLs and
+# fewer slots.
+DEFAULT_CACHE_TTL: Dict[str, Optional[float]] = {
+    "users": 3600,
+    "user_shorts": 3600,
+    "usernames": 86400,
+    "user_following": 600,
+    "user_followers": 600,
+    "medias": 3600,
+    "stories": 600,
+}
+DEFAULT_CACHE_MAX_ENTRIES: Dict[str, Optional[int]] = {
+    "users": 10000,
+    "user_shorts": 10000,
+    "usernames": 10000,
+    "user_following": 100,
+    "user_followers": 100,
+    "medias": 10000,
+    "stories": 10000,
+}
+
+CacheLimit = Union[None, int, float, Dict[str, Optional[float]]]
+
+
+def approx_sizeof(value: Any, _seen: Optional[set] = None) -> int:
+    """Rough deep size of ``value`` in bytes (containers and model fields)."""
+    seen = set() if _seen is None else _seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, (str, bytes, int, float, bool)) or value is None:
+        return size
+    if isinstance(value, dict):
+        size += sum(approx_sizeof(k, seen) + approx_sizeof(v, seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(approx_sizeof(item, seen) for item in value)
+    elif hasattr(value, "__dict__"):
+        size += approx_sizeof(vars(value), seen)
+    return size
+
+
+# model class -> frozen twin, and back
+_FROZEN_TYPES: Dict[type, type] = {}
+_THAWED_TYPES: Dict[type, type] = {}
+
+
+def _frozen_eq(self, other):
+    if not isinstance(other, BaseModel):
+        return NotImplemented
+    return (
+        _THAWED_TYPES.get(type(self), type(self)) is _THAWED_TYPES.get(type(other), type(other))
+        and (self.__pydantic_extra__ or {}) == (other.__pydantic_extra__ or {})
+        and self.__dict__ == other.__dict__
+    )
+
+
+def _frozen_reduce(self):
+    return _unpickle_frozen, (_THAWED_TYPES[type(self)], self.__getstate__())
+
+
+def _unpickle_frozen(cls: Type[BaseModel], state: Any) -> Any:
+    value = cls.__new__(cls)
+    value.__setstate__(state)
+    object.__setattr__(value, "__class__", _frozen_type(cls))
+    return value
+
+
+def _frozen_type(cls: type) -> type:
+    frozen = _FROZEN_TYPES.get(cls)
+    if frozen is None:
+        frozen = type(
+            cls.__name__,
+            (cls,),
+            {
+                "__module__": cls.__module__,
+                "__qualname__": cls.__qualname__,
+                "model_config": ConfigDict(frozen=True),
+                "__eq__": _frozen_eq,
+                "__reduce__": _frozen_reduce,
+            },
+        )
+        _FROZEN_TYPES[cls] = frozen
+        _THAWED_TYPES[frozen] = cls
+    return frozen
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} of a cached object is read-only, ask for copy=True to modify it")
+
+
+class FrozenList(list):
+    """Read-only list of a frozen cached object."""
+
+    __slots__ = ()
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+
+    def __reduce__(self):
+        return FrozenList, (list(self),)
+
+
+class FrozenDict(dict):
+    """Read-only dict of a frozen cached object."""
+
+    __slots__ = ()
+    pop = popitem = clear = update = setdefault = _read_only
+    __setitem__ = __delitem__ = __ior__ = _read_only
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+
+def _retype(value: Any, freezing: bool) -> Any:
+    if isinstance(value, BaseModel):
+        fields = value.__dict__
+        for name, item in fields.items():
+            fields[name] = _retype(item, freezing)
+        cls = type(value)
+        if freezing and cls not in _THAWED_TYPES:
+            object.__setattr__(value, "__class__", _frozen_type(cls))
+        elif not freezing and cls in _THAWED_TYPES:
+            object.__setattr__(value, "__class__", _THAWED_TYPES[cls])
+        return value
+    if isinstance(value, list):
+        items = [_retype(item, freezing) for item in value]
+        return FrozenList(items) if freezing else items
+    if isinstance(value, dict):
+        mapping = {key: _retype(item, freezing) for key, item in value.items()}
+        return FrozenDict(mapping) if freezing else mapping
+    if type(value) is tuple:
+        return tuple(_retype(item, freezing) for item in value)
+    return value
+
+
+def freeze(value: T) -> T:
+    """
+    Read-only deep copy of a model, to be stored in a cache.
+
+    Every nested model keeps its type for ``isinstance`` checks, equality
+    and serialization but assigning a field raises
+    ``pydantic.ValidationError``; nested lists and dicts become
+    :class:`FrozenList` / :class:`FrozenDict`, which raise ``TypeError`` on
+    modification. ``value`` itself is left untouched, so cache hits can be
+    shared without a copy.
+    """
+    return _retype(deepcopy(value), True)
+
+
+def mutable_copy(value: T) -> T:
+    """Deep copy of a (possibly frozen) cached object that callers may mutate."""
+    return _retype(deepcopy(value), False)
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+class LRUCache(MutableMapping):
+    """
+    Dict-like LRU cache with optional TTL and entry/byte bounds.
+
+    ``get()`` and ``cache[key]`` count hits and misses; membership tests only
+    drop expired entries. ``max_bytes`` is enforced with ``sizeof`` (a rough
+    deep-size estimate by default), which is only computed when set.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        sizeof: Callable[[Any], int] = approx_sizeof,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.sizeof = sizeof
+        self.stats = CacheStats()
+        self._data: "OrderedDict[Any, tuple]" = OrderedDict()  # key -> (value, expires_at, size)
+
+    def _expired(self, key) -> bool:
+        expires_at = self._data[key][1]
+        if expires_at is None or expires_at > time.monotonic():
+            return False
+        self._remove(key)
+        self.stats.expirations += 1
+        return True
+
+    def _remove(self, key):
+        value, _, size = self._data.pop(key)
+        self.stats.entries = len(self._data)
+        self.stats.bytes -= size
+        return value
+
+    def _evict(self):
+        while self._data and (
+            (self.max_entries is not None and len(self._data) > self.max_entries)
+            or (self.max_bytes is not None and self.stats.bytes > self.max_bytes)
+        ):
+            self._remove(next(iter(self._data)))
+            self.stats.evictions += 1
+
+    def __getitem__(self, key):
+        if key not in self._data or self._expired(key):
+            self.stats.misses += 1
+            raise KeyError(key)
+        self._data.move_to_end(key)
+        self.stats.hits += 1
+        return self._data[key][0]
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key, value):
+        if key in self._data:
+            self._remove(key)
+        size = self.sizeof(value) if self.max_bytes is not None else 0
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._data[key] = (value, expires_at, size)
+        self.stats.entries = len(self._data)
+        self.stats.bytes += size
+        self._evict()
+
+    def __delitem__(self, key):
+        self._remove(key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._data and not self._expired(key)
+
+    def __iter__(self) -> Iterator:
+        return iter(list(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self):
+        self._data.clear()
+        self.stats.entries = 0
+        self.stats.bytes = 0
+
+
+class ClientCache:
+    """
+    Named LRU caches backing ``user_info``, ``media_info``, ``story_info``,
+    ``user_followers`` and ``user_following``.
+
+    Every ``Client`` builds its own by default. Pass the same instance as
+    ``Client(cache=...)`` to share entries between clients on purpose.
+    ``ttl``, ``max_entries`` and ``max_bytes`` accept a single value for all
+    caches or a ``{name: value}`` dict overriding the defaults per cache.
+    """
+
+    def __init__(
+        self,
+        max_entries: CacheLimit = None,
+        max_bytes: CacheLimit = None,
+        ttl: CacheLimit = None,
+    ):
+        self.max_entries = self._limits(DEFAULT_CACHE_MAX_ENTRIES, max_entries)
+        self.max_bytes = self._limits({}, max_bytes)
+        self.ttl = self._limits(DEFAULT_CACHE_TTL, ttl)
+        self._caches: Dict[str, LRUCache] = {}
+
+    @staticmethod
+    def _limits(defaults: Dict[str, Any], value: CacheLimit) -> Dict[str, Any]:
+        if isinstance(value, dict):
+            return dict(defaults, **value)
+        if value is None:
+            return dict(defaults)
+        return {name: value for name in DEFAULT_CACHE_TTL}
+
+    def __getitem__(self, name: str) -> LRUCache:
+        if name not in self._caches:
+            max_entries = self.max_entries.get(name)
+            max_bytes = self.max_bytes.get(name)
+            self._caches[name] = LRUCache(
+                max_entries=int(max_entries) if max_entries is not None else None,
+                max_bytes=int(max_bytes) if max_bytes is not None else None,
+                ttl=self.ttl.get(name),
+            )
+        return self._caches[name]
+
+    def clear(self, *names: str):
+        for name, cache in self._caches.items():
+            if not names or name in names:
+                cache.clear()
+
+    def stats(self) -> Dict[str, CacheStats]:
+        return {name: cache.stats for name, cache in self._caches.items()}
+
+
+def media_asset_key(url) -> str:
+    """
+    Identity of a CDN asset independent of its signed query string
+
+    The host (the CDN edge differs between scrapes) and the signature keys
+    ``oh=``/``oe=``/``_nc_*`` are dropped; the path and the remaining query
+    keys such as ``stp=`` (size, crop, format of the rendition) are kept.
+    """
+    parts = urlsplit(str(url))
+    query = sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name not in ("oh", "oe") and not name.startswith("_nc_")
+    )
+    return f"{parts.path}?{urlencode(query)}" if query else parts.path
+
+
+def _place(src: Path, dest: Path, link: bool = False):
+    """Hardlink (or copy) ``src`` to ``dest`` through a temporary name."""
+    tmp = dest.with_name(f".{dest.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        if link:
+            try:
+                os.link(src, tmp)
+            except OSError:
+                shutil.copyfile(src, tmp)
+        else:
+            shutil.copyfile(src, tmp)
+        os.replace(tmp, dest)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+class MediaFileCache:
+    """
+    On-disk cache of downloaded CDN files keyed by :func:`media_asset_key`,
+    so the same photo or video fetched again through a freshly signed URL
+    is served from disk.
+
+    Files live under ``directory`` named by the SHA-256 of the key and are
+    evicted least recently used first once they take more than
+    ``max_bytes``. Hits and stored downloads are copied; ``link=True``
+    hardlinks them instead when the file system allows it, which saves the
+    copy but shares the file, so writing into a destination in place also
+    changes the cached entry.
+
+    ``fetch`` and ``store`` copy whole files, so async code runs them in a
+    worker thread (``asyncio.to_thread``); the LRU bookkeeping is guarded by
+    a lock, the copies run outside it.
+    """
+
+    def __init__(self, directory, max_bytes: int = 1024**3, link: bool = False):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int(max_bytes)
+        self.link = link
+        self.stats = CacheStats()
+        self._files: "OrderedDict[Path, int]" = OrderedDict()
+        self._lock = threading.Lock()
+        # rebuild the LRU order from the access times kept by os.utime()
+        files = [path for path in self.directory.glob("*/*") if path.is_file() and not path.name.startswith(".")]
+        for path in sorted(files, key=lambda path: path.stat().st_mtime):
+            self._add(path, path.stat().st_size)
+
+    def path_for(self, url) -> Path:
+        key = media_asset_key(url)
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        suffix = Path(key.split("?", 1)[0]).suffix
+        return self.directory / digest[:2] / f"{digest}{suffix}"
+
+    def _add(self, path: Path, size: int):
+        self.stats.bytes += size - self._files.pop(path, 0)
+        self._files[path] = size
+        self.stats.entries = len(self._files)
+
+    def _remove(self, path: Path):
+        self.stats.bytes -= self._files.pop(path, 0)
+        self.stats.entries = len(self._files)
+        path.unlink(missing_ok=True)
+
+    def fetch(self, url, dest) -> Optional[Path]:
+        """Place the cached copy of ``url`` at ``dest`` and return it, or None on a miss."""
+        path = self.path_for(url)
+        with self._lock:
+            if path.exists():
+                # also picks up files stored by another process sharing the directory
+                self._add(path, path.stat().st_size)
+                os.utime(path)
+        dest = Path(dest)
+        try:
+            _place(path, dest, self.link)
+        except FileNotFoundError:
+            # missing, or evicted by a concurrent store since the check above
+            with self._lock:
+                if path in self._files:
+                    self._remove(path)
+                self.stats.misses += 1
+            return None
+        with self._lock:
+            self.stats.hits += 1
+        return dest.resolve()
+
+    def store(self, url, src) -> Path:
+        """Add the downloaded file ``src`` as the copy of ``url`` (files over ``max_bytes`` are not kept)."""
+        path = self.path_for(url)
+        if Path(src).stat().st_size > self.max_bytes:
+            return path
+        path.parent.mkdir(exist_ok=True)
+        _place(Path(src), path, self.link)
+        with self._lock:
+            self._add(path, path.stat().st_size)
+            while self.stats.bytes > self.max_bytes:
+                oldest = next(iter(self._files))
+                self._remove(oldest)
+                self.stats.evictions += 1
+        return path
+
+    def clear(self):
+        with self._lock:
+            for path in list(self._files):
+                self._remove(path)
+
+
+__all__ = [
+    "CacheStats",
+    "ClientCache",
+    "DEFAULT_CACHE_MAX_ENTRIES",
+    "DEFAULT_CACHE_TTL",
+    "FrozenDict",
+    "FrozenList",
+    "LRUCache",
+    "MediaFileCache",
+    "approx_sizeof",
+    "freeze",
+    "media_asset_key",
+    "mutable_copy",
+]
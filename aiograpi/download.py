@@ -0,0 +1,268 @@
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncGenerator, AsyncIterable, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+from aiograpi import httpx_ext
+from aiograpi.exceptions import ClientConnectionError, ClientIncompleteReadError
+from aiograpi.types import Media, Story, Track
+
+DownloadItem = Union[Media, Story, Track, str, Tuple[str, str]]
+
+# Failures worth another attempt: the CDN dropped the connection, sent a
+# short body or answered 429/5xx (see Retry.statuses).
+TRANSIENT_ERRORS = (httpx_ext.TransportError, ClientConnectionError, ClientIncompleteReadError)
+
+
+@dataclass
+class DownloadResult:
+    item: Any
+    url: str
+    path: Path
+    status: str = "downloaded"  # "downloaded", "skipped" or "failed"
+    error: Optional[Exception] = None
+    attempts: int = 0
+    bytes: int = 0
+
+
+@dataclass
+class DownloadStats:
+    files: int = 0
+    downloaded: int = 0
+    skipped: int = 0
+    failed: int = 0
+    retries: int = 0
+    bytes: int = 0
+    started: float = field(default_factory=time.monotonic)
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    @property
+    def throughput(self) -> float:
+        """Downloaded bytes per second since the manager started."""
+        elapsed = self.elapsed
+        return self.bytes / elapsed if elapsed > 0 else 0.0
+
+
+def download_targets(item: DownloadItem) -> List[Tuple[str, str]]:
+    """
+    ``(url, filename)`` pairs for a media, story, track, URL or ``(url, filename)``
+
+    Filenames follow the download helpers: ``{username}_{pk}`` for medias
+    and stories (every slide of an album), the track id for tracks and the
+    URL's own name for plain URLs. The extension is taken from the URL.
+    """
+    if isinstance(item, (str, tuple)):
+        url, filename = (item, "") if isinstance(item, str) else item
+        return [(str(url), filename)]
+    if isinstance(item, Track):
+        track_url = item.uri or item.progressive_download_url
+        if not track_url:
+            raise ValueError(f"Track {item.id} has no download URL")
+        return [(str(track_url), f"track_{item.id}")]
+    slides: List[Tuple[Any, str]]
+    if isinstance(item, Media) and item.media_type == 8:
+        slides = [(resource, f"{item.user.username}_{resource.pk}") for resource in item.resources]
+    elif isinstance(item, (Media, Story)):
+        slides = [(item, f"{item.user.username}_{item.pk}")]
+    else:
+        raise TypeError(f"Cannot download {type(item).__name__}")
+    targets = []
+    for slide, filename in slides:
+        slide_url = slide.thumbnail_url if slide.media_type == 1 else slide.video_url
+        if not slide_url:
+            raise ValueError(f'Media type "{slide.media_type}" has no download URL (pk={slide.pk})')
+        targets.append((str(slide_url), filename))
+    return targets
+
+
+class DownloadManager:
+    """
+    Downloads medias, stories, tracks and URLs with a global and a per-host
+    concurrency limit.
+
+    ``download()`` streams a :class:`DownloadResult` for every file as it
+    finishes. Items are pulled from the (sync or async) iterable only when a
+    worker is free, so a queue of any length runs in constant memory. Files
+    that already exist are skipped unless ``overwrite=True``; CDN connection
+    errors, short bodies and ``retry.statuses`` responses are retried with
+    the backoff and budget of ``retry`` (:class:`httpx_ext.Retry`). Any other
+    error fails that file only.
+
+    ``on_progress(result, stats)`` is called (or awaited) after every file
+    with the running :class:`DownloadStats`, which include the throughput.
+    """
+
+    def __init__(
+        self,
+        client,
+        folder: Union[str, Path] = "",
+        concurrency: int = 16,
+        per_host: int = 6,
+        retry: Optional[httpx_ext.Retry] = None,
+        overwrite: bool = False,
+        resume: bool = False,
+        on_progress: Optional[Callable[[DownloadResult, DownloadStats], Any]] = None,
+    ):
+        self.client = client
+        self.folder = Path(folder)
+        self.concurrency = max(1, int(concurrency))
+        self.per_host = max(1, int(per_host))
+        self.retry = retry if retry is not None else httpx_ext.Retry()
+        self.overwrite = overwrite
+        self.resume = resume
+        self.on_progress = on_progress
+        self.stats = DownloadStats()
+        self._hosts: Dict[str, asyncio.Semaphore] = {}
+
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc
+        slot = self._hosts.get(host)
+        if slot is None:
+            slot = self._hosts[host] = asyncio.Semaphore(self.per_host)
+        return slot
+
+    def _path(self, url: str, filename: str) -> Path:
+        name = urlparse(url).path.rsplit("/", 1)[-1]
+        if filename and "." in name:
+            name = "%s.%s" % (filename, name.rsplit(".", 1)[1])
+        elif filename:
+            name = filename
+        return self.folder / name
+
+    def _retry_delay(self, exc: Exception, attempt: int) -> Optional[float]:
+        if isinstance(exc, httpx_ext.HTTPStatusError):
+            return self.retry.delay_for_response("GET", exc.response, attempt)
+        if not isinstance(exc, TRANSIENT_ERRORS):
+            return None
+        if attempt >= self.retry.total or not self.retry.budget.withdraw():
+            return None
+        return self.retry.backoff(attempt + 1)
+
+    async def _fetch(self, item: Any, url: str, filename: str) -> DownloadResult:
+        path = self._path(url, filename)
+        result = DownloadResult(item=item, url=url, path=path)
+        if path.exists() and not self.overwrite:
+            result.status = "skipped"
+            return result
+        self.retry.budget.deposit()
+        while True:
+            result.attempts += 1
+            try:
+                async with self._host_slot(url):
+                    result.path = await self.client._download_to_path(url, path, resume=self.resume)
+                result.bytes = result.path.stat().st_size
+            except Exception as exc:
+                delay = self._retry_delay(exc, result.attempts - 1)
+                if delay is None:
+                    result.status, result.error = "failed", exc
+                    return result
+                self.stats.retries += 1
+                await asyncio.sleep(delay)
+                continue
+            return result
+
+    def _item_jobs(self, item) -> List[Union[Tuple[Any, str, str], DownloadResult]]:
+        try:
+            return [(item, url, filename) for url, filename in download_targets(item)]
+        except (TypeError, ValueError) as exc:
+            return [DownloadResult(item=item, url="", path=self.folder, status="failed", error=exc)]
+
+    async def _jobs(self, items) -> AsyncGenerator[Union[Tuple[Any, str, str], DownloadResult], None]:
+        if isinstance(items, AsyncIterable):
+            async for item in items:
+                for job in self._item_jobs(item):
+                    yield job
+        else:
+            for item in items:
+                for job in self._item_jobs(item):
+                    yield job
+
+    def _record(self, result: DownloadResult):
+        self.stats.files += 1
+        if result.status == "downloaded":
+            self.stats.downloaded += 1
+            self.stats.bytes += result.bytes
+        elif result.status == "skipped":
+            self.stats.skipped += 1
+        else:
+            self.stats.failed += 1
+
+    async def download(self, items: Union[Iterable, AsyncIterable]) -> AsyncGenerator[DownloadResult, None]:
+        """
+        Download every item and yield the results in completion order
+
+        Parameters
+        ----------
+        items: Iterable or AsyncIterable
+            Media, Story and Track objects, URLs or ``(url, filename)`` tuples
+
+        Returns
+        -------
+        AsyncGenerator[DownloadResult, None]
+            One result per file (an album yields one per slide). Leaving the
+            loop early cancels the downloads still running.
+        """
+        jobs = self._jobs(items)
+        lock = asyncio.Lock()
+        # bounded, so workers stop pulling items while the caller is busy
+        queue: asyncio.Queue = asyncio.Queue(self.concurrency)
+        done = object()
+
+        async def worker():
+            try:
+                while True:
+                    async with lock:
+                        job = await anext(jobs, None)
+                    if job is None:
+                        break
+                    result = job if isinstance(job, DownloadResult) else await self._fetch(*job)
+                    await queue.put(result)
+            except Exception as exc:
+                # the items iterable failed: hand the error to the caller
+                await queue.put(exc)
+            await queue.put(done)
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(self.concurrency)]
+        try:
+            running = len(workers)
+            while running:
+                result = await queue.get()
+                if result is done:
+                    running -= 1
+                    continue
+                if isinstance(result, Exception):
+                    raise result
+                self._record(result)
+                if self.on_progress is not None:
+                    callback = self.on_progress(result, self.stats)
+                    if inspect.isawaitable(callback):
+                        await callback
+                yield result
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            await jobs.aclose()
+
+    async def download_all(self, items: Union[Iterable, AsyncIterable]) -> List[DownloadResult]:
+        """
+        Download every item and collect the results
+
+        Parameters
+        ----------
+        items: Iterable or AsyncIterable
+            Media, Story and Track objects, URLs or ``(url, filename)`` tuples
+
+        Returns
+        -------
+        List[DownloadResult]
+            One result per file, in completion order
+        """
+        return [result async for result in self.download(items)]
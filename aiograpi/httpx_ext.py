@@ -1,5 +1,13 @@
 import asyncio
+import random
 import ssl
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Any, Dict, Iterable, Optional, Set
+from urllib.parse import urlsplit
 
 import httpx
 import orjson
@@ -68,26 +76,284 @@ def _httpx_verify_value(verify):
     return verify
 
 
+# keeps background aclose() tasks referenced until they finish
+_closing: Set["asyncio.Task[None]"] = set()
+
+
+def _aclose_later(clients: Iterable[httpx.AsyncClient], loop=None, delay: float = 0):
+    """
+    Close ``clients`` after ``delay`` seconds on ``loop`` (default: the
+    running loop) without awaiting them. Connections can only be closed on
+    the loop that opened them, so clients of a closed loop are dropped.
+    """
+    clients = [client for client in clients if client is not None and not client.is_closed]
+    if loop is None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+    if not clients or loop.is_closed():
+        return
+
+    def close():
+        for client in clients:
+            task = loop.create_task(client.aclose())
+            _closing.add(task)
+            task.add_done_callback(_closing.discard)
+
+    loop.call_soon_threadsafe(loop.call_later, delay, close)
+
+
+class RequestClientPool:
+    """
+    Shared ``httpx.AsyncClient`` instances for :func:`request`, keyed by
+    ``(proxy, verify, follow_redirects)``, so one-off requests (short-link
+    expansion, rupload, downloads) reuse warm connections instead of paying
+    a TCP + TLS handshake on every call.
+
+    The clients never store cookies, since every ``Client`` shares them.
+    Connections belong to the event loop that opened them: when the loop
+    changes, the clients of the previous one are closed on it if it is
+    still open and dropped otherwise, and ``await aclose()`` closes the
+    current ones (e.g. before ``asyncio.run`` returns).
+    """
+
+    def __init__(self):
+        self._clients: Dict[tuple, httpx.AsyncClient] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get(self, proxy=None, verify=True, follow_redirects=True) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            if self._loop is not None:
+                _aclose_later(self._clients.values(), self._loop)
+            self._clients = {}
+            self._loop = loop
+        key = (proxy, verify, follow_redirects)
+        client = self._clients.get(key)
+        if client is None or client.is_closed:
+            client = self._clients[key] = httpx.AsyncClient(
+                proxy=proxy,
+                verify=_httpx_verify_value(verify),
+                follow_redirects=follow_redirects,
+                cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+            )
+        return client
+
+    async def aclose(self):
+        clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            await client.aclose()
+
+
+request_clients = RequestClientPool()
+
+
+async def aclose():
+    """Close the pooled clients of :func:`request`."""
+    await request_clients.aclose()
+
+
 async def request(method, url, proxy=None, verify=True, follow_redirects=True, **kwargs):
     if "timeout" not in kwargs:
         kwargs["timeout"] = DEFAULT_TIMEOUT
-    async with httpx.AsyncClient(
-        proxy=proxy,
-        verify=_httpx_verify_value(verify),
-        follow_redirects=follow_redirects,
-    ) as client:
-        return await client.request(method, url, **kwargs)
+    if kwargs.get("cookies"):
+        # the pooled clients drop cookies, so per-request cookies need a client of their own
+        async with httpx.AsyncClient(
+            proxy=proxy,
+            verify=_httpx_verify_value(verify),
+            follow_redirects=follow_redirects,
+        ) as client:
+            return await client.request(method, url, **kwargs)
+    client = request_clients.get(proxy, verify, follow_redirects)
+    return await client.request(method, url, **kwargs)
+
+
+@asynccontextmanager
+async def stream(method, url, proxy=None, verify=True, follow_redirects=True, **kwargs):
+    """Streaming counterpart of :func:`request` on the same pooled clients."""
+    if "timeout" not in kwargs:
+        kwargs["timeout"] = DEFAULT_TIMEOUT
+    client = request_clients.get(proxy, verify, follow_redirects)
+    async with client.stream(method, url, **kwargs) as response:
+        yield response
+
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# Raised before the request reached the server: safe to resend any method.
+UNSENT_REQUEST_ERRORS = (ConnectError, ConnectTimeout, PoolTimeout)
+# The server may have seen the request: resend idempotent requests only.
+SENT_REQUEST_ERRORS = (ReadError, ReadTimeout, WriteError, WriteTimeout, RemoteProtocolError)
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of traffic so an outage does not multiply load.
+
+    Every request deposits ``ratio`` tokens (up to ``capacity``) and every
+    retry spends one, so a healthy client can retry a burst of ``capacity``
+    failures while a failing one settles at ``ratio`` retries per request.
+    """
+
+    def __init__(self, ratio: float = 0.2, capacity: float = 10):
+        self.ratio = ratio
+        self.capacity = capacity
+        self.balance = float(capacity)
+
+    def deposit(self):
+        self.balance = min(self.capacity, self.balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        if self.balance < 1:
+            return False
+        self.balance -= 1
+        return True
+
+
+class Retry:
+    """
+    Transport-level retry policy for :class:`Session`.
+
+    Retries transient connection errors and ``statuses`` responses with
+    exponential backoff and full jitter (``uniform(0, backoff_factor * 2 **
+    (attempt - 1))``, capped at ``backoff_max``), honours ``Retry-After``
+    and spends from ``budget``. Non-idempotent methods (POST) are only
+    resent when the request provably never reached the server, unless the
+    caller passes ``idempotent=True``.
+    """
+
+    def __init__(
+        self,
+        total: int = 3,
+        backoff_factor: float = 0.5,
+        statuses=(429, 500, 502, 503, 504),
+        backoff_max: float = 30,
+        respect_retry_after: bool = True,
+        budget: Optional[RetryBudget] = None,
+        retry_headers: Optional[dict] = None,
+    ):
+        self.total = int(total)
+        self.backoff_factor = float(backoff_factor)
+        self.statuses = frozenset(int(status) for status in statuses)
+        self.backoff_max = backoff_max
+        self.respect_retry_after = respect_retry_after
+        self.budget = budget if budget is not None else RetryBudget()
+        self.retry_headers = dict(retry_headers or {})
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_factor * 2 ** (attempt - 1)))
+
+    @staticmethod
+    def retry_after(response):
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def _may_retry(self, attempt: int) -> bool:
+        return attempt < self.total and self.budget.withdraw()
+
+    def delay_for_error(self, method: str, exc: Exception, attempt: int, idempotent: Optional[bool] = None):
+        """Seconds to wait before resending after ``exc``, or None to raise it."""
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        if not isinstance(exc, UNSENT_REQUEST_ERRORS) and not (idempotent and isinstance(exc, SENT_REQUEST_ERRORS)):
+            return None
+        if not self._may_retry(attempt):
+            return None
+        return self.backoff(attempt + 1)
+
+    def delay_for_response(self, method: str, response, attempt: int, idempotent: Optional[bool] = None):
+        """Seconds to wait before resending after ``response``, or None to return it."""
+        if response.status_code not in self.statuses:
+            return None
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        if not idempotent:
+            return None
+        delay = self.retry_after(response) if self.respect_retry_after else None
+        if delay is not None and delay > self.backoff_max:
+            return None  # the server asked for a longer pause than we are willing to block for
+        if not self._may_retry(attempt):
+            return None
+        return delay if delay is not None else self.backoff(attempt + 1)
+
+
+# Connection pools are configured per host class: "api" (i.instagram.com,
+# the private session), "graphql" (www.instagram.com, the graphql and
+# public sessions) and "cdn" (media downloads from the CDN hosts).
+HOST_CLASSES = ("api", "graphql", "cdn")
+CDN_HOST_SUFFIXES = (".cdninstagram.com", ".fbcdn.net")
+
+
+def host_class(url) -> str:
+    host = urlsplit(str(url)).hostname or ""
+    if host.endswith(CDN_HOST_SUFFIXES):
+        return "cdn"
+    if host.startswith("www."):
+        return "graphql"
+    return "api"
+
+
+@dataclass
+class PoolConfig:
+    """
+    Connection pool of one host class (defaults are httpx's).
+
+    ``http2=True`` multiplexes concurrent requests over one connection per
+    host and needs the optional ``h2`` package (``pip install aiograpi[http2]``).
+    """
+
+    max_connections: Optional[int] = 100
+    max_keepalive_connections: Optional[int] = 20
+    keepalive_expiry: Optional[float] = 5.0
+    http2: bool = False
+
+    @classmethod
+    def from_settings(
+        cls, pool_limits: Optional[Dict[str, Dict[str, Any]]], name: str, http2: bool = False
+    ) -> "PoolConfig":
+        options = dict((pool_limits or {}).get(name) or {})
+        options.setdefault("http2", http2)
+        return cls(**options)
+
+    @property
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
 
 
 class Session:
-    def __init__(self, verify=True):
+    def __init__(
+        self,
+        verify=True,
+        retry: Optional[Retry] = None,
+        pool: Optional[PoolConfig] = None,
+        host_pools: Optional[Dict[str, PoolConfig]] = None,
+    ):
         # TLS verification ON by default — turn off only if you're sure
         # the proxy is a known MITM (e.g. a corporate inspection
         # gateway). With verify=False, an attacker on the network path
         # can intercept sessionid / passwords / TOTP secrets.
-        self.headers = {}
+        self.headers: dict = {}
         self.verify = verify
-        self._client = None
+        self.retry = retry
+        # pool: this session's own traffic; host_pools: host classes (see
+        # host_class) that get a dedicated client, e.g. {"cdn": PoolConfig()}
+        self.pool = pool or PoolConfig()
+        self.host_pools = dict(host_pools or {})
+        self._client: Any = None
+        self._host_clients: Dict[str, httpx.AsyncClient] = {}
         self._proxy = None
 
     @property
@@ -110,12 +376,46 @@ class Session:
         self._proxy = p
         self._set_client()
 
-    def _set_client(self):
-        self._client = httpx.AsyncClient(
-            proxy=self._proxy,
-            verify=_httpx_verify_value(self.verify),
-            follow_redirects=True,
-        )
+    def _new_client(self, pool: PoolConfig, cookies=None) -> httpx.AsyncClient:
+        try:
+            return httpx.AsyncClient(
+                proxy=self._proxy,
+                verify=_httpx_verify_value(self.verify),
+                follow_redirects=True,
+                limits=pool.limits,
+                http2=pool.http2,
+                cookies=cookies,
+            )
+        except ImportError as exc:
+            raise RuntimeError("HTTP/2 requires the optional http2 extra: pip install aiograpi[http2]") from exc
+
+    def _set_client(self, cookies=None):
+        # requests already running on the replaced clients get the default
+        # timeout to finish before their connections are closed
+        _aclose_later((self._client, *self._host_clients.values()), delay=DEFAULT_TIMEOUT)
+        self._client = self._new_client(self.pool, cookies)
+        self._host_clients = {}
+
+    def _client_for(self, url) -> httpx.AsyncClient:
+        if self.host_pools:
+            name = host_class(url)
+            pool = self.host_pools.get(name)
+            if pool is not None:
+                client = self._host_clients.get(name)
+                if client is None:
+                    client = self._host_clients[name] = self._new_client(pool)
+                return client
+        return self._client
+
+    def set_pools(self, pool: Optional[PoolConfig] = None, host_pools: Optional[Dict[str, PoolConfig]] = None):
+        pool = pool or PoolConfig()
+        host_pools = dict(host_pools or {})
+        if pool == self.pool and host_pools == self.host_pools:
+            return
+        self.pool = pool
+        self.host_pools = host_pools
+        if self._client is not None:
+            self._set_client(cookies=self._client.cookies)
 
     def set_verify(self, verify):
         self.verify = verify
@@ -129,18 +429,56 @@ class Session:
         await self._close()
 
     async def _close(self):
-        if self._client and self._client._state is ClientState.OPENED:
-            await self._client.__aexit__()
+        for client in (self._client, *self._host_clients.values()):
+            if client and client._state is ClientState.OPENED:
+                await client.__aexit__()
 
-    async def request(self, *args, headers=None, proxy=None, **kwargs):
+    async def request(self, method, url, headers=None, proxy=None, idempotent=None, **kwargs):
         if "timeout" not in kwargs:
             kwargs["timeout"] = DEFAULT_TIMEOUT
-        if self._client._state is ClientState.UNOPENED:
-            await self._client.__aenter__()
+        client = self._client_for(url)
+        if client._state is ClientState.UNOPENED:
+            await client.__aenter__()
         headers = self.headers | (headers or {})
         headers = {k: v for k, v in headers.items() if v is not None}
         kwargs = {k: v for k, v in kwargs.items() if v}
-        return await self._client.request(*args, headers=headers, **kwargs)
+        retry = self.retry
+        if retry is None:
+            return await client.request(method, url, headers=headers, **kwargs)
+        retry.budget.deposit()
+        attempt = 0
+        while True:
+            try:
+                response = await client.request(method, url, headers=headers, **kwargs)
+            except (*UNSENT_REQUEST_ERRORS, *SENT_REQUEST_ERRORS) as exc:
+                delay = retry.delay_for_error(method, exc, attempt, idempotent)
+                if delay is None:
+                    raise
+            else:
+                delay = retry.delay_for_response(method, response, attempt, idempotent)
+                if delay is None:
+                    return response
+                await response.aclose()
+            attempt += 1
+            headers = headers | retry.retry_headers
+            await asyncio.sleep(delay)
+
+    @asynccontextmanager
+    async def stream(self, method, url, headers=None, **kwargs):
+        """
+        Send a request without reading the body: the response is read with
+        ``aiter_bytes()`` inside the block and released when it exits.
+        """
+        if "timeout" not in kwargs:
+            kwargs["timeout"] = DEFAULT_TIMEOUT
+        client = self._client_for(url)
+        if client._state is ClientState.UNOPENED:
+            await client.__aenter__()
+        headers = self.headers | (headers or {})
+        headers = {k: v for k, v in headers.items() if v is not None}
+        kwargs = {k: v for k, v in kwargs.items() if v}
+        async with client.stream(method, url, headers=headers, **kwargs) as response:
+            yield response
 
     async def get(self, *args, **kwargs):
         return await self.request("get", *args, **kwargs)
@@ -150,8 +488,9 @@ class Session:
 
 
 class CurlResponse:
-    def __init__(self, response):
+    def __init__(self, response, exceptions=None):
         self._response = response
+        self._exceptions = exceptions
 
     def __getattr__(self, name):
         return getattr(self._response, name)
@@ -179,6 +518,15 @@ class CurlResponse:
     def json(self):
         return self._response.json()
 
+    async def aiter_bytes(self, chunk_size=None):
+        # curl decides the chunk size itself
+        errors = self._exceptions.RequestException if self._exceptions else ()
+        try:
+            async for chunk in self._response.aiter_content():
+                yield chunk
+        except errors as exc:
+            raise ReadError(str(exc)) from exc
+
     def raise_for_status(self):
         if self.status_code < 400:
             return None
@@ -188,35 +536,61 @@ class CurlResponse:
 
 
 class CurlSession:
-    def __init__(self, verify=True, impersonate="chrome136"):
+    """
+    Public session over curl-impersonate (``curl_cffi.requests.AsyncSession``).
+
+    Requests run on the event loop through curl's multi interface and reuse
+    a pool of up to ``max_clients`` curl handles, so concurrent public
+    requests do not occupy executor threads.
+    """
+
+    def __init__(self, verify=True, impersonate="chrome136", max_clients=100):
         try:
-            import requests
-            from curl_adapter import CurlCffiAdapter  # type: ignore[import-not-found, import-untyped]
+            from curl_cffi import requests as curl_requests  # type: ignore[import-not-found, import-untyped]
         except ImportError as exc:
             raise RuntimeError(
                 "curl public transport requires the optional curl extra: pip install aiograpi[curl]"
             ) from exc
 
-        self.headers = {}
+        self.headers: dict = {}
         self.verify = verify
         self.impersonate = impersonate
+        self.max_clients = max_clients
         self._proxy = None
-        self._requests = requests
-        self._client = requests.Session()
-        self._client.verify = verify
-        adapter = CurlCffiAdapter(impersonate_browser_type=impersonate)
-        self._client.mount("https://", adapter)
-        self._client.mount("http://", adapter)
+        self._curl = curl_requests
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client = self._new_client()
+
+    def _new_client(self, cookies=None):
+        client = self._curl.AsyncSession(
+            impersonate=self.impersonate,
+            verify=self.verify,
+            max_clients=self.max_clients,
+        )
+        if self._proxy:
+            client.proxies = {"http": self._proxy, "https": self._proxy}
+        if cookies is not None:
+            client.cookies.update(cookies)
+        return client
+
+    def _client_for_loop(self):
+        # curl handles are registered with the loop that first used them
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self._loop is not None:
+                self._client = self._new_client(self._client.cookies)
+            self._loop = loop
+        return self._client
 
     @property
     def cookies(self):
         return self._client.cookies
 
     def cookies_dict(self):
-        return self._requests.utils.dict_from_cookiejar(self._client.cookies)
+        return {cookie.name: cookie.value for cookie in self._client.cookies.jar}
 
     def set_cookies(self, d):
-        self._client.cookies.update(self._requests.utils.cookiejar_from_dict(d))
+        self._client.cookies.update(d)
 
     @property
     def proxy(self):
@@ -238,7 +612,8 @@ class CurlSession:
         await self._close()
 
     async def _close(self):
-        self._client.close()
+        if self._loop is asyncio.get_running_loop():
+            await self._client.close()
 
     async def request(self, method, url, headers=None, proxy=None, **kwargs):
         if "timeout" not in kwargs:
@@ -246,20 +621,32 @@ class CurlSession:
         headers = self.headers | (headers or {})
         headers = {k: v for k, v in headers.items() if v is not None}
         kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        exceptions = self._curl.exceptions
         try:
-            response = await asyncio.to_thread(
-                self._client.request,
-                method,
+            response = await self._client_for_loop().request(
+                method.upper(),
                 url,
                 headers=headers,
-                proxies={"http": proxy, "https": proxy} if proxy else None,
+                proxy=proxy or None,
                 **kwargs,
             )
-        except (self._requests.exceptions.ConnectTimeout, self._requests.exceptions.ReadTimeout) as exc:
+        except (exceptions.ConnectTimeout, exceptions.ReadTimeout) as exc:
             raise ReadError(str(exc)) from exc
-        except self._requests.exceptions.RequestException as exc:
+        except exceptions.RequestException as exc:
             raise ConnectError(str(exc)) from exc
-        return CurlResponse(response)
+        return CurlResponse(response, exceptions)
+
+    @asynccontextmanager
+    async def stream(self, method, url, **kwargs):
+        """
+        Send a request without reading the body: the response is read with
+        ``aiter_bytes()`` inside the block and released when it exits.
+        """
+        response = await self.request(method, url, stream=True, **kwargs)
+        try:
+            yield response
+        finally:
+            await response._response.aclose()
 
     async def get(self, *args, **kwargs):
         return await self.request("get", *args, **kwargs)
@@ -297,6 +684,15 @@ __all__ = [
     "CookieConflict",
     "ZstdDecoder",
     "request",
+    "stream",
+    "aclose",
+    "RequestClientPool",
+    "request_clients",
+    "HOST_CLASSES",
+    "PoolConfig",
+    "host_class",
+    "Retry",
+    "RetryBudget",
     "Session",
     "CurlSession",
 ]
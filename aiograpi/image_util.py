@@ -168,6 +168,58 @@ def is_remote(media):
     return False
 
 
+# JPEG segments removed from files passed through unchanged: EXIF/XMP
+# (APP1), Photoshop/IPTC (APP13) and comments. A re-encode drops them too.
+_JPEG_METADATA_MARKERS = (0xE1, 0xED, 0xFE)
+
+
+def _jpeg_without_metadata(data: bytes):
+    """
+    ``data`` without metadata segments, MPF index and trailing images, or
+    None when the JPEG cannot be parsed
+
+    The compressed image data is copied byte for byte.
+    """
+    if data[:2] != b"\xff\xd8":
+        return None
+    parts = [data[:2]]
+    pos, size, in_scan, scan_start = 2, len(data), False, 0
+    while pos < size:
+        if in_scan:
+            # entropy-coded data: skip stuffed 0xFF00 and restart markers
+            pos = data.find(b"\xff", pos)
+            if pos < 0 or pos + 1 >= size:
+                return None
+            if data[pos + 1] == 0 or 0xD0 <= data[pos + 1] <= 0xD7:
+                pos += 2
+                continue
+            parts.append(data[scan_start:pos])
+            in_scan = False
+            continue
+        if data[pos] != 0xFF or pos + 1 >= size:
+            return None
+        marker = data[pos + 1]
+        if marker == 0xFF:
+            pos += 1
+            continue
+        if marker == 0xD9:
+            parts.append(data[pos : pos + 2])
+            return b"".join(parts)
+        if pos + 4 > size:
+            return None
+        end = pos + 2 + int.from_bytes(data[pos + 2 : pos + 4], "big")
+        if end > size:
+            return None
+        segment = data[pos:end]
+        mpf = marker == 0xE2 and segment[4:8] == b"MPF\x00"
+        if marker not in _JPEG_METADATA_MARKERS and not mpf:
+            parts.append(segment)
+        pos = end
+        if marker == 0xDA:
+            in_scan, scan_start = True, pos
+    return None
+
+
 def prepare_image(
     img,
     max_size=(1080, 1350),
@@ -179,42 +231,76 @@ def prepare_image(
     Prepares an image file for posting.
     Defaults for size and aspect ratio from https://help.instagram.com/1469029763400082
 
+    An RGB JPEG that needs no crop or resize is returned as is, minus its
+    metadata (EXIF, XMP, IPTC, comments), without decoding it. Large
+    downscales of a JPEG decode it at 1/2, 1/4 or 1/8 scale.
+
     :param img: file path
     :param max_size: tuple of (max_width,  max_height)
     :param aspect_ratios: single float value or tuple of (min_ratio, max_ratio)
     :param save_path: optional output file path
     :param kwargs:
              - **min_size**: tuple of (min_width,  min_height)
-    :return:
+    :return: tuple of (JPEG bytes, (width, height) of the prepared image)
     """
     min_size = kwargs.pop("min_size", (320, 167))
+    data = None
     if is_remote(img):
         res = _safe_remote_get(img)
-        im = Image.open(io.BytesIO(res.content), formats=_SAFE_REMOTE_IMAGE_FORMATS)
+        data = res.content
+        im = Image.open(io.BytesIO(data), formats=_SAFE_REMOTE_IMAGE_FORMATS)
     else:
         im = Image.open(img)
 
-    if aspect_ratios:
-        crop_box = calc_crop(aspect_ratios, im.size)
+    with im:
+        crop_box = calc_crop(aspect_ratios, im.size) if aspect_ratios else None
+        cropped_size = (crop_box[2] - crop_box[0], crop_box[3] - crop_box[1]) if crop_box else im.size
+        new_size = calc_resize(max_size, cropped_size, min_size=min_size)
+
+        if im.format == "JPEG" and im.mode == "RGB" and not crop_box and not new_size and not save_path:
+            if data is None:
+                with open(img, "rb") as fp:
+                    data = fp.read()
+            passthrough = _jpeg_without_metadata(data)
+            if passthrough is not None:
+                return passthrough, im.size
+
+        if new_size and im.format == "JPEG":
+            # the decoder scales by 1/2, 1/4 or 1/8, never below the request
+            width, height = im.size
+            im.draft(
+                im.mode,
+                (
+                    -(-width * new_size[0] // cropped_size[0]),
+                    -(-height * new_size[1] // cropped_size[1]),
+                ),
+            )
+            if crop_box and im.size != (width, height):
+                scale_x, scale_y = im.size[0] / width, im.size[1] / height
+                crop_box = (
+                    int(crop_box[0] * scale_x),
+                    int(crop_box[1] * scale_y),
+                    int(crop_box[2] * scale_x),
+                    int(crop_box[3] * scale_y),
+                )
+
+        prepared = im
         if crop_box:
-            im = im.crop(crop_box)
-
-    new_size = calc_resize(max_size, im.size, min_size=min_size)
-    if new_size:
-        im = im.resize(new_size)
-
-    if im.mode != "RGB":
-        # Removes transparency (alpha)
-        im = im.convert("RGBA")
-        im2 = Image.new("RGB", im.size, (255, 255, 255))
-        im2.paste(im, (0, 0), im)
-        im = im2
-    if save_path:
-        im.save(save_path)
+            prepared = prepared.crop(crop_box)
+        if new_size:
+            prepared = prepared.resize(new_size)
+
+        if prepared.mode != "RGB":
+            # Removes transparency (alpha)
+            rgba = prepared.convert("RGBA")
+            prepared = Image.new("RGB", rgba.size, (255, 255, 255))
+            prepared.paste(rgba, (0, 0), rgba)
+        if save_path:
+            prepared.save(save_path)
 
-    b = io.BytesIO()
-    im.save(b, "JPEG")
-    return b.getvalue(), im.size
+        b = io.BytesIO()
+        prepared.save(b, "JPEG")
+        return b.getvalue(), prepared.size
 
 
 def prepare_story_image_fit(
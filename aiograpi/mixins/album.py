@@ -1,8 +1,9 @@
 import asyncio
 import time
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Union, cast
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Union, cast
 from urllib.parse import urlparse
 
 from aiograpi.exceptions import (
@@ -13,6 +14,7 @@ from aiograpi.exceptions import (
 from aiograpi.mixins.base import ClientMixin
 from aiograpi.mixins.crossposting import FbDestinationType
 from aiograpi.types import Location, Media, Track, Usertag
+from aiograpi.utils.iterators import gather_concurrent
 from aiograpi.utils.serialization import dumps
 from aiograpi.utils.timing import date_time_original
 from aiograpi.utils.upload import with_coauthor_user_ids
@@ -23,7 +25,18 @@ class DownloadAlbumMixin(ClientMixin):
     Helper class to download album
     """
 
-    async def album_download(self, media_pk: int, folder: Path = "", overwrite: bool = True) -> List[Path]:
+    async def _album_download_paths(
+        self, downloads: Sequence[Callable[[], Awaitable[Path]]], overwrite: bool, concurrency: int
+    ) -> List[Path]:
+        # With overwrite=True every finished slide was written by this call, so a
+        # failed album removes them; with overwrite=False they are kept and a
+        # retry picks up where it stopped.
+        discard = (lambda path: Path(path).unlink(missing_ok=True)) if overwrite else None
+        return await gather_concurrent(downloads, concurrency, discard)
+
+    async def album_download(
+        self, media_pk: int, folder: Path = "", overwrite: bool = True, concurrency: int = 4
+    ) -> List[Path]:
         """
         Download your album
 
@@ -36,40 +49,36 @@ class DownloadAlbumMixin(ClientMixin):
             and will download the files to working directory.
         overwrite: bool, optional
             Whether to overwrite existing files. When False, existing files are returned as-is and not downloaded again.
+        concurrency: int, optional
+            Maximum number of slides downloaded at once, default 4
 
         Returns
         -------
         List[Path]
-            List of path for all the files downloaded
+            List of path for all the files downloaded, in resource order. When a
+            slide fails, the files already downloaded are removed (kept with
+            overwrite=False) and the error is raised.
         """
         media = await self.media_info(media_pk)
         assert media.media_type == 8, "Must been album"
-        paths = []
+        downloads = []
         for resource in media.resources:
             filename = f"{media.user.username}_{resource.pk}"
             if resource.media_type == 1:
-                paths.append(
-                    await self.photo_download_by_url(
-                        resource.thumbnail_url,
-                        filename,
-                        folder,
-                        overwrite=overwrite,
-                    )
+                downloads.append(
+                    partial(self.photo_download_by_url, resource.thumbnail_url, filename, folder, overwrite=overwrite)
                 )
             elif resource.media_type == 2:
-                paths.append(
-                    await self.video_download_by_url(
-                        resource.video_url,
-                        filename,
-                        folder,
-                        overwrite=overwrite,
-                    )
+                downloads.append(
+                    partial(self.video_download_by_url, resource.video_url, filename, folder, overwrite=overwrite)
                 )
             else:
-                raise AlbumNotDownload('Media type "{resource.media_type}" unknown for album (resource={resource.pk})')
-        return paths
+                raise AlbumNotDownload(f'Media type "{resource.media_type}" unknown for album (resource={resource.pk})')
+        return await self._album_download_paths(downloads, overwrite, concurrency)
 
-    async def album_download_by_urls(self, urls: List[str], folder: Path = "", overwrite: bool = True) -> List[Path]:
+    async def album_download_by_urls(
+        self, urls: List[str], folder: Path = "", overwrite: bool = True, concurrency: int = 4
+    ) -> List[Path]:
         """
         Download your album using specified URLs
 
@@ -82,24 +91,28 @@ class DownloadAlbumMixin(ClientMixin):
             and will download the files to working directory.
         overwrite: bool, optional
             Whether to overwrite existing files. When False, existing files are returned as-is and not downloaded again.
+        concurrency: int, optional
+            Maximum number of files downloaded at once, default 4
 
         Returns
         -------
         List[Path]
-            List of path for all the files downloaded
+            List of path for all the files downloaded, in URL order. When a
+            download fails, the files already downloaded are removed (kept with
+            overwrite=False) and the error is raised.
         """
-        paths = []
+        downloads = []
         for url in urls:
             file_name = urlparse(url).path.rsplit("/", 1)[1]
             if file_name.lower().endswith((".jpg", ".jpeg")):
-                paths.append(await self.photo_download_by_url(url, file_name, folder, overwrite=overwrite))
+                downloads.append(partial(self.photo_download_by_url, url, file_name, folder, overwrite=overwrite))
             elif file_name.lower().endswith(".mp4"):
-                paths.append(await self.video_download_by_url(url, file_name, folder, overwrite=overwrite))
+                downloads.append(partial(self.video_download_by_url, url, file_name, folder, overwrite=overwrite))
             else:
                 raise AlbumUnknownFormat()
-        return paths
+        return await self._album_download_paths(downloads, overwrite, concurrency)
 
-    async def album_download_origin(self, media_pk: int) -> List[bytes]:
+    async def album_download_origin(self, media_pk: int, concurrency: int = 4) -> List[bytes]:
         """
         Download your album
 
@@ -107,25 +120,61 @@ class DownloadAlbumMixin(ClientMixin):
         ----------
         media_pk: int
             PK for the album you want to download
+        concurrency: int, optional
+            Maximum number of slides downloaded at once, default 4
+
         Returns
         -------
-        List[Path]
-            List of path for all the files downloaded
+        List[bytes]
+            Content of all the files downloaded, in resource order
         """
         media = await self.media_info(media_pk)
         assert media.media_type == 8, "Must been album"
-        files = []
+        downloads = []
         for resource in media.resources:
             if resource.media_type == 1:
-                files.append(await self.photo_download_by_url_origin(resource.thumbnail_url))
+                downloads.append(partial(self.photo_download_by_url_origin, resource.thumbnail_url))
             elif resource.media_type == 2:
-                files.append(await self.video_download_by_url_origin(resource.video_url))
+                downloads.append(partial(self.video_download_by_url_origin, resource.video_url))
             else:
-                raise AlbumNotDownload('Media type "{resource.media_type}" unknown for album (resource={resource.pk})')
-        return files
+                raise AlbumNotDownload(f'Media type "{resource.media_type}" unknown for album (resource={resource.pk})')
+        return await gather_concurrent(downloads, concurrency)
 
 
 class UploadAlbumMixin(ClientMixin):
+    async def _album_upload_child(self, path: Path, upload_id: str) -> Dict:
+        """Upload one carousel item and return its ``children_metadata`` entry"""
+        if path.suffix.lower() == ".mp4":
+            upload_id, width, height, duration, thumbnail = await self.video_rupload(
+                path, to_album=True, upload_id=upload_id
+            )
+            await self.photo_rupload(thumbnail, upload_id)
+            return {
+                "upload_id": upload_id,
+                "clips": dumps([{"length": duration, "source_type": "4"}]),
+                "extra": dumps({"source_width": width, "source_height": height}),
+                "length": duration,
+                "poster_frame_index": "0",
+                "filter_type": "0",
+                "video_result": "",
+                "date_time_original": date_time_original(time.localtime()),
+                "audio_muted": "false",
+            }
+        upload_id, width, height = await self.photo_rupload(path, upload_id=upload_id, to_album=True)
+        return {
+            "upload_id": upload_id,
+            "edits": dumps(
+                {
+                    "crop_original_size": [width, height],
+                    "crop_center": [0.0, -0.0],
+                    "crop_zoom": 1.0,
+                }
+            ),
+            "extra": dumps({"source_width": width, "source_height": height}),
+            "scene_capture_type": "",
+            "scene_type": None,
+        }
+
     async def album_upload(
         self,
         paths: List[Path],
@@ -146,6 +195,7 @@ class UploadAlbumMixin(ClientMixin):
         fb_validation_bypass: Optional[List[str]] = None,
         threads_destination_id: Optional[str] = None,
         threads_validation_bypass: Optional[List[str]] = None,
+        concurrency: int = 3,
     ) -> Media:
         """
         Upload album to feed
@@ -189,6 +239,9 @@ class UploadAlbumMixin(ClientMixin):
             Explicit Threads profile id.
         threads_validation_bypass: List[str], optional
             Android Threads cross-post validation bypass reasons.
+        concurrency: int, optional
+            Maximum number of items uploaded at once, default 3. The first
+            failed item cancels the others.
 
         Returns
         -------
@@ -197,6 +250,10 @@ class UploadAlbumMixin(ClientMixin):
         """
         if not paths:
             raise AlbumUnknownFormat("Album upload requires at least one media path.")
+        paths = [Path(path) for path in paths]
+        for path in paths:
+            if path.suffix.lower() not in (".jpg", ".jpeg", ".png", ".webp", ".mp4"):
+                raise AlbumUnknownFormat(f'Unsupported album media format "{path.suffix}" for "{path.name}".')
         extra_data = with_coauthor_user_ids(extra_data, coauthor_user_ids)
         extra_data = self._scheduled_extra_data(extra_data, schedule_at)
         extra_data = await self._media_crossposting_extra_data(
@@ -209,50 +266,12 @@ class UploadAlbumMixin(ClientMixin):
             threads_destination_id=threads_destination_id,
             threads_validation_bypass=threads_validation_bypass,
         )
-        children = []
-        for path in paths:
-            path = Path(path)
-            if path.suffix.lower() in (".jpg", ".jpeg", ".png", ".webp"):
-                upload_id, width, height = await self.photo_rupload(path, to_album=True)
-                children.append(
-                    {
-                        "upload_id": upload_id,
-                        "edits": dumps(
-                            {
-                                "crop_original_size": [width, height],
-                                "crop_center": [0.0, -0.0],
-                                "crop_zoom": 1.0,
-                            }
-                        ),
-                        "extra": dumps({"source_width": width, "source_height": height}),
-                        "scene_capture_type": "",
-                        "scene_type": None,
-                    }
-                )
-            elif path.suffix.lower() == ".mp4":
-                (
-                    upload_id,
-                    width,
-                    height,
-                    duration,
-                    thumbnail,
-                ) = await self.video_rupload(path, to_album=True)
-                children.append(
-                    {
-                        "upload_id": upload_id,
-                        "clips": dumps([{"length": duration, "source_type": "4"}]),
-                        "extra": dumps({"source_width": width, "source_height": height}),
-                        "length": duration,
-                        "poster_frame_index": "0",
-                        "filter_type": "0",
-                        "video_result": "",
-                        "date_time_original": date_time_original(time.localtime()),
-                        "audio_muted": "false",
-                    }
-                )
-                await self.photo_rupload(thumbnail, upload_id)
-            else:
-                raise AlbumUnknownFormat(f'Unsupported album media format "{path.suffix}" for "{path.name}".')
+        # children uploaded at once need distinct upload ids
+        first_upload_id = int(time.time() * 1000)
+        uploads = [
+            partial(self._album_upload_child, path, str(first_upload_id + index)) for index, path in enumerate(paths)
+        ]
+        children = await gather_concurrent(uploads, concurrency)
 
         for attempt in range(50):
             self.logger.debug(f"Attempt #{attempt} to configure Album: {paths}")
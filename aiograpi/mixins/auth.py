@@ -15,7 +15,7 @@ from uuid import uuid4
 
 from pydantic import ValidationError
 
-from aiograpi import config
+from aiograpi import config, httpx_ext
 from aiograpi.exceptions import (
     BadCredentials,
     BadPassword,
@@ -425,6 +425,8 @@ class PostLoginFlowMixin(ClientMixin):
 
 
 class LoginMixin(PreLoginFlowMixin, PostLoginFlowMixin):
+    http2 = False
+    pool_limits: Dict[str, Dict[str, Any]] = {}
     username = None
     password = None
     authorization_data = {}  # decoded authorization header
@@ -449,8 +451,8 @@ class LoginMixin(PreLoginFlowMixin, PostLoginFlowMixin):
     public_request_retries_count = 3
     public_request_retries_timeout = 2
     session_retry_total = 3
-    session_retry_backoff_factor = 2
-    session_retry_statuses = [429, 500, 502, 503, 504]
+    session_retry_backoff_factor = 0.5
+    session_retry_statuses = [500, 502, 503, 504]
     # Example: CLN,49897488153,1666640702:01f7bdb93090f4f773516fc2cf1424178a58a2295b4c754090ba02cb0a834e2d1f731e20
     ig_u_rur = ""
     ig_www_claim = ""  # e.g. hmac.AR2uidim8es5kYgDiNxY0UG_ZhffFFSt8TGCV5eA1VYYsMNx
@@ -633,6 +635,10 @@ class LoginMixin(PreLoginFlowMixin, PostLoginFlowMixin):
         country = self.settings.get("country", self.country)
         country_code = self.settings.get("country_code", self.country_code)
         self.set_tls_verify(self.settings.get("tls_verify", self.tls_verify))
+        self.set_pool_config(
+            http2=self.settings.get("http2", self.http2),
+            pool_limits=self.settings.get("pool_limits", self.pool_limits),
+        )
         self.set_retry_config(
             request_timeout=self.settings.get("request_timeout", self.request_timeout),
             public_request_retries_count=self.settings.get(
@@ -989,6 +995,8 @@ class LoginMixin(PreLoginFlowMixin, PostLoginFlowMixin):
             "public_transport": self.public_transport,
             "public_transport_impersonate": self.public_transport_impersonate,
             "tls_verify": self.tls_verify,
+            "http2": self.http2,
+            "pool_limits": self.pool_limits,
         }
         usdid_settings = self.get_usdid_settings()
         if usdid_settings:
@@ -1062,6 +1070,51 @@ class LoginMixin(PreLoginFlowMixin, PostLoginFlowMixin):
             self.settings["tls_verify"] = tls_verify
         return True
 
+    def pool_config(self, name: str) -> httpx_ext.PoolConfig:
+        return httpx_ext.PoolConfig.from_settings(self.pool_limits, name, self.http2)
+
+    def set_pool_config(
+        self,
+        http2: Optional[bool] = None,
+        pool_limits: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> bool:
+        """
+        Configure HTTP/2 and the connection pools of the sessions
+
+        Parameters
+        ----------
+        http2: bool, optional
+            Multiplex requests over HTTP/2 (needs ``aiograpi[http2]``)
+        pool_limits: Dict, optional
+            Pool options per host class ("api", "graphql", "cdn"), e.g.
+            ``{"cdn": {"max_connections": 8, "keepalive_expiry": 30}}``;
+            keys are the ``httpx_ext.PoolConfig`` fields
+
+        Returns
+        -------
+        bool
+            A boolean value
+        """
+        if pool_limits is not None:
+            unknown = set(pool_limits) - set(httpx_ext.HOST_CLASSES)
+            if unknown:
+                raise ValueError(f"pool_limits host classes must be one of {httpx_ext.HOST_CLASSES}: {sorted(unknown)}")
+            self.pool_limits = {name: dict(options) for name, options in pool_limits.items()}
+        if http2 is not None:
+            self.http2 = bool(http2)
+        cdn_pools = {"cdn": self.pool_config("cdn")}
+        for name, pool, host_pools in (
+            ("private", self.pool_config("api"), cdn_pools),
+            ("graphql", self.pool_config("graphql"), None),
+            ("public", self.pool_config("graphql"), cdn_pools),
+        ):
+            session: Any = getattr(self, name, None)
+            if hasattr(session, "set_pools"):
+                session.set_pools(pool, host_pools)
+        if self.settings is not None:
+            self.settings.update({"http2": self.http2, "pool_limits": self.pool_limits})
+        return True
+
     def set_retry_config(
         self,
         request_timeout: Union[int, float, None] = None,
@@ -1096,9 +1149,7 @@ class LoginMixin(PreLoginFlowMixin, PostLoginFlowMixin):
             self.public.headers["User-Agent"] = self.public_user_agent
             self._configure_public_transport()
 
-        # aiograpi divergence: httpx_ext.Session does not expose
-        # urllib3-style HTTPAdapter retries. Config values are stored for
-        # API parity / introspection; retry logic lives at the call site.
+        self.configure_private_retry()
 
         if self.settings is not None:
             self.settings.update(
@@ -18,6 +18,7 @@ if TYPE_CHECKING:
         attestation_key_nonce: str
         authorization_data: Dict[str, Any]
         bloks_versioning_id: str
+        cache: Any
         caa_aac: str
         caa_waterfall_id: str
         challenge_code_handler: Any
@@ -31,17 +32,21 @@ if TYPE_CHECKING:
         email: Optional[str]
         graphql: Any
         handle_exception: Any
+        http2: bool
+        image_executor: Any
         ig_u_rur: Optional[str]
         ig_www_claim: Optional[str]
         last_json: Dict[str, Any]
         last_response: Any
         locale: str
         logger: Any
+        media_cache: Any
         mid: str
         num_retry: int
         password: str
         phone_id: str
         phone_number: Optional[str]
+        pool_limits: Dict[str, Dict[str, Any]]
         private: Any
         private_requests_count: int
         public: Any
@@ -50,6 +55,7 @@ if TYPE_CHECKING:
         public_transport_impersonate: str
         push_disabled: bool
         public_user_agent: str
+        rate_limiter: Any
         read_timeout: int
         request_id: str
         request_timeout: int
@@ -58,6 +64,7 @@ if TYPE_CHECKING:
         timezone_offset: int
         tray_session_id: str
         tls_verify: Any
+        upload_state: Any
         user_agent: str
         username: str
         uuid: str
@@ -102,6 +109,10 @@ if TYPE_CHECKING:
 
         def private_headers(self, headers: Optional[Dict[str, Any]] = None) -> Dict[str, Any]: ...
 
+        def configure_private_retry(self) -> bool: ...
+
+        def pool_config(self, name: str) -> Any: ...
+
         async def _current_media_ids(self, *args: Any, **kwargs: Any) -> Any: ...
 
         async def _extract_configured_media_or_recent(self, *args: Any, **kwargs: Any) -> Any: ...
@@ -122,6 +133,16 @@ if TYPE_CHECKING:
 
         async def _upload_story_with_music(self, *args: Any, **kwargs: Any) -> Any: ...
 
+        async def _prepare_image_job(self, *args: Any, **kwargs: Any) -> Any: ...
+
+        def _rupload_resume(self, *args: Any, **kwargs: Any) -> Any: ...
+
+        async def _rupload(self, *args: Any, **kwargs: Any) -> Any: ...
+
+        def _rupload_segmented(self, size: int) -> bool: ...
+
+        async def _rupload_segments(self, *args: Any, **kwargs: Any) -> Any: ...
+
         def _track_highlight_start(self, *args: Any, **kwargs: Any) -> int: ...
 
         def _track_value(self, *args: Any, **kwargs: Any) -> Any: ...
@@ -216,7 +237,9 @@ if TYPE_CHECKING:
 
         def _download_response_bytes(self, *args: Any, **kwargs: Any) -> bytes: ...
 
-        def _download_response_to_path(self, *args: Any, **kwargs: Any) -> Any: ...
+        async def _download_response_to_path(self, *args: Any, **kwargs: Any) -> Any: ...
+
+        async def _download_to_path(self, *args: Any, **kwargs: Any) -> Any: ...
 
         def _normalize_public_transport(self, *args: Any, **kwargs: Any) -> str: ...
 
@@ -0,0 +1,84 @@
+from typing import Dict, Optional
+
+from aiograpi.cache import CacheStats, ClientCache
+from aiograpi.mixins.base import ClientMixin
+
+# client attribute -> ClientCache entry name
+CACHE_ATTRIBUTES = {
+    "_users_cache": "users",
+    "_userhorts_cache": "user_shorts",
+    "_usernames_cache": "usernames",
+    "_users_following": "user_following",
+    "_users_followers": "user_followers",
+    "_medias_cache": "medias",
+    "_stories_cache": "stories",
+}
+
+
+class CacheMixin(ClientMixin):
+    """
+    Per-client object caches
+    """
+
+    cache: ClientCache
+
+    def __init__(self, *args, **kwargs):
+        cache: Optional[ClientCache] = kwargs.pop("cache", None)
+        if cache is None:
+            cache = ClientCache(
+                max_entries=kwargs.pop("cache_max_entries", None),
+                max_bytes=kwargs.pop("cache_max_bytes", None),
+                ttl=kwargs.pop("cache_ttl", None),
+            )
+        self.set_cache(cache)
+        super().__init__(*args, **kwargs)
+
+    def set_cache(self, cache: ClientCache) -> bool:
+        """
+        Attach a cache (e.g. one shared between several clients)
+
+        Parameters
+        ----------
+        cache: ClientCache
+            Cache to read and populate from now on
+
+        Returns
+        -------
+        bool
+            A boolean value
+        """
+        self.cache = cache
+        for attribute, name in CACHE_ATTRIBUTES.items():
+            setattr(self, attribute, cache[name])
+        return True
+
+    def cache_clear(self, *names: str) -> bool:
+        """
+        Drop cached users, medias, stories and follow lists
+
+        Parameters
+        ----------
+        names: str, optional
+            Cache names to clear (e.g. "users", "medias"), default is all
+
+        Returns
+        -------
+        bool
+            A boolean value
+        """
+        self.cache.clear(*names)
+        for attribute, name in CACHE_ATTRIBUTES.items():
+            if not names or name in names:
+                getattr(self, attribute).clear()
+        return True
+
+    def cache_stats(self) -> Dict[str, CacheStats]:
+        """
+        Get hit/miss/eviction counters for every cache
+
+        Returns
+        -------
+        Dict[str, CacheStats]
+            Cache name -> counters
+        """
+        return self.cache.stats()
@@ -14,6 +14,7 @@ from aiograpi.mixins.base import ClientMixin
 from aiograpi.mixins.track import MUSIC_PRODUCT
 from aiograpi.types import Location, Media, Track, Usertag
 from aiograpi.utils.timing import date_time_original
+from aiograpi.utils.upload import FileBody, RuploadState
 from aiograpi.utils.video import MOVIEPY_2_INSTALL_MESSAGE, analyze_video_for_upload
 
 try:
@@ -214,7 +215,9 @@ class DownloadClipMixin(ClientMixin):
         """
         return await self.video_download(media_pk, folder)
 
-    async def clip_download_by_url(self, url: str, filename: str = "", folder: Path = "") -> str:
+    async def clip_download_by_url(
+        self, url: str, filename: str = "", folder: Path = "", resume: bool = False, segments: int = 1
+    ) -> str:
         """
         Download CLIP video using URL
 
@@ -226,12 +229,16 @@ class DownloadClipMixin(ClientMixin):
             Directory in which you want to download the album,
             default is "" and will download the files to working
             directory.
+        resume: bool, optional
+            Continue a failed download from its ".part" file, default False
+        segments: int, optional
+            Number of ranged segments to download concurrently, default 1
 
         Returns
         -------
         str
         """
-        return await self.video_download_by_url(url, filename, folder)
+        return await self.video_download_by_url(url, filename, folder, resume=resume, segments=segments)
 
 
 class UploadClipMixin(ClientMixin):
@@ -809,9 +816,7 @@ class UploadClipMixin(ClientMixin):
             thumbnail = Path(thumbnail)
         upload_id = str(int(time.time() * 1000))
         thumbnail, width, height, duration = analyze_video(path, thumbnail)
-        with open(path, "rb") as fp:
-            clip_data = fp.read()
-            clip_len = str(len(clip_data))
+        clip_len = str(path.stat().st_size)
         feed_show = _clip_feed_show_value(show_preview_in_feed, feed_show)
         configure_extra_data = dict(extra_data or {})
         if share_to_facebook:
@@ -855,6 +860,11 @@ class UploadClipMixin(ClientMixin):
             length=clip_len,
             timestamp=upload_timestamp_ms,
         )
+        state = self._rupload_resume(
+            path, "clip", RuploadState(upload_id, upload_name, f"{composer_session_id}_{asset_id}_Mixed_0")
+        )
+        upload_id, upload_name = state.upload_id, state.upload_name
+        composer_session_id, asset_id = state.waterfall_id.split("_")[:2]
         upload_settings = {
             "composer_session_id": composer_session_id,
             "upload_setting_properties": {
@@ -948,29 +958,38 @@ class UploadClipMixin(ClientMixin):
                 "Segment-Type": "3",
             }
         )
-        response = await self.private.get(
-            "https://{domain}/rupload_igvideo/{name}".format(domain=config.API_DOMAIN, name=upload_name),
-            headers=headers,
-        )
-        self.request_log(response)
-        if response.status_code != 200:
-            self._raise_clip_upload_error(response, "rupload_init")
-        headers = {
-            "Offset": "0",
-            "X-Entity-Name": upload_name,
-            "X-Entity-Length": clip_len,
-            "Content-Type": "application/octet-stream",
-            "Content-Length": clip_len,
-            **headers,
-        }
-        response = await self.private.post(
-            "https://{domain}/rupload_igvideo/{name}".format(domain=config.API_DOMAIN, name=upload_name),
-            data=clip_data,
-            headers=headers,
-        )
-        self.request_log(response)
-        if response.status_code != 200:
-            self._raise_clip_upload_error(response, "rupload_upload")
+        url = "https://{domain}/rupload_igvideo/{name}".format(domain=config.API_DOMAIN, name=upload_name)
+
+        def check(response, stage: str):
+            self.request_log(response)
+            if response.status_code != 200:
+                self._raise_clip_upload_error(response, stage)
+
+        async def init():
+            response = await self.private.get(url, headers=headers)
+            check(response, "rupload_init")
+            return response
+
+        async def upload(offset: int):
+            response = await self.private.post(
+                url,
+                content=FileBody(path, offset),
+                headers={
+                    "Offset": str(offset),
+                    "X-Entity-Name": upload_name,
+                    "X-Entity-Length": clip_len,
+                    "Content-Type": "application/octet-stream",
+                    "Content-Length": str(int(clip_len) - offset),
+                    **headers,
+                },
+            )
+            check(response, "rupload_upload")
+            return response
+
+        if self._rupload_segmented(int(clip_len)):
+            await self._rupload_segments(path, "clip", state, url, headers, check)
+        else:
+            await self._rupload(path, "clip", state, init, upload)
         # CONFIGURE
         # self.igtv_composer_session_id = self.generate_uuid()  #issue
         for attempt in range(50):
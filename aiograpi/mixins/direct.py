@@ -30,6 +30,7 @@ from aiograpi.types import (
     UserShort,
 )
 from aiograpi.utils.serialization import dumps
+from aiograpi.utils.upload import FileBody, RuploadState
 from aiograpi.utils.video import read_video_metadata, read_video_metadata_with_moviepy
 
 SELECTED_FILTERS = ("flagged", "unread")
@@ -827,7 +828,7 @@ class DirectMixin(ClientMixin):
         valid_extensions = {".jpg", ".jpeg", ".png", ".webp"}
         if path.suffix.lower() not in valid_extensions:
             raise ValueError("Invalid file format. Only JPG/JPEG/PNG/WEBP files are supported.")
-        photo_bytes, _ = prepare_image(str(path), max_side=1080)
+        photo_bytes, _ = await self._prepare_image_job(prepare_image, str(path), max_side=1080)
 
         entity_name = f"fb_uploader_{int(time.time() * 1000)}"
         media_id = await self._photo_rupload(photo_bytes, entity_name)
@@ -920,8 +921,7 @@ class DirectMixin(ClientMixin):
             thread_ids = [await self._direct_thread_id_from_user_ids(user_ids, "video")]
 
         path = Path(path)
-        video_bytes = path.read_bytes()
-        size = len(video_bytes)
+        size = path.stat().st_size
         width, height, duration_sec = self._direct_video_metadata(path)
 
         hex_id = secrets.token_hex(16)
@@ -929,7 +929,7 @@ class DirectMixin(ClientMixin):
         entity = f"{hex_id}-0-{size}-{ms}-{ms}"
         upload_id = str(random.randint(10**11, 10**12 - 1))
         waterfall_id = f"{upload_id}_{hex_id[:12].upper()}_Mixed_0"
-        media_id = await self._video_rupload(video_bytes, entity, waterfall_id)
+        media_id = await self._video_rupload(path, entity, waterfall_id)
 
         token = self.generate_mutation_token()
         composition_id = str(uuid.uuid4())
@@ -1000,7 +1000,7 @@ class DirectMixin(ClientMixin):
         bearer = self.private.headers.get("Authorization") or self.authorization
         user_id = str(self.user_id)
         rur = self.private.headers.get("IG-U-RUR", "")
-        mid = self.private.headers.get("X-MID", "")
+        mid = self.mid or self.private.headers.get("X-MID", "")
         headers = {
             "authorization": bearer,
             "ig-intended-user-id": user_id,
@@ -1061,9 +1061,13 @@ class DirectMixin(ClientMixin):
         except Exception as exc:
             raise ClientError(f"messenger_image response missing media_id: {response.text[:300]}") from exc
 
-    async def _video_rupload(self, video_bytes: bytes, entity_name: str, waterfall_id: str) -> int:
-        """Upload mp4 bytes to ``rupload.facebook.com/messenger_video/...``."""
-        url = f"https://rupload.facebook.com/messenger_video/{entity_name}"
+    async def _video_rupload(self, path: Path, entity_name: str, waterfall_id: str) -> int:
+        """Upload an mp4 file to ``rupload.facebook.com/messenger_video/...``, resuming from the server's offset."""
+        size = path.stat().st_size
+        state = self._rupload_resume(
+            path, "direct_video", RuploadState(waterfall_id.split("_")[0], entity_name, waterfall_id)
+        )
+        url = f"https://rupload.facebook.com/messenger_video/{state.upload_name}"
         headers = self._messenger_rupload_headers(
             {
                 "video_type": "FILE_ATTACHMENT",
@@ -1071,45 +1075,50 @@ class DirectMixin(ClientMixin):
                 "segment-type": "3",
                 "ephemeral_media_view_mode": "2",
                 "ig_raven_metadata": "{}",
-                "x_fb_video_waterfall_id": waterfall_id,
+                "x_fb_video_waterfall_id": state.waterfall_id,
             }
         )
         proxy = self.private.proxy
-        response = await httpx_ext.request(
-            "GET",
-            url,
-            headers=headers,
-            proxy=proxy,
-            verify=self.tls_verify,
-            timeout=30,
-        )
-        if response.status_code != 200:
-            raise ClientError(f"messenger_video offset GET failed: {response.status_code} {response.text[:300]}")
-        try:
-            offset = int(response.json().get("offset", 0))
-        except Exception:
-            offset = 0
-        post_headers = dict(headers)
-        post_headers.update(
-            {
-                "content-type": "application/octet-stream",
-                "offset": str(offset),
-                "x-entity-length": str(len(video_bytes)),
-                "x-entity-name": entity_name,
-                "x-entity-type": "video/mp4",
-            }
-        )
-        response = await httpx_ext.request(
-            "POST",
-            url,
-            data=video_bytes[offset:],
-            headers=post_headers,
-            proxy=proxy,
-            verify=self.tls_verify,
-            timeout=300,
-        )
-        if response.status_code != 200:
-            raise ClientError(f"messenger_video upload POST failed: {response.status_code} {response.text[:300]}")
+
+        async def init():
+            response = await httpx_ext.request(
+                "GET",
+                url,
+                headers=headers,
+                proxy=proxy,
+                verify=self.tls_verify,
+                timeout=30,
+            )
+            if response.status_code != 200:
+                raise ClientError(f"messenger_video offset GET failed: {response.status_code} {response.text[:300]}")
+            return response
+
+        async def upload(offset: int):
+            post_headers = dict(headers)
+            post_headers.update(
+                {
+                    "content-type": "application/octet-stream",
+                    "content-length": str(size - offset),
+                    "offset": str(offset),
+                    "x-entity-length": str(size),
+                    "x-entity-name": state.upload_name,
+                    "x-entity-type": "video/mp4",
+                }
+            )
+            response = await httpx_ext.request(
+                "POST",
+                url,
+                content=FileBody(path, offset),
+                headers=post_headers,
+                proxy=proxy,
+                verify=self.tls_verify,
+                timeout=300,
+            )
+            if response.status_code != 200:
+                raise ClientError(f"messenger_video upload POST failed: {response.status_code} {response.text[:300]}")
+            return response
+
+        response = await self._rupload(path, "direct_video", state, init, upload)
         try:
             return int(response.json()["media_id"])
         except Exception as exc:
@@ -0,0 +1,58 @@
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+from aiograpi import httpx_ext
+from aiograpi.download import DownloadManager, DownloadResult, DownloadStats
+from aiograpi.mixins.base import ClientMixin
+
+
+class DownloadManagerMixin(ClientMixin):
+    """
+    Bulk downloads through a DownloadManager
+    """
+
+    def download_manager(
+        self,
+        folder: Union[str, Path] = "",
+        concurrency: int = 16,
+        per_host: int = 6,
+        retry: Optional[httpx_ext.Retry] = None,
+        overwrite: bool = False,
+        resume: bool = False,
+        on_progress: Optional[Callable[[DownloadResult, DownloadStats], Any]] = None,
+    ) -> DownloadManager:
+        """
+        Create a download manager that downloads through this client
+
+        Parameters
+        ----------
+        folder: Path, optional
+            Directory for the files, default is "" (working directory)
+        concurrency: int, optional
+            Maximum number of files downloaded at once, default 16
+        per_host: int, optional
+            Maximum number of files downloaded at once from one host, default 6
+        retry: httpx_ext.Retry, optional
+            Retry policy for transient CDN errors, default ``httpx_ext.Retry()``
+        overwrite: bool, optional
+            Download files that already exist in ``folder`` again, default False
+        resume: bool, optional
+            Continue interrupted downloads from their ".part" file, default False
+        on_progress: Callable, optional
+            Called with ``(result, stats)`` after every file
+
+        Returns
+        -------
+        DownloadManager
+            Manager whose ``download(items)`` streams a DownloadResult per file
+        """
+        return DownloadManager(
+            self,
+            folder=folder,
+            concurrency=concurrency,
+            per_host=per_host,
+            retry=retry,
+            overwrite=overwrite,
+            resume=resume,
+            on_progress=on_progress,
+        )
@@ -33,6 +33,8 @@ from aiograpi.exceptions import (
     UserNotFound,
 )
 from aiograpi.mixins.base import ClientMixin
+from aiograpi.ratelimit import THROTTLE_EXCEPTIONS
+from aiograpi.utils.context import TaskLocal
 from aiograpi.utils.logging import truncate_log_text
 from aiograpi.utils.timing import random_delay
 
@@ -78,12 +80,12 @@ GQL_STUFF = {
 class GraphQLRequestMixin(ClientMixin):
     _fb_dtsg = None
     graphql_requests_count = 0
-    last_graphql_response = None
-    last_graphql_json = {}
+    last_graphql_response = TaskLocal(None)
+    last_graphql_json = TaskLocal({})
     request_logger = logging.getLogger("graphql_request")
 
     def __init__(self, *args, **kwargs):
-        self.graphql = httpx_ext.Session(verify=getattr(self, "tls_verify", True))
+        self.graphql = httpx_ext.Session(verify=getattr(self, "tls_verify", True), pool=self.pool_config("graphql"))
         self.graphql.headers.update(
             {
                 "Connection": "Keep-Alive",
@@ -263,15 +265,13 @@ class GraphQLRequestMixin(ClientMixin):
     async def _send_graphql_request(self, data=None, params=None, headers=None, return_json=False):
         self.last_graphql_response = None
         self.graphql_requests_count += 1
-        if headers:
-            self.graphql.headers.update(headers)
         if self.last_response_ts and (time.time() - self.last_response_ts) < 1.0:
             await asyncio.sleep(1.0)
         try:
             if data is not None:
-                response = await self.graphql.post(GRAPHQL_API_URL, data=data, params=params)
+                response = await self.graphql.post(GRAPHQL_API_URL, data=data, params=params, headers=headers)
             else:
-                response = await self.graphql.get(GRAPHQL_API_URL, params=params)
+                response = await self.graphql.get(GRAPHQL_API_URL, params=params, headers=headers)
             self.request_logger.debug("graphql_request %s: %s", response.status_code, response.url)
             self.request_logger.info(
                 "GraphQL: [%s] [%s] %s %s",
@@ -419,16 +419,25 @@ class GraphQLRequestMixin(ClientMixin):
         merged["Host"] = domain
         if self.authorization:
             merged.setdefault("Authorization", self.authorization)
-        if self.request_timeout:
-            await asyncio.sleep(self.request_timeout)
+        await self.rate_limiter.acquire("graphql_www")
         url = f"https://{domain}/graphql_www"
+        error = None
+        try:
+            return await self._graphql_www_attempt(url, data, merged)
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            self.rate_limiter.record_response("graphql_www", throttled=isinstance(error, THROTTLE_EXCEPTIONS))
+
+    async def _graphql_www_attempt(self, url: str, data: dict, headers: dict) -> dict:
         response = None
         try:
             self.private_requests_count += 1
             response = await self.private.post(
                 url,
                 data=data,
-                headers=merged,
+                headers=headers,
                 timeout=self.read_timeout,
             )
             self.request_log(response)
@@ -11,6 +11,7 @@ from aiograpi.exceptions import ClientError, IGTVConfigureError, IGTVNotUpload
 from aiograpi.mixins.base import ClientMixin
 from aiograpi.types import Location, Media, Usertag
 from aiograpi.utils.timing import date_time_original
+from aiograpi.utils.upload import FileBody, RuploadState
 from aiograpi.utils.video import analyze_video_for_upload
 
 try:
@@ -112,6 +113,8 @@ class UploadIGTVMixin(ClientMixin):
         waterfall_id = str(uuid4())
         # upload_name example: '1576102477530_0_7823256191'
         upload_name = "{upload_id}_0_{rand}".format(upload_id=upload_id, rand=random.randint(1000000000, 9999999999))
+        state = self._rupload_resume(path, "igtv", RuploadState(upload_id, upload_name, waterfall_id))
+        upload_id, upload_name, waterfall_id = state.upload_id, state.upload_name, state.waterfall_id
         # by segments bb2c1d0c127384453a2122e79e4c9a85-0-6498763
         # upload_name = "{hash}-0-{rand}".format(
         #     hash="bb2c1d0c127384453a2122e79e4c9a85", rand=random.randint(1111111, 9999999)
@@ -132,32 +135,29 @@ class UploadIGTVMixin(ClientMixin):
             "X_FB_VIDEO_WATERFALL_ID": waterfall_id,
             "X-Entity-Type": "video/mp4",
         }
-        response = await self.private.get(
-            "https://{domain}/rupload_igvideo/{name}".format(domain=config.API_DOMAIN, name=upload_name),
-            headers=headers,
-        )
-        self.request_log(response)
-        if response.status_code != 200:
-            raise IGTVNotUpload(response=self.last_response, **self.last_json)
-        with open(path, "rb") as fp:
-            igtv_data = fp.read()
-            igtv_len = str(len(igtv_data))
-        headers = {
-            "Offset": "0",
-            "X-Entity-Name": upload_name,
-            "X-Entity-Length": igtv_len,
-            "Content-Type": "application/octet-stream",
-            "Content-Length": igtv_len,
-            **headers,
-        }
-        response = await self.private.post(
-            "https://{domain}/rupload_igvideo/{name}".format(domain=config.API_DOMAIN, name=upload_name),
-            data=igtv_data,
-            headers=headers,
-        )
-        self.request_log(response)
-        if response.status_code != 200:
-            raise IGTVNotUpload(response=self.last_response, **self.last_json)
+        url = "https://{domain}/rupload_igvideo/{name}".format(domain=config.API_DOMAIN, name=upload_name)
+        igtv_len = str(path.stat().st_size)
+
+        def check(response, stage: str):
+            self.request_log(response)
+            if response.status_code != 200:
+                raise IGTVNotUpload(response=self.last_response, **self.last_json)
+
+        if self._rupload_segmented(int(igtv_len)):
+            await self._rupload_segments(path, "igtv", state, url, headers, check)
+        else:
+            response = await self.private.get(url, headers=headers)
+            check(response, "rupload_init")
+            headers = {
+                "Offset": "0",
+                "X-Entity-Name": upload_name,
+                "X-Entity-Length": igtv_len,
+                "Content-Type": "application/octet-stream",
+                "Content-Length": igtv_len,
+                **headers,
+            }
+            response = await self.private.post(url, content=FileBody(path), headers=headers)
+            check(response, "rupload_upload")
         # CONFIGURE
         self.igtv_composer_session_id = self.generate_uuid()
         for attempt in range(50):
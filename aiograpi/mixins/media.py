@@ -5,10 +5,11 @@ import tempfile
 from copy import deepcopy
 from datetime import datetime
 from pathlib import Path
-from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
+from typing import AsyncIterator, Dict, List, MutableMapping, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 from aiograpi import httpx_ext
+from aiograpi.cache import freeze, mutable_copy
 from aiograpi.exceptions import (
     ClientError,
     ClientForbiddenError,
@@ -16,6 +17,7 @@ from aiograpi.exceptions import (
     ClientLoginRequired,
     ClientNotFoundError,
     ClientUnauthorizedError,
+    LoginRequired,
     MediaNotFound,
     PreLoginRequired,
     PrivateError,
@@ -30,14 +32,16 @@ from aiograpi.extractors import (
 )
 from aiograpi.mixins.base import ClientMixin
 from aiograpi.mixins.graphql import GQL_STUFF
+from aiograpi.ratelimit import THROTTLE_EXCEPTIONS
 from aiograpi.types import Location, Media, Story, StoryMedia, UserShort, Usertag
 from aiograpi.utils.auth import generate_jazoest
 from aiograpi.utils.ids import InstagramIdCodec
-from aiograpi.utils.iterators import iter_paginated
+from aiograpi.utils.iterators import iter_concurrent, iter_paginated
 from aiograpi.utils.serialization import dumps, json_value
 
 IG_PROFILE_TIMELINE_DOC_ID = "56030350814417327502004290437"
 MEDIA_INFO_DOC_ID = "27128499623469141"
+MEDIA_INFOS_BATCH_SIZE = 20
 
 
 class MediaMixin(ClientMixin):
@@ -45,7 +49,7 @@ class MediaMixin(ClientMixin):
     Helpers for media
     """
 
-    _medias_cache = {}  # pk -> object
+    _medias_cache: MutableMapping[str, Media]  # pk -> object, bound per client by CacheMixin
 
     def _media_share_story_background(self) -> Path:
         temp = tempfile.NamedTemporaryFile(prefix="aiograpi_story_share_", suffix=".jpg", delete=False)
@@ -693,7 +697,7 @@ class MediaMixin(ClientMixin):
             raise MediaNotFound(media_id=media_id, **(self.last_json or {}))
         return extract_media_v1(media)
 
-    async def media_info(self, media_pk: str, use_cache: bool = True) -> Media:
+    async def media_info(self, media_pk: str, use_cache: bool = True, copy: bool = False) -> Media:
         """
         Get Media Information from PK
 
@@ -703,6 +707,8 @@ class MediaMixin(ClientMixin):
             Unique identifier of the media
         use_cache: bool, optional
             Whether or not to use information from cache, default value is True
+        copy: bool, optional
+            Return a mutable copy instead of the shared read-only cached object, default value is False
 
         Returns
         -------
@@ -710,7 +716,8 @@ class MediaMixin(ClientMixin):
             An object of Media type
         """
         media_pk = self.media_pk(media_pk)
-        if not use_cache or media_pk not in self._medias_cache:
+        media = self._medias_cache.get(media_pk) if use_cache else None
+        if media is None:
             if self._has_private_auth():
                 try:
                     media = await self.media_info_v1(media_pk)
@@ -727,8 +734,114 @@ class MediaMixin(ClientMixin):
                     # Restricted Video: This video is not available in your country.
                     # Or private account
                     media = await self.media_info_v1(media_pk)
-            self._medias_cache[media_pk] = media
-        return deepcopy(self._medias_cache[media_pk])  # return copy of cache (dict changes protection)
+            media = self._medias_cache[media_pk] = freeze(media)
+        return mutable_copy(media) if copy else media
+
+    async def media_infos_v1(self, media_pks: List[str]) -> Dict[str, Media]:
+        """
+        Get many Medias in one request by Private Mobile API
+
+        Parameters
+        ----------
+        media_pks: List[str]
+            Unique identifiers of the medias
+
+        Returns
+        -------
+        Dict[str, Media]
+            Dict of media pk and Media object; medias Instagram did not
+            return (deleted, private) are missing
+        """
+        media_pks = [self.media_pk(media_pk) for media_pk in media_pks]
+        result = await self.private_request(
+            "media/infos/",
+            params={
+                "media_ids": ",".join(media_pks),
+                "ranked_content": "true",
+                "include_inactive_reel": "true",
+            },
+        )
+        medias = {}
+        for item in result.get("items") or []:
+            media = extract_media_v1(item)
+            medias[str(media.pk)] = media
+        return medias
+
+    async def media_info_many(
+        self,
+        media_pks: List[str],
+        batch_size: int = MEDIA_INFOS_BATCH_SIZE,
+        concurrency: int = 4,
+        use_cache: bool = True,
+        copy: bool = False,
+    ) -> Dict[str, Union[Media, Exception]]:
+        """
+        Get Media Information of many PKs
+
+        Cached medias are served without a request, the rest are fetched
+        ``batch_size`` at a time by :meth:`media_infos_v1`. Medias a batch
+        did not return (or every media of a failed batch, or all of them
+        without a private session) fall back to :meth:`media_info`, at most
+        ``concurrency`` at once. Throttling and login errors of a batch are
+        raised instead of falling back.
+
+        Parameters
+        ----------
+        media_pks: List[str]
+            Unique identifiers of the medias
+        batch_size: int, optional
+            Maximum number of medias per media/infos request, default is 20
+        concurrency: int, optional
+            Maximum number of per-media fallback lookups at once, default is 4
+        use_cache: bool, optional
+            Whether or not to use information from cache, default value is True
+        copy: bool, optional
+            Return mutable copies instead of the shared read-only cached objects, default value is False
+
+        Returns
+        -------
+        Dict[str, Union[Media, Exception]]
+            Dict of media pk and Media object (or the exception raised for
+            that media), in the order of ``media_pks``
+        """
+        media_pks = list(dict.fromkeys(self.media_pk(media_pk) for media_pk in media_pks))
+        medias: Dict[str, Union[Media, Exception]] = {}
+        missing = []
+        for media_pk in media_pks:
+            media = self._medias_cache.get(media_pk) if use_cache else None
+            if media is None:
+                missing.append(media_pk)
+            else:
+                medias[media_pk] = media
+        if missing and self._has_private_auth():
+            batch_size = max(1, int(batch_size))
+            for start in range(0, len(missing), batch_size):
+                batch = missing[start : start + batch_size]
+                try:
+                    fetched = await self.media_infos_v1(batch)
+                except (*THROTTLE_EXCEPTIONS, ClientLoginRequired, LoginRequired):
+                    # would fail every per-media request the same way
+                    raise
+                except Exception as e:
+                    if not isinstance(e, ClientError):
+                        self.logger.exception(e)  # Register unknown error
+                    continue
+                for media_pk, media in fetched.items():
+                    if media_pk in batch:
+                        media = self._medias_cache[media_pk] = freeze(media)
+                        medias[media_pk] = media
+            missing = [media_pk for media_pk in missing if media_pk not in medias]
+
+        async def fetch(media_pk: str) -> Media:
+            return await self.media_info(media_pk, use_cache=False)
+
+        async for media_pk, result in iter_concurrent(fetch, missing, concurrency):
+            medias[media_pk] = result
+        results: Dict[str, Union[Media, Exception]] = {}
+        for media_pk in media_pks:
+            result = medias[media_pk]
+            results[media_pk] = mutable_copy(result) if copy and not isinstance(result, Exception) else result
+        return results
 
     async def media_delete(self, media_id: str) -> bool:
         """
@@ -2,9 +2,11 @@ import asyncio
 import json
 import random
 import time
+from concurrent.futures import Executor
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 from urllib.parse import urlparse
 from uuid import uuid4
 
@@ -43,6 +45,30 @@ except ImportError:
     raise Exception("You don't have PIL installed. Please install PIL or Pillow>=8.1.1")
 
 
+T = TypeVar("T")
+
+
+def prepare_photo_upload(path: str, for_story: bool = False, resize_mode: str = "fill") -> Tuple[bytes, int, int]:
+    """
+    JPEG bytes and size of a photo prepared for ``photo_rupload``
+
+    Module-level so it can run in a process pool.
+    """
+    if for_story and resize_mode == "fit":
+        photo_data, (width, height) = prepare_story_image_fit(path)
+        return photo_data, width, height
+    if for_story:
+        photo_data, (width, height) = prepare_image(
+            path,
+            max_side=1080,
+            aspect_ratios=(9 / 16, 90 / 47),
+            max_size=(1080, 1920),
+        )
+    else:
+        photo_data, (width, height) = prepare_image(path, max_side=1080)
+    return photo_data, width, height
+
+
 class DownloadPhotoMixin(ClientMixin):
     """
     Helpers for downloading photo
@@ -120,9 +146,7 @@ class DownloadPhotoMixin(ClientMixin):
         path = Path(folder) / filename
         if path.exists() and not overwrite:
             return path.resolve()
-        response = await self.public.get(url)
-        response.raise_for_status()
-        return self._download_response_to_path(response, path)
+        return await self._download_to_path(url, path)
 
     async def photo_download_by_url_origin(self, url: str) -> bytes:
         """
@@ -148,6 +172,32 @@ class UploadPhotoMixin(ClientMixin):
     Helpers for downloading photo
     """
 
+    image_executor: Optional[Executor] = None
+
+    def set_image_executor(self, image_executor: Optional[Executor] = None) -> bool:
+        """
+        Set the executor that prepares images for upload
+
+        Parameters
+        ----------
+        image_executor: Executor, optional
+            Runs the Pillow crop, resize and JPEG encode off the event loop.
+            None (default) uses the loop's default thread pool; pass a
+            ``concurrent.futures.ProcessPoolExecutor`` for CPU-heavy batches
+
+        Returns
+        -------
+        bool
+            A boolean value
+        """
+        self.image_executor = image_executor
+        return True
+
+    async def _prepare_image_job(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a Pillow preparation function in ``image_executor``"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.image_executor, partial(func, *args, **kwargs))
+
     async def photo_rupload(
         self,
         path: Path,
@@ -208,17 +258,9 @@ class UploadPhotoMixin(ClientMixin):
         }
         if to_album:
             rupload_params["is_sidecar"] = "1"
-        if for_story and resize_mode == "fit":
-            photo_data, photo_size = prepare_story_image_fit(str(path))
-        elif for_story:
-            photo_data, photo_size = prepare_image(
-                str(path),
-                max_side=1080,
-                aspect_ratios=(9 / 16, 90 / 47),
-                max_size=(1080, 1920),
-            )
-        else:
-            photo_data, photo_size = prepare_image(str(path), max_side=1080)
+        photo_data, width, height = await self._prepare_image_job(
+            prepare_photo_upload, str(path), for_story=for_story, resize_mode=resize_mode
+        )
         photo_len = str(len(photo_data))
         headers = self.private_headers(
             {
@@ -243,11 +285,6 @@ class UploadPhotoMixin(ClientMixin):
             self.logger.error("Photo Upload failed with the following response: %s", response)
             last_json = self.last_json  # local variable for read in sentry
             raise PhotoNotUpload(response.text, response=response, **last_json)
-        if for_story and resize_mode == "fit":
-            width, height = photo_size
-        else:
-            with Image.open(path) as im:
-                width, height = im.size
         return upload_id, width, height
 
     async def photo_upload(
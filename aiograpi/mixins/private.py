@@ -3,6 +3,7 @@ import json
 import logging
 import random
 import time
+from typing import Any, Dict, Optional, Tuple
 
 import orjson
 
@@ -51,7 +52,9 @@ from aiograpi.exceptions import (
     VideoTooLongException,
 )
 from aiograpi.mixins.base import ClientMixin
+from aiograpi.ratelimit import THROTTLE_EXCEPTIONS, FixedDelayRateLimiter, RateLimiter, endpoint_family
 from aiograpi.utils.auth import generate_signature
+from aiograpi.utils.context import TaskLocal
 from aiograpi.utils.serialization import dumps
 from aiograpi.utils.timing import random_delay
 
@@ -144,22 +147,23 @@ class PrivateRequestMixin(ClientMixin):
     read_timeout = 25
     request_timeout = 1
     session_retry_total = 3
-    session_retry_backoff_factor = 2
-    session_retry_statuses = [429, 500, 502, 503, 504]
+    session_retry_backoff_factor = 0.5
+    session_retry_statuses = [500, 502, 503, 504]
     domain = config.API_DOMAIN
-    last_response = None
-    last_json = {}
+    last_response = TaskLocal(None)
+    last_json = TaskLocal({})
+    _static_base_headers_cache: Optional[Tuple[tuple, Dict[str, Any]]] = None
 
     def __init__(self, *args, **kwargs):
-        self.private = httpx_ext.Session(verify=getattr(self, "tls_verify", True))
+        self.private = httpx_ext.Session(
+            verify=getattr(self, "tls_verify", True),
+            pool=self.pool_config("api"),
+            host_pools={"cdn": self.pool_config("cdn")},
+        )
         self.email = kwargs.pop("email", None)
         self.phone_number = kwargs.pop("phone_number", None)
         self.request_timeout = kwargs.pop("request_timeout", getattr(self, "request_timeout", self.request_timeout))
-        # Session retry config kept for API parity with instagrapi.
-        # httpx_ext.Session does not expose urllib3-style HTTPAdapter
-        # retries, so these values are stored but not actively wired into
-        # the transport. Callers relying on them should implement custom
-        # retry logic at the call site.
+        # Transport retries of the private session (see httpx_ext.Retry).
         self.session_retry_total = kwargs.pop(
             "session_retry_total",
             getattr(self, "session_retry_total", self.session_retry_total),
@@ -178,8 +182,55 @@ class PrivateRequestMixin(ClientMixin):
                 getattr(self, "session_retry_statuses", self.session_retry_statuses),
             )
         )
+        self.configure_private_retry()
+        self.set_rate_limiter(kwargs.pop("rate_limiter", None))
         super().__init__(*args, **kwargs)
 
+    def set_rate_limiter(self, rate_limiter: Optional[RateLimiter] = None) -> bool:
+        """
+        Set the policy that paces private requests
+
+        Parameters
+        ----------
+        rate_limiter: RateLimiter, optional
+            E.g. TokenBucketRateLimiter, possibly shared between clients.
+            Default is FixedDelayRateLimiter, which sleeps request_timeout
+            seconds before every request and a random burst delay when any
+            response of this client arrived less than a second ago
+
+        Returns
+        -------
+        bool
+            A boolean value
+        """
+        if rate_limiter is None:
+            rate_limiter = FixedDelayRateLimiter(
+                delay=lambda: self.request_timeout, last_response=lambda: self.last_response_ts
+            )
+        self.rate_limiter = rate_limiter
+        return True
+
+    def configure_private_retry(self) -> bool:
+        """
+        Apply session_retry_total, session_retry_backoff_factor and
+        session_retry_statuses to the private session transport
+
+        Returns
+        -------
+        bool
+            A boolean value
+        """
+        retry = getattr(self.private, "retry", None)
+        self.private.retry = httpx_ext.Retry(
+            total=self.session_retry_total,
+            backoff_factor=self.session_retry_backoff_factor,
+            statuses=self.session_retry_statuses,
+            # keep the per-client budget across reconfiguration
+            budget=retry.budget if retry is not None else None,
+            retry_headers={"X-Tigon-Is-Retry": "True"},
+        )
+        return True
+
     async def small_delay(self):
         """
         Small Delay
@@ -200,8 +251,31 @@ class PrivateRequestMixin(ClientMixin):
         """
         await asyncio.sleep(random.uniform(0.175, 0.875))
 
-    @property
-    def base_headers(self):
+    def _static_base_headers(self) -> Dict[str, Any]:
+        """
+        Headers that only change with the device, locale, app profile,
+        user agent, domain or logged-in user. Rebuilt when any of those
+        changes (set_locale, set_country, set_device, set_user_agent,
+        set_uuids, set_timezone_offset, login, ...). Per-request values are
+        None placeholders so base_headers keeps the original header order.
+        """
+        user_id = self.user_id
+        key = (
+            self.locale,
+            self.country,
+            self.bloks_versioning_id,
+            self.uuid,
+            self.phone_id,
+            self.android_device_id,
+            self.timezone_offset,
+            self.app_id,
+            self.user_agent,
+            self.domain,
+            user_id,
+        )
+        cached = self._static_base_headers_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
         locale = self.locale.replace("-", "_")
         accept_language = ["en-US"]
         if locale:
@@ -212,12 +286,12 @@ class PrivateRequestMixin(ClientMixin):
             "X-IG-App-Locale": locale,
             "X-IG-Device-Locale": locale,
             "X-IG-Mapped-Locale": locale,
-            "X-Pigeon-Session-Id": self.generate_uuid("UFS-", "-1"),
-            "X-Pigeon-Rawclienttime": str(round(time.time(), 3)),
+            "X-Pigeon-Session-Id": None,
+            "X-Pigeon-Rawclienttime": None,
             # "X-IG-Connection-Speed": "-1kbps",
-            "X-IG-Bandwidth-Speed-KBPS": str(random.randint(2500000, 3000000) / 1000),  # "-1.000"
-            "X-IG-Bandwidth-TotalBytes-B": str(random.randint(5000000, 90000000)),  # "0"
-            "X-IG-Bandwidth-TotalTime-MS": str(random.randint(2000, 9000)),  # "0"
+            "X-IG-Bandwidth-Speed-KBPS": None,  # "-1.000"
+            "X-IG-Bandwidth-TotalBytes-B": None,  # "0"
+            "X-IG-Bandwidth-TotalTime-MS": None,  # "0"
             # "X-IG-EU-DC-ENABLED": "true", # <- type of DC? Eu is euro, but we use US
             # "X-IG-Prefetch-Request": "foreground",  # OLD from instabot
             "X-IG-App-Startup-Country": self.country.upper(),
@@ -237,7 +311,7 @@ class PrivateRequestMixin(ClientMixin):
             "Priority": "u=3",
             "User-Agent": self.user_agent,
             "Accept-Language": ", ".join(accept_language),
-            "X-MID": self.mid,  # e.g. X--ijgABABFjLLQ1NTEe0A6JSN7o
+            "X-MID": None,  # e.g. X--ijgABABFjLLQ1NTEe0A6JSN7o
             "Accept-Encoding": "zstd, gzip, deflate",
             "Host": self.domain or config.API_DOMAIN,
             "X-FB-HTTP-Engine": "Tigon/MNS/TCP",
@@ -251,48 +325,60 @@ class PrivateRequestMixin(ClientMixin):
             # "Cache-Control": "no-cache",
             "X-FB-Client-IP": "True",
             "X-FB-Server-Cluster": "True",
-            "IG-INTENDED-USER-ID": str(self.user_id or 0),
+            "IG-INTENDED-USER-ID": str(user_id or 0),
             "X-IG-Nav-Chain": ("9MV:self_profile:2,ProfileMediaTabFragment:self_profile:3,9Xf:self_following:4"),
-            "X-IG-SALT-IDS": str(random.randint(1061162222, 1061262222)),
+            "X-IG-SALT-IDS": None,
         }
-        if self.user_id:
-            next_year = time.time() + 31536000  # + 1 year in seconds
+        if user_id:
             headers.update(
                 {
-                    "IG-U-DS-USER-ID": str(self.user_id),
+                    "IG-U-DS-USER-ID": str(user_id),
                     # Direct:
-                    "IG-U-IG-DIRECT-REGION-HINT": (
-                        f"LLA,{self.user_id},{next_year}:"
-                        "01f7bae7d8b131877d8e0ae1493252280d72"
-                        "f6d0d554447cb1dc9049b6b2c507c08605b7"
-                    ),
-                    "IG-U-SHBID": (
-                        f"12695,{self.user_id},{next_year}:"
-                        "01f778d9c9f7546cf3722578fbf9b85143cd"
-                        "6e5132723e5c93f40f55ca0459c8ef8a0d9f"
-                    ),
-                    "IG-U-SHBTS": (
-                        f"{int(time.time())},{self.user_id},{next_year}:"
-                        "01f7ace11925d0388080078d0282b75b8059"
-                        "844855da27e23c90a362270fddfb3fae7e28"
-                    ),
-                    "IG-U-RUR": (
-                        f"RVA,{self.user_id},{next_year}:"
-                        "01f7f627f9ae4ce2874b2e04463efdb18434"
-                        "0968b1b006fa88cb4cc69a942a04201e544c"
-                    ),
+                    "IG-U-IG-DIRECT-REGION-HINT": None,
+                    "IG-U-SHBID": None,
+                    "IG-U-SHBTS": None,
+                    "IG-U-RUR": None,
                 }
             )
+        self._static_base_headers_cache = (key, headers)
+        return headers
+
+    @property
+    def base_headers(self):
+        headers = dict(self._static_base_headers())
+        now = time.time()
+        headers["X-Pigeon-Session-Id"] = self.generate_uuid("UFS-", "-1")
+        headers["X-Pigeon-Rawclienttime"] = str(round(now, 3))
+        headers["X-IG-Bandwidth-Speed-KBPS"] = str(random.randint(2500000, 3000000) / 1000)
+        headers["X-IG-Bandwidth-TotalBytes-B"] = str(random.randint(5000000, 90000000))
+        headers["X-IG-Bandwidth-TotalTime-MS"] = str(random.randint(2000, 9000))
+        headers["X-MID"] = self.mid
+        headers["X-IG-SALT-IDS"] = str(random.randint(1061162222, 1061262222))
+        if "IG-U-DS-USER-ID" in headers:
+            # "<user_id>,<now + 1 year>:"
+            expiry = f"{headers['IG-U-DS-USER-ID']},{now + 31536000}:"
+            headers["IG-U-IG-DIRECT-REGION-HINT"] = (
+                f"LLA,{expiry}01f7bae7d8b131877d8e0ae1493252280d72f6d0d554447cb1dc9049b6b2c507c08605b7"
+            )
+            headers["IG-U-SHBID"] = (
+                f"12695,{expiry}01f778d9c9f7546cf3722578fbf9b85143cd6e5132723e5c93f40f55ca0459c8ef8a0d9f"
+            )
+            headers["IG-U-SHBTS"] = (
+                f"{int(now)},{expiry}01f7ace11925d0388080078d0282b75b8059844855da27e23c90a362270fddfb3fae7e28"
+            )
+            headers["IG-U-RUR"] = (
+                f"RVA,{expiry}01f7f627f9ae4ce2874b2e04463efdb184340968b1b006fa88cb4cc69a942a04201e544c"
+            )
         if self.ig_u_rur:
-            headers.update({"IG-U-RUR": '"%s"' % self.ig_u_rur})
+            headers["IG-U-RUR"] = '"%s"' % self.ig_u_rur
         if self.ig_www_claim:
-            headers.update({"X-IG-WWW-Claim": self.ig_www_claim})
+            headers["X-IG-WWW-Claim"] = self.ig_www_claim
         if self.usdid_private_key:
-            headers.update({"X-Meta-Usdid": self.usdid_header()})
+            headers["X-Meta-Usdid"] = self.usdid_header()
         return headers
 
     def private_headers(self, headers=None):
-        request_headers = dict(self.base_headers)
+        request_headers = self.base_headers
         if headers:
             request_headers.update(headers)
         if self.authorization and not any(key.lower() == "authorization" for key in request_headers):
@@ -419,19 +505,51 @@ class PrivateRequestMixin(ClientMixin):
         extra_sig=None,
         domain: str = None,
     ):
-        self.last_response = None
-        self.last_json = last_json = {}  # for Sentry context in traceback
-        self.private.headers.update(self.base_headers)
-        # Per-request overrides (caller headers such as X-FB-Friendly-Name, and
-        # the Host override used for domain routing) must not be merged into the
-        # persistent session headers, or they leak onto unrelated later requests.
-        request_headers = dict(headers) if headers else {}
+        # Headers are built per request and never merged into the shared
+        # session: concurrent requests must not leak Content-Type or caller
+        # overrides (X-FB-Friendly-Name, the Host used for domain routing)
+        # into each other. None drops a header the session may still carry.
+        request_headers = self.base_headers
+        request_headers["Content-Type"] = "application/x-www-form-urlencoded; charset=UTF-8" if data else None
+        if headers:
+            request_headers.update(headers)
         if domain:
             request_headers["Host"] = domain
-        if self.last_response_ts and (time.time() - self.last_response_ts) < 1.0:
-            await self.small_delay()
-        if not login:
-            await asyncio.sleep(self.request_timeout)
+        family = "login" if login else endpoint_family(endpoint)
+        await self.rate_limiter.acquire(family)
+        # recorded once per request (a cursor resend included), throttled
+        # only by the exception this request raised
+        error = None
+        try:
+            return await self._private_request_attempt(
+                endpoint,
+                data=data,
+                params=params,
+                login=login,
+                with_signature=with_signature,
+                request_headers=request_headers,
+                extra_sig=extra_sig,
+                domain=domain,
+            )
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            self.rate_limiter.record_response(family, throttled=isinstance(error, THROTTLE_EXCEPTIONS))
+
+    async def _private_request_attempt(
+        self,
+        endpoint,
+        data=None,
+        params=None,
+        login=False,
+        with_signature=True,
+        request_headers=None,
+        extra_sig=None,
+        domain: Optional[str] = None,
+    ):
+        self.last_response = None
+        self.last_json = last_json = {}  # for Sentry context in traceback
         # if self.user_id and login:
         #     raise Exception(f"User already logged ({self.user_id})")
         try:
@@ -446,7 +564,6 @@ class PrivateRequestMixin(ClientMixin):
             if data:  # POST
                 # Client.direct_answer raw dict
                 # data = json.dumps(data)
-                self.private.headers["Content-Type"] = "application/x-www-form-urlencoded; charset=UTF-8"
                 if with_signature:
                     # Client.direct_answer doesn't need a signature
                     data = generate_signature(dumps(data))
@@ -456,27 +573,27 @@ class PrivateRequestMixin(ClientMixin):
                     api_url,
                     data=data,
                     params=params,
-                    headers=request_headers or None,
+                    headers=request_headers,
                     timeout=self.read_timeout,
                 )
             else:  # GET
-                self.private.headers.pop("Content-Type", None)
                 response = await self.private.get(
                     api_url,
                     params=params,
-                    headers=request_headers or None,
+                    headers=request_headers,
                     timeout=self.read_timeout,
                 )
-            response_text = response.text.strip()
             # if "zstd" in (response.headers.get("Content-Encoding") or ""):
             #     dctx = zstandard.ZstdDecompressor()
             #     response_text = dctx.decompress(response.content)
-            self.logger.debug(
-                "private_request %s: %s (%s)",
-                response.status_code,
-                response.url,
-                response_text,
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                # decoding the body to text costs as much as parsing it
+                self.logger.debug(
+                    "private_request %s: %s (%s)",
+                    response.status_code,
+                    response.url,
+                    response.text.strip(),
+                )
             mid = response.headers.get("ig-set-x-mid")
             if mid:
                 self.mid = mid
@@ -487,12 +604,14 @@ class PrivateRequestMixin(ClientMixin):
                 params.pop("min_id", None)
                 params.pop("max_id", None)
                 self.logger.warning("Resend request without cursor %r (%r)", endpoint, params)
-                return await self._send_private_request(
+                return await self._private_request_attempt(
                     endpoint,
                     data=data,
                     params=params,
                     login=login,
                     with_signature=False,
+                    request_headers=request_headers,
+                    domain=domain,
                 )
 
             response.raise_for_status()
@@ -500,8 +619,10 @@ class PrivateRequestMixin(ClientMixin):
             try:
                 self.last_json = last_json = response.json()
             except orjson.JSONDecodeError:
+                # streamed endpoints answer with one JSON object per line
                 rows = [
-                    orjson.loads(item if item.endswith('"}') else f'{item}"}}') for item in response_text.split('"}\n')
+                    orjson.loads(item if item.endswith('"}') else f'{item}"}}')
+                    for item in response.text.strip().split('"}\n')
                 ]
                 self.last_json = last_json = {"stream_rows": rows}
             self.logger.debug("last_json %s", last_json)
@@ -522,7 +643,7 @@ class PrivateRequestMixin(ClientMixin):
                 response.headers,
                 self.user_id,
                 endpoint,
-                response_text,
+                response.text.strip(),
             )
             self.logger.error(e)
             raise ClientJSONDecodeError(
@@ -771,13 +892,13 @@ class PrivateRequestMixin(ClientMixin):
                 await random_delay(delay_range=self.delay_range)
             self.private_requests_count += 1
             await self._send_private_request(endpoint, **kwargs)
-        except ClientRequestTimeout:
-            self.logger.info("Wait 60 seconds and try one more time (ClientRequestTimeout)")
-            await asyncio.sleep(60)
-            return await self._send_private_request(endpoint, **kwargs)
-        except ClientIncompleteReadError:
-            self.logger.info("Wait 2 seconds and try one more time (ClientIncompleteReadError)")
-            await asyncio.sleep(2)
+        except (ClientRequestTimeout, ClientIncompleteReadError) as e:
+            if data:
+                # a POST may already have been applied by the server
+                raise
+            delay = self.private.retry.backoff(1)
+            self.logger.info("Wait %.2f seconds and try one more time (%s)", delay, e.__class__.__name__)
+            await asyncio.sleep(delay)
             return await self._send_private_request(endpoint, **kwargs)
         # except BadPassword as e:
         #     raise e
@@ -1,14 +1,17 @@
 import asyncio
 import json
 import logging
+import os
 import re
 import time
+import uuid
 from pathlib import Path
-from typing import Any, Dict, Literal, Optional
+from typing import Any, Dict, Literal, Optional, Tuple
 
 import orjson
 
 from aiograpi import httpx_ext
+from aiograpi.cache import MediaFileCache
 from aiograpi.exceptions import (
     AboutUsError,
     AccountSuspended,
@@ -28,12 +31,18 @@ from aiograpi.exceptions import (
     TermsUnblock,
 )
 from aiograpi.mixins.base import ClientMixin
+from aiograpi.ratelimit import THROTTLE_EXCEPTIONS
+from aiograpi.utils.context import TaskLocal
 from aiograpi.utils.logging import truncate_log_text
 from aiograpi.utils.timing import random_delay
 
 PublicTransport = Literal["requests", "curl"]
 PUBLIC_WEB_APP_ID = "936619743392459"
 PUBLIC_WEB_ASBD_ID = "129477"
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+DOWNLOAD_MIN_SEGMENT_SIZE = 1024 * 1024
+CONTENT_RANGE_RE = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+UNSATISFIED_RANGE_RE = re.compile(r"bytes \*/(\d+)")
 
 
 class PublicRequestMixin(ClientMixin):
@@ -41,8 +50,8 @@ class PublicRequestMixin(ClientMixin):
     PUBLIC_API_URL = "https://www.instagram.com/"
     GRAPHQL_PUBLIC_API_URL = "https://www.instagram.com/graphql/query/"
     GRAPHQL_PUBLIC_WEB_API_URL = "https://www.instagram.com/api/graphql"
-    last_public_response = None
-    last_public_json = {}
+    last_public_response = TaskLocal(None)
+    last_public_json = TaskLocal({})
     public_request_logger = logging.getLogger("public_request")
     public_request_retries_count = 3
     public_request_retries_timeout = 2
@@ -102,8 +111,27 @@ class PublicRequestMixin(ClientMixin):
                 self.public_request_retries_timeout,
             ),
         )
+        self.set_media_cache(kwargs.pop("media_cache", None))
         super().__init__(*args, **kwargs)
 
+    def set_media_cache(self, media_cache: Optional[MediaFileCache] = None) -> bool:
+        """
+        Set the on-disk cache that download helpers read and fill
+
+        Parameters
+        ----------
+        media_cache: MediaFileCache, optional
+            Cache of downloaded CDN files, possibly shared between clients.
+            None (default) downloads every file
+
+        Returns
+        -------
+        bool
+            A boolean value
+        """
+        self.media_cache = media_cache
+        return True
+
     @classmethod
     def _normalize_public_transport(cls, public_transport: Optional[PublicTransport]) -> PublicTransport:
         public_transport = public_transport or "requests"
@@ -121,7 +149,11 @@ class PublicRequestMixin(ClientMixin):
         verify = getattr(self, "tls_verify", True) if verify is None else verify
         if self.public_transport == "curl":
             return httpx_ext.CurlSession(verify=verify, impersonate=self.public_transport_impersonate)
-        return httpx_ext.Session(verify=verify)
+        return httpx_ext.Session(
+            verify=verify,
+            pool=self.pool_config("graphql"),
+            host_pools={"cdn": self.pool_config("cdn")},
+        )
 
     def _configure_public_transport(self):
         old_public = getattr(self, "public", None)
@@ -146,7 +178,9 @@ class PublicRequestMixin(ClientMixin):
         straight through ``httpx_ext.request`` so the per-call
         ``follow_redirects`` flag actually takes effect (the Session
         wrapper filters falsy kwargs and would drop
-        ``follow_redirects=False``).
+        ``follow_redirects=False``). Its pooled clients keep connections
+        warm between calls, so resolving many links in a row does not
+        pay a new TLS handshake each time.
 
         Parameters
         ----------
@@ -234,6 +268,32 @@ class PublicRequestMixin(ClientMixin):
         headers=None,
         return_json=False,
         update_headers=None,
+    ):
+        await self.rate_limiter.acquire("public")
+        error = None
+        try:
+            return await self._public_request_attempt(
+                url,
+                data=data,
+                params=params,
+                headers=headers,
+                return_json=return_json,
+                update_headers=update_headers,
+            )
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            self.rate_limiter.record_response("public", throttled=isinstance(error, THROTTLE_EXCEPTIONS))
+
+    async def _public_request_attempt(
+        self,
+        url,
+        data=None,
+        params=None,
+        headers=None,
+        return_json=False,
+        update_headers=None,
     ):
         self.last_public_response = None
         self.public_requests_count += 1
@@ -333,19 +393,160 @@ class PublicRequestMixin(ClientMixin):
             f"Broken file {source} (Content-length={expected_length}, but file length={actual_length})"
         )
 
-    def _download_response_to_path(self, response, path: Path) -> Path:
+    async def _download_response_to_path(self, response, path: Path) -> Path:
+        """
+        Stream a response body into ``path``
+
+        The body is written in ``DOWNLOAD_CHUNK_SIZE`` chunks to a temporary
+        file next to ``path`` that replaces ``path`` only once it is complete,
+        so an interrupted download never leaves a truncated file behind.
+
+        Returns
+        -------
+        Path
+            Resolved path of the downloaded file
+        """
         path = Path(path)
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
         try:
-            content = response.read()
-            with open(path, "wb") as f:
-                f.write(content)
-            self._raise_for_incomplete_download(
-                path.stat().st_size,
-                self._expected_content_length(response),
-                f'"{path}"',
-            )
-        except Exception:
-            path.unlink(missing_ok=True)
+            size = 0
+            with open(tmp_path, "xb") as f:
+                async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                    size += len(chunk)
+            self._raise_for_incomplete_download(size, self._expected_content_length(response), f'"{path}"')
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return path.resolve()
+
+    def _content_range(self, response) -> Optional[Tuple[int, int, Optional[int]]]:
+        match = CONTENT_RANGE_RE.fullmatch(response.headers.get("Content-Range", "").strip())
+        if not match:
+            return None
+        start, end, total = match.groups()
+        return int(start), int(end), None if total == "*" else int(total)
+
+    async def _download_to_path(self, url: str, path: Path, resume: bool = False, segments: int = 1) -> Path:
+        """
+        Download ``url`` into ``path`` with a streaming GET on the public session
+
+        Parameters
+        ----------
+        url: str
+            URL of the file
+        path: Path
+            Target file
+        resume: bool, optional
+            Keep the received bytes in ``<path>.part`` when the download fails
+            and continue from there with a ``Range`` request next time
+        segments: int, optional
+            Fetch the file as up to this many ranged segments concurrently,
+            default 1
+
+        Returns
+        -------
+        Path
+            Resolved path of the downloaded file, served from ``media_cache``
+            when it holds the asset
+        """
+        path = Path(path)
+        if self.media_cache is not None:
+            # whole-file copies: keep them off the event loop
+            cached = await asyncio.to_thread(self.media_cache.fetch, url, path)
+            if cached is not None:
+                return cached
+        part = path.with_name(f"{path.name}.part")
+        if segments > 1 and not (resume and part.exists()):
+            result = await self._download_segments_to_path(url, path, segments)
+        elif resume:
+            result = await self._download_resume_to_path(url, path)
+        else:
+            result = await self._download_stream_to_path(url, path)
+        if self.media_cache is not None:
+            await asyncio.to_thread(self.media_cache.store, url, result)
+        return result
+
+    async def _download_stream_to_path(self, url: str, path: Path) -> Path:
+        async with self.public.stream("GET", url) as response:
+            response.raise_for_status()
+            return await self._download_response_to_path(response, path)
+
+    async def _download_resume_to_path(self, url: str, path: Path) -> Path:
+        part = path.with_name(f"{path.name}.part")
+        offset = part.stat().st_size if part.exists() else 0
+        # ranges count encoded bytes: ask for the file as stored
+        headers = {"Accept-Encoding": "identity"}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+        async with self.public.stream("GET", url, headers=headers) as response:
+            unsatisfied = offset > 0 and response.status_code == 416
+            match = UNSATISFIED_RANGE_RE.fullmatch(response.headers.get("Content-Range", "").strip())
+            # the part already holds the whole file when its size is the total
+            complete = unsatisfied and match is not None and int(match.group(1)) == offset
+            restart = unsatisfied and not complete
+            if not unsatisfied:
+                response.raise_for_status()
+                content_range = self._content_range(response)
+                if response.status_code != 206 or not content_range or content_range[0] != offset:
+                    # the server sent the whole file
+                    offset = 0
+                size = 0
+                with open(part, "ab" if offset else "wb") as f:
+                    async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                        size += len(chunk)
+                self._raise_for_incomplete_download(size, self._expected_content_length(response), f'"{path}"')
+        if restart:
+            # the part no longer matches the file behind the URL
+            part.unlink()
+            return await self._download_resume_to_path(url, path)
+        os.replace(part, path)
+        return path.resolve()
+
+    async def _download_segments_to_path(self, url: str, path: Path, segments: int) -> Path:
+        part = path.with_name(f"{path.name}.part")
+        headers = {"Accept-Encoding": "identity", "Range": "bytes=0-0"}
+        async with self.public.stream("GET", url, headers=headers) as probe:
+            probe.raise_for_status()
+            content_range = self._content_range(probe)
+            total = content_range[2] if probe.status_code == 206 and content_range else None
+            if total is None:
+                # no range support: this response already carries the whole file
+                return await self._download_response_to_path(probe, path)
+        segments = min(segments, total // DOWNLOAD_MIN_SEGMENT_SIZE)
+        if segments <= 1:
+            return await self._download_stream_to_path(url, path)
+        step = -(-total // segments)
+        bounds = [(start, min(start + step, total) - 1) for start in range(0, total, step)]
+
+        async def fetch(start: int, end: int):
+            range_headers = {"Accept-Encoding": "identity", "Range": f"bytes={start}-{end}"}
+            async with self.public.stream("GET", url, headers=range_headers) as response:
+                response.raise_for_status()
+                content_range = self._content_range(response)
+                if response.status_code != 206 or not content_range or content_range[:2] != (start, end):
+                    raise ClientIncompleteReadError(f'Broken file "{path}" (Range bytes={start}-{end} not honoured)')
+                size = 0
+                with open(part, "r+b") as f:
+                    f.seek(start)
+                    async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                        size += len(chunk)
+            self._raise_for_incomplete_download(size, end - start + 1, f'"{path}" (bytes {start}-{end})')
+
+        with open(part, "wb") as f:
+            f.truncate(total)
+        tasks = [asyncio.ensure_future(fetch(start, end)) for start, end in bounds]
+        try:
+            await asyncio.gather(*tasks)
+            os.replace(part, path)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            part.unlink(missing_ok=True)
             raise
         return path.resolve()
 
@@ -0,0 +1,329 @@
+import asyncio
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+from uuid import uuid4
+
+from aiograpi import httpx_ext
+from aiograpi.exceptions import ClientError
+from aiograpi.mixins.base import ClientMixin
+from aiograpi.utils.upload import FileBody, RuploadState, RuploadStateStore
+
+# Attempts per call; each one asks the server where the previous one stopped.
+RUPLOAD_ATTEMPTS = 3
+RUPLOAD_RETRY_DELAY = 2.0
+# Videos of at least UPLOAD_SEGMENTED_MIN_SIZE bytes go up as segments of
+# UPLOAD_SEGMENT_SIZE bytes, UPLOAD_PARALLELISM of them at a time.
+UPLOAD_SEGMENT_SIZE = 8 * 1024 * 1024
+UPLOAD_SEGMENTED_MIN_SIZE = 32 * 1024 * 1024
+UPLOAD_PARALLELISM = 4
+
+
+def rupload_offset(response, size: int) -> int:
+    """Offset from a rupload init response (``{"offset": N}``), 0 when missing or out of range"""
+    try:
+        offset = int(response.json().get("offset", 0))
+    except Exception:
+        return 0
+    return offset if 0 <= offset <= size else 0
+
+
+class RuploadMixin(ClientMixin):
+    """
+    Resumable rupload sessions
+    """
+
+    upload_state: Optional[RuploadStateStore] = None
+    upload_segment_size: int = UPLOAD_SEGMENT_SIZE
+    upload_segmented_min_size: Optional[int] = UPLOAD_SEGMENTED_MIN_SIZE
+    upload_parallelism: int = UPLOAD_PARALLELISM
+
+    def set_upload_state(self, upload_state: Optional[RuploadStateStore] = None) -> bool:
+        """
+        Set the store that keeps video rupload sessions across restarts
+
+        Parameters
+        ----------
+        upload_state: RuploadStateStore, optional
+            Store for upload ids, names and confirmed offsets. With a store,
+            a video upload interrupted by a crash continues from the server's
+            offset on the next call with the same file. None (default) keeps
+            the sessions in memory only
+
+        Returns
+        -------
+        bool
+            A boolean value
+        """
+        self.upload_state = upload_state
+        return True
+
+    def set_upload_segments(
+        self,
+        segment_size: int = UPLOAD_SEGMENT_SIZE,
+        parallelism: int = UPLOAD_PARALLELISM,
+        min_size: Optional[int] = UPLOAD_SEGMENTED_MIN_SIZE,
+    ) -> bool:
+        """
+        Configure segmented video uploads
+
+        Parameters
+        ----------
+        segment_size: int, optional
+            Bytes per segment, default 8 MiB
+        parallelism: int, optional
+            Segments uploaded at once, default 4
+        min_size: int, optional
+            Videos of at least this many bytes are uploaded in segments,
+            default 32 MiB; smaller ones go up in a single request. None
+            always uploads in a single request
+
+        Returns
+        -------
+        bool
+            A boolean value
+        """
+        self.upload_segment_size = max(1, int(segment_size))
+        self.upload_parallelism = max(1, int(parallelism))
+        self.upload_segmented_min_size = min_size
+        return True
+
+    def _rupload_segmented(self, size: int) -> bool:
+        return self.upload_segmented_min_size is not None and size >= self.upload_segmented_min_size
+
+    def _rupload_kind(self, kind: str) -> str:
+        return f"{self.user_id}:{kind}"
+
+    def _rupload_resume(self, path: Path, kind: str, state: RuploadState) -> RuploadState:
+        """The persisted session for ``path``, or ``state`` for a new upload"""
+        if self.upload_state is None:
+            return state
+        resumed = self.upload_state.load(path, self._rupload_kind(kind))
+        if resumed is None:
+            return state
+        self.logger.info("Resuming %s upload %s of %s", kind, resumed.upload_name, path)
+        return resumed
+
+    async def _rupload_attempts(
+        self,
+        name: str,
+        size: int,
+        init: Callable[[], Awaitable[Any]],
+        upload: Callable[[int], Awaitable[Any]],
+        checkpoint: Optional[Callable[[int], None]] = None,
+    ) -> Any:
+        for attempt in range(RUPLOAD_ATTEMPTS):
+            offset = 0
+            try:
+                offset = rupload_offset(await init(), size)
+                if checkpoint is not None:
+                    checkpoint(offset)
+                return await upload(offset)
+            except httpx_ext.TransportError as exc:
+                if attempt + 1 == RUPLOAD_ATTEMPTS:
+                    raise
+                self.logger.warning("Upload %s interrupted at offset %s (%r), resuming", name, offset, exc)
+                await asyncio.sleep(RUPLOAD_RETRY_DELAY * (attempt + 1))
+
+    async def _rupload(
+        self,
+        path: Path,
+        kind: str,
+        state: RuploadState,
+        init: Callable[[], Awaitable[Any]],
+        upload: Callable[[int], Awaitable[Any]],
+    ) -> Any:
+        """
+        Run a rupload session, continuing from the server's offset after a
+        network failure
+
+        Parameters
+        ----------
+        path: Path
+            File being uploaded
+        kind: str
+            Upload kind, part of the persisted state key
+        state: RuploadState
+            Session from ``_rupload_resume``; ``offset`` is kept up to date
+        init: Callable
+            Sends the init GET and returns its response (raising on errors);
+            the body carries the offset the server already has
+        upload: Callable
+            Sends the file from the given offset and returns the response
+            (raising on errors)
+
+        Returns
+        -------
+        Any
+            Response of the upload request
+        """
+        kind = self._rupload_kind(kind)
+
+        def checkpoint(offset: int):
+            state.offset = offset
+            if self.upload_state is not None:
+                self.upload_state.save(path, kind, state)
+
+        try:
+            response = await self._rupload_attempts(state.upload_name, path.stat().st_size, init, upload, checkpoint)
+        except httpx_ext.TransportError:
+            raise
+        except Exception:
+            # rejected by the server: the next call starts a new session
+            if self.upload_state is not None:
+                self.upload_state.discard(path, kind)
+            raise
+        if self.upload_state is not None:
+            self.upload_state.discard(path, kind)
+        return response
+
+    async def _rupload_segments(
+        self,
+        path: Path,
+        kind: str,
+        state: RuploadState,
+        url: str,
+        headers: Dict[str, str],
+        check: Callable[[Any, str], None],
+    ) -> Any:
+        """
+        Upload a video as ``upload_segment_size`` byte segments, up to
+        ``upload_parallelism`` at once
+
+        The stream is opened with ``?segmented=true&phase=start``, every
+        segment is its own rupload entity tagged with the ``Stream-Id`` and
+        its ``Segment-Start-Offset``, and ``phase=end`` stitches them. A
+        segment interrupted by a network error continues from the server's
+        offset; the first failed segment cancels the others. With
+        ``upload_state`` the stream id and the segments are saved as they
+        start and finish, and a later call with the same file reopens the
+        stream and uploads only the unfinished segments.
+
+        Parameters
+        ----------
+        path: Path
+            File being uploaded
+        kind: str
+            Upload kind, part of the persisted state key
+        state: RuploadState
+            Session from ``_rupload_resume``; its segment fields are kept up
+            to date
+        url: str
+            rupload URL of the whole video
+        headers: Dict[str, str]
+            rupload headers of the video (params and waterfall id)
+        check: Callable
+            Called with every response and its stage; raises on errors
+
+        Returns
+        -------
+        Any
+            Response of the ``phase=end`` request
+        """
+        kind = self._rupload_kind(kind)
+        size = path.stat().st_size
+        step = self.upload_segment_size
+
+        def save():
+            if self.upload_state is not None:
+                self.upload_state.save(path, kind, state)
+
+        try:
+            if state.stream_id and state.segment_size == step:
+                self.logger.info(
+                    "Resuming segmented upload %s: %s segments done", state.upload_name, len(state.segments_done)
+                )
+            else:
+                response = await self.private.post(f"{url}?segmented=true&phase=start", headers=headers)
+                check(response, "segment_start")
+                try:
+                    state.stream_id = str(response.json()["stream_id"])
+                except Exception as exc:
+                    raise ClientError(
+                        f"rupload segmented start response missing stream_id: {response.text[:300]}"
+                    ) from exc
+                state.segment_size, state.segments, state.segments_done = step, {}, []
+                save()
+            response = await self._rupload_segments_send(path, state, url, headers, check, save)
+        except httpx_ext.TransportError:
+            raise
+        except Exception:
+            # rejected by the server: the next call starts a new stream
+            if self.upload_state is not None:
+                self.upload_state.discard(path, kind)
+            raise
+        if self.upload_state is not None:
+            self.upload_state.discard(path, kind)
+        return response
+
+    async def _rupload_segments_send(
+        self,
+        path: Path,
+        state: RuploadState,
+        url: str,
+        headers: Dict[str, str],
+        check: Callable[[Any, str], None],
+        save: Callable[[], None],
+    ) -> Any:
+        size = path.stat().st_size
+        semaphore = asyncio.Semaphore(self.upload_parallelism)
+
+        async def send(start: int, length: int):
+            name = state.segments.get(start)
+            if name is None:
+                name = state.segments[start] = f"{uuid4().hex}-0-{length}"
+                save()
+            segment_url = "{base}/{name}".format(base=url.rsplit("/", 1)[0], name=name)
+            segment_headers = {
+                **headers,
+                "Stream-Id": state.stream_id,
+                "Segment-Start-Offset": str(start),
+                "Segment-Type": "3",
+            }
+
+            async def init():
+                response = await self.private.get(segment_url, headers=segment_headers)
+                check(response, "segment_init")
+                return response
+
+            async def upload(offset: int):
+                response = await self.private.post(
+                    segment_url,
+                    content=FileBody(path, start + offset, length - offset),
+                    headers={
+                        "Offset": str(offset),
+                        "X-Entity-Name": name,
+                        "X-Entity-Length": str(length),
+                        "Content-Type": "application/octet-stream",
+                        "Content-Length": str(length - offset),
+                        "X-Entity-Type": "video/mp4",
+                        **segment_headers,
+                    },
+                )
+                check(response, "segment_upload")
+                return response
+
+            async with semaphore:
+                await self._rupload_attempts(name, length, init, upload)
+            state.segments_done.append(start)
+            save()
+
+        step = state.segment_size
+        done = set(state.segments_done)
+        tasks = [
+            asyncio.ensure_future(send(start, min(step, size - start)))
+            for start in range(0, size, step)
+            if start not in done
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        response = await self.private.post(
+            f"{url}?segmented=true&phase=end",
+            headers={**headers, "Stream-Id": state.stream_id},
+        )
+        check(response, "segment_end")
+        return response
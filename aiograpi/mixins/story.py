@@ -1,10 +1,12 @@
 import json
+from contextlib import aclosing
 from copy import deepcopy
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import AsyncIterator, Dict, Iterable, List, MutableMapping, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 from aiograpi import config
+from aiograpi.cache import freeze, mutable_copy
 from aiograpi.exceptions import (
     ClientError,
     ClientGraphqlError,
@@ -23,10 +25,13 @@ from aiograpi.extractors import (
 )
 from aiograpi.mixins.base import ClientMixin
 from aiograpi.types import Story, StoryArchiveDay, UserShort, Viewer
+from aiograpi.utils.iterators import iter_concurrent
+
+STORIES_REELS_CHUNK_SIZE = 50
 
 
 class StoryMixin(ClientMixin):
-    _stories_cache = {}  # pk -> object
+    _stories_cache: MutableMapping[str, Story]  # pk -> object, bound per client by CacheMixin
 
     def story_pk_from_url(self, url: str) -> str:
         """
@@ -74,14 +79,16 @@ class StoryMixin(ClientMixin):
         story_pk, user_id = story_id.split("_")
 
         stories = await self.user_stories_v1(user_id)
+        found = None
         for story in stories:
-            self._stories_cache[story.pk] = story
-        if story_pk not in self._stories_cache:
+            self._stories_cache[story.pk] = freeze(story)
+            if story.pk == story_pk:
+                found = story
+        if found is None:
             raise StoryNotFound(story_pk=story_pk, **self.last_json)
-        story = self._stories_cache[story_pk]
-        return deepcopy(story)
+        return found
 
-    async def story_info(self, story_pk: str, use_cache: bool = True) -> Story:
+    async def story_info(self, story_pk: str, use_cache: bool = True, copy: bool = False) -> Story:
         """
         Get Story by pk or id
 
@@ -92,16 +99,20 @@ class StoryMixin(ClientMixin):
         use_cache: bool, optional
             Whether or not to use information from cache,
             default value is True
+        copy: bool, optional
+            Return a mutable copy instead of the shared read-only
+            cached object, default value is False
 
         Returns
         -------
         Story
             An object of Story type
         """
-        if not use_cache or story_pk not in self._stories_cache:
+        story = self._stories_cache.get(story_pk) if use_cache else None
+        if story is None:
             story = await self.story_info_v1(story_pk)
-            self._stories_cache[story_pk] = story
-        return deepcopy(self._stories_cache[story_pk])
+            story = self._stories_cache[story_pk] = freeze(story)
+        return mutable_copy(story) if copy else story
 
     async def story_delete(self, story_pk: str) -> bool:
         """
@@ -222,6 +233,86 @@ class StoryMixin(ClientMixin):
             stories = stories[: int(amount)]
         return stories
 
+    async def users_stories_v1(self, user_ids: List[str], amount: Optional[int] = None) -> Dict[str, List[Story]]:
+        """
+        Get the stories of several users in one request (Private API)
+
+        Parameters
+        ----------
+        user_ids: List[str]
+            List of user ids
+        amount: int, optional
+            Maximum number of stories per user, default is all
+
+        Returns
+        -------
+        Dict[str, List[Story]]
+            Dict of user_id and the list of the user's stories (empty when
+            the user has no active stories)
+        """
+        user_ids = [str(user_id) for user_id in user_ids]
+        data = {
+            "exclude_media_ids": "[]",
+            "supported_capabilities_new": json.dumps(config.SUPPORTED_CAPABILITIES),
+            "source": "feed_timeline",
+            "_uid": str(self.user_id),
+            "_uuid": self.uuid,
+            "user_ids": user_ids,
+        }
+        result = await self.private_request("feed/reels_media/", data)
+        reels = result.get("reels") or {}
+        stories = {}
+        for user_id in user_ids:
+            items = (reels.get(user_id) or {}).get("items") or []
+            if amount:
+                items = items[: int(amount)]
+            stories[user_id] = [extract_story_v1(item) for item in items]
+        return stories
+
+    async def users_stories_many(
+        self,
+        user_ids: Iterable[str],
+        chunk_size: int = STORIES_REELS_CHUNK_SIZE,
+        concurrency: int = 4,
+        amount: Optional[int] = None,
+    ) -> AsyncIterator[Tuple[str, Union[List[Story], Exception]]]:
+        """
+        Iterate over the stories of many users (Private API)
+
+        User ids are deduplicated and fetched ``chunk_size`` per
+        feed/reels_media request by :meth:`users_stories_v1`, with at most
+        ``concurrency`` requests in flight, still paced by the client's
+        rate limiter.
+
+        Parameters
+        ----------
+        user_ids: Iterable[str]
+            User ids of instagram accounts
+        chunk_size: int, optional
+            Maximum number of users per request, default is 50
+        concurrency: int, optional
+            Maximum number of requests at once, default is 4
+        amount: int, optional
+            Maximum number of stories per user, default is all
+
+        Returns
+        -------
+        AsyncIterator[Tuple[str, Union[List[Story], Exception]]]
+            Async iterator of (user_id, stories) pairs as chunks complete;
+            when a request fails, every user of its chunk gets the exception
+        """
+        user_ids = list(dict.fromkeys(str(user_id) for user_id in user_ids))
+        chunk_size = max(1, int(chunk_size))
+        chunks = [tuple(user_ids[i : i + chunk_size]) for i in range(0, len(user_ids), chunk_size)]
+
+        async def fetch(chunk: Tuple[str, ...]) -> Dict[str, List[Story]]:
+            return await self.users_stories_v1(list(chunk), amount=amount)
+
+        async with aclosing(iter_concurrent(fetch, chunks, concurrency)) as results:
+            async for chunk, stories in results:
+                for user_id in chunk:
+                    yield user_id, stories if isinstance(stories, Exception) else stories[user_id]
+
     async def user_stories(self, user_id: str, amount: Optional[int] = None) -> List[Story]:
         """
         Get a user's stories
@@ -392,7 +483,7 @@ class StoryMixin(ClientMixin):
             for reel in self._archive_story_reels(result):
                 for item in reel.get("items", []):
                     story = extract_story_v1(item)
-                    self._stories_cache[story.pk] = story
+                    self._stories_cache[story.pk] = freeze(story)
                     stories.append(story)
                     if amount and len(stories) >= amount:
                         return stories
@@ -476,9 +567,7 @@ class StoryMixin(ClientMixin):
             raise Exception("The URL must contain the path to the file (mp4 or jpg)")
         filename = "%s.%s" % (filename, fname.rsplit(".", 1)[1]) if filename else fname
         path = Path(folder) / filename
-        response = await self.public.get(url)
-        response.raise_for_status()
-        return self._download_response_to_path(response, path)
+        return await self._download_to_path(url, path)
 
     async def story_viewers_chunk(
         self, story_pk: str, max_amount: int = 0, max_id: str = ""
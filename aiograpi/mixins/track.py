@@ -49,9 +49,9 @@ class TrackMixin(ClientMixin):
             raise Exception("The URL must contain the path to the file (m4a or mp3).")
         filename = "%s.%s" % (filename, fname.rsplit(".", 1)[1]) if filename else fname
         path = Path(folder) / filename
-        response = await httpx_ext.request("GET", url, timeout=self.request_timeout)
-        response.raise_for_status()
-        return self._download_response_to_path(response, path)
+        async with httpx_ext.stream("GET", url, timeout=self.request_timeout) as response:
+            response.raise_for_status()
+            return await self._download_response_to_path(response, path)
 
     async def _track_request(self, data: Dict[str, Any], path: str = "clips/music/") -> Dict:
         try:
@@ -1,10 +1,11 @@
 import json
 import logging
-from copy import deepcopy
-from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Sequence, Tuple, Union
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Dict, Iterable, List, Literal, MutableMapping, Optional, Sequence, Tuple, Union
 
 from orjson import JSONDecodeError
 
+from aiograpi.cache import freeze, mutable_copy
 from aiograpi.exceptions import (
     ClientError,
     ClientGraphqlError,
@@ -37,7 +38,7 @@ from aiograpi.types import (
     User,
     UserShort,
 )
-from aiograpi.utils.iterators import iter_paginated
+from aiograpi.utils.iterators import iter_concurrent, iter_paginated
 from aiograpi.utils.serialization import dumps, json_value
 
 MAX_USER_COUNT = 200
@@ -62,11 +63,12 @@ class UserMixin(ClientMixin):
     Helpers to manage user
     """
 
-    _users_cache: Dict[str, User] = {}  # user_pk -> User
-    _userhorts_cache: Dict[str, UserShort] = {}  # user_pk -> UserShort
-    _usernames_cache: Dict[str, str] = {}  # username -> user_pk
-    _users_following: Dict[Any, Any] = {}  # user_pk -> dict(user_pk -> "short user object")
-    _users_followers: Dict[Any, Any] = {}  # user_pk -> dict(user_pk -> "short user object")
+    # Bound per client by CacheMixin (see aiograpi.cache.ClientCache)
+    _users_cache: MutableMapping[str, User]  # user_pk -> User
+    _userhorts_cache: MutableMapping[str, UserShort]  # user_pk -> UserShort
+    _usernames_cache: MutableMapping[str, str]  # username -> user_pk
+    _users_following: MutableMapping[Any, Any]  # user_pk -> dict(user_pk -> "short user object")
+    _users_followers: MutableMapping[Any, Any]  # user_pk -> dict(user_pk -> "short user object")
 
     @staticmethod
     def _normalize_username(username: str) -> str:
@@ -402,7 +404,7 @@ class UserMixin(ClientMixin):
             return extract_user_v1(user)
         raise UserNotFound("User not found", username=username, **self.last_json)
 
-    async def user_info_by_username(self, username: str) -> User:
+    async def user_info_by_username(self, username: str, copy: bool = False) -> User:
         """
         Get user object from username
 
@@ -410,6 +412,8 @@ class UserMixin(ClientMixin):
         ----------
         username: str
             User name of an instagram account
+        copy: bool, optional
+            Return a mutable copy instead of the shared read-only cached object, default value is False
 
         Returns
         -------
@@ -417,7 +421,8 @@ class UserMixin(ClientMixin):
             An object of User type
         """
         username = self._normalize_username(username)
-        if username not in self._usernames_cache:
+        user_id = self._usernames_cache.get(username)
+        if user_id is None:
             if self._has_private_auth():
                 try:
                     user = await self.user_info_by_username_v1(username)
@@ -432,9 +437,10 @@ class UserMixin(ClientMixin):
                     if not isinstance(e, ClientError):
                         self.logger.exception(e)
                     user = await self.user_info_by_username_v1(username)
-            self._users_cache[str(user.pk)] = user
-            self._usernames_cache[user.username] = str(user.pk)
-        return await self.user_info(self._usernames_cache[username])
+            user_id = str(user.pk)
+            self._users_cache[user_id] = freeze(user)
+            self._usernames_cache[user.username] = user_id
+        return await self.user_info(user_id, copy=copy)
 
     async def user_info_gql(self, user_id: str) -> User:
         """
@@ -536,7 +542,7 @@ class UserMixin(ClientMixin):
             raise e
         return extract_about_v1(self.last_json)
 
-    async def user_info(self, user_id: str) -> User:
+    async def user_info(self, user_id: str, copy: bool = False) -> User:
         """
         Get user object from user id
 
@@ -544,6 +550,8 @@ class UserMixin(ClientMixin):
         ----------
         user_id: str
             User id of an instagram account
+        copy: bool, optional
+            Return a mutable copy instead of the shared read-only cached object, default value is False
 
         Returns
         -------
@@ -551,7 +559,8 @@ class UserMixin(ClientMixin):
             An object of User type
         """
         user_id = str(user_id)
-        if user_id not in self._users_cache:
+        user = self._users_cache.get(user_id)
+        if user is None:
             if self._has_private_auth():
                 try:
                     user = await self.user_info_v1(user_id)
@@ -566,9 +575,83 @@ class UserMixin(ClientMixin):
                     if not isinstance(e, ClientError):
                         self.logger.exception(e)
                     user = await self.user_info_v1(user_id)
-            self._users_cache[user_id] = user
+            user = self._users_cache[user_id] = freeze(user)
             self._usernames_cache[user.username] = str(user.pk)
-        return deepcopy(self._users_cache[user_id])
+        return mutable_copy(user) if copy else user
+
+    async def iter_user_info_many(
+        self,
+        user_ids: Iterable[str],
+        concurrency: int = 4,
+        copy: bool = False,
+    ) -> AsyncIterator[Tuple[str, Union[User, Exception]]]:
+        """
+        Iterate over user objects of many user ids as they are fetched
+
+        Duplicate ids are fetched once, cached users are yielded first, and
+        the rest go through :meth:`user_info` (private API with public
+        fallback) with at most ``concurrency`` requests in flight, still
+        paced by the client's rate limiter.
+
+        Parameters
+        ----------
+        user_ids: Iterable[str]
+            User ids of instagram accounts
+        concurrency: int, optional
+            Maximum number of users fetched at once, default is 4
+        copy: bool, optional
+            Yield mutable copies instead of the shared read-only cached objects, default value is False
+
+        Returns
+        -------
+        AsyncIterator[Tuple[str, Union[User, Exception]]]
+            Async iterator of (user_id, User) pairs in completion order; the
+            exception is yielded in place of the User when a lookup fails
+        """
+        missing = []
+        for user_id in dict.fromkeys(str(user_id) for user_id in user_ids):
+            user = self._users_cache.get(user_id)
+            if user is None:
+                missing.append(user_id)
+            else:
+                yield user_id, mutable_copy(user) if copy else user
+
+        async def fetch(user_id: str) -> User:
+            return await self.user_info(user_id, copy=copy)
+
+        async with aclosing(iter_concurrent(fetch, missing, concurrency)) as results:
+            async for item in results:
+                yield item
+
+    async def user_info_many(
+        self,
+        user_ids: Iterable[str],
+        concurrency: int = 4,
+        copy: bool = False,
+    ) -> Dict[str, Union[User, Exception]]:
+        """
+        Get user objects of many user ids concurrently
+
+        Parameters
+        ----------
+        user_ids: Iterable[str]
+            User ids of instagram accounts
+        concurrency: int, optional
+            Maximum number of users fetched at once, default is 4
+        copy: bool, optional
+            Return mutable copies instead of the shared read-only cached objects, default value is False
+
+        Returns
+        -------
+        Dict[str, Union[User, Exception]]
+            Dict of user_id and User object (or the exception raised for
+            that user), in the order of ``user_ids``
+        """
+        user_ids = list(dict.fromkeys(str(user_id) for user_id in user_ids))
+        results = {}
+        async for user_id, user in self.iter_user_info_many(user_ids, concurrency=concurrency, copy=copy):
+            results[user_id] = user
+        return {user_id: results[user_id] for user_id in user_ids}
 
     async def new_feed_exist(self) -> bool:
         """
@@ -949,8 +1032,8 @@ class UserMixin(ClientMixin):
             Dict of user_id and User object
         """
         user_id = str(user_id)
-        users: Any = self._users_following.get(user_id, {})
-        if not use_cache or not users or (amount and len(users) < amount):
+        following = self._users_following.get(user_id, {})
+        if not use_cache or not following or (amount and len(following) < amount):
             if self._has_private_auth():
                 try:
                     users = await self.user_following_v1(user_id, amount)
@@ -965,8 +1048,8 @@ class UserMixin(ClientMixin):
                     if not isinstance(e, ClientError):
                         self.logger.exception(e)
                     users = await self.user_following_v1(user_id, amount)
-            self._users_following[user_id] = {user.pk: user for user in users}
-        following = self._users_following[user_id]
+            following = {user.pk: user for user in users}
+            self._users_following[user_id] = following
         if amount and len(following) > amount:
             following = dict(list(following.items())[:amount])
         return following
@@ -1309,8 +1392,8 @@ class UserMixin(ClientMixin):
         if order:
             users = await self.user_followers_v1(user_id, amount, order=order)
             return {user.pk: user for user in users}
-        users = self._users_followers.get(user_id, {})
-        if not use_cache or not users or (amount and len(users) < amount):
+        followers = self._users_followers.get(user_id, {})
+        if not use_cache or not followers or (amount and len(followers) < amount):
             if self._has_private_auth():
                 try:
                     users = await self.user_followers_v1(user_id, amount)
@@ -1327,8 +1410,8 @@ class UserMixin(ClientMixin):
                     if not isinstance(e, ClientError):
                         self.logger.exception(e)
                     users = await self.user_followers_v1(user_id, amount)
-            self._users_followers[user_id] = {user.pk: user for user in users}
-        followers = self._users_followers[user_id]
+            followers = {user.pk: user for user in users}
+            self._users_followers[user_id] = followers
         if amount and len(followers) > amount:
             followers = dict(list(followers.items())[:amount])
         return followers
@@ -36,7 +36,7 @@ from aiograpi.types import (
 )
 from aiograpi.utils.serialization import dumps
 from aiograpi.utils.timing import date_time_original
-from aiograpi.utils.upload import with_coauthor_user_ids
+from aiograpi.utils.upload import FileBody, RuploadState, with_coauthor_user_ids
 from aiograpi.utils.video import MOVIEPY_2_INSTALL_MESSAGE, analyze_video_for_upload
 
 
@@ -76,6 +76,8 @@ class DownloadVideoMixin(ClientMixin):
         filename: str = "",
         folder: Path = "",
         overwrite: bool = True,
+        resume: bool = False,
+        segments: int = 1,
     ) -> Path:
         """
         Download video using URL
@@ -92,6 +94,11 @@ class DownloadVideoMixin(ClientMixin):
         overwrite: bool, optional
             Whether to overwrite an existing file. When False and the target path already exists, skip download and
                 return the existing path.
+        resume: bool, optional
+            Keep a failed download in "<filename>.part" and continue it with a Range request on the next call,
+                default False
+        segments: int, optional
+            Split files of several MB into up to this many ranged segments downloaded concurrently, default 1
 
         Returns
         -------
@@ -104,9 +111,7 @@ class DownloadVideoMixin(ClientMixin):
         path = Path(folder) / filename
         if path.exists() and not overwrite:
             return path.resolve()
-        response = await self.public.get(url)
-        response.raise_for_status()
-        return self._download_response_to_path(response, path)
+        return await self._download_to_path(url, path, resume=resume, segments=segments)
 
     async def video_download_by_url_origin(self, url: str) -> bytes:
         """
@@ -354,6 +359,7 @@ class UploadVideoMixin(ClientMixin):
         to_album: bool = False,
         to_story: bool = False,
         to_direct: bool = False,
+        upload_id: str = "",
     ) -> tuple:
         """
         Upload video to Instagram
@@ -367,6 +373,8 @@ class UploadVideoMixin(ClientMixin):
         to_album: bool, optional
         to_story: bool, optional
         to_direct: bool, optional
+        upload_id: str, optional
+            Unique upload_id (String). When empty, then generate automatically
 
         Returns
         -------
@@ -375,11 +383,14 @@ class UploadVideoMixin(ClientMixin):
         """
         if not isinstance(path, Path):
             raise Exception(f"Path must been Path, now {path} ({type(path)})")
-        upload_id = str(int(time.time() * 1000))
+        upload_id = upload_id or str(int(time.time() * 1000))
         width, height, duration, thumbnail = analyze_video(path, thumbnail)
         waterfall_id = str(uuid4())
         # upload_name example: '1576102477530_0_7823256191'
         upload_name = "{upload_id}_0_{rand}".format(upload_id=upload_id, rand=random.randint(1000000000, 9999999999))
+        kind = f"video:{int(to_album)}{int(to_story)}{int(to_direct)}"
+        state = self._rupload_resume(path, kind, RuploadState(upload_id, upload_name, waterfall_id))
+        upload_id, upload_name, waterfall_id = state.upload_id, state.upload_name, state.waterfall_id
         rupload_params = {
             "retry_context": '{"num_step_auto_retry":0,"num_reupload":0,"num_step_manual_retry":0}',
             "media_type": "2",
@@ -411,33 +422,40 @@ class UploadVideoMixin(ClientMixin):
         }
         if to_album:
             headers = {"Segment-Start-Offset": "0", "Segment-Type": "3", **headers}
-        response = await self.private.get(
-            "https://{domain}/rupload_igvideo/{name}".format(domain=config.API_DOMAIN, name=upload_name),
-            headers=headers,
-        )
-        self.request_log(response)
-        if response.status_code != 200:
-            raise VideoNotUpload(response.text, response=response, **self.last_json)
-        with open(path, "rb") as fp:
-            video_data = fp.read()
-            video_len = str(len(video_data))
-        headers = {
-            "Offset": "0",
-            "X-Entity-Name": upload_name,
-            "X-Entity-Length": video_len,
-            "Content-Type": "application/octet-stream",
-            "Content-Length": video_len,
-            "X-Entity-Type": "video/mp4",
-            **headers,
-        }
-        response = await self.private.post(
-            "https://{domain}/rupload_igvideo/{name}".format(domain=config.API_DOMAIN, name=upload_name),
-            data=video_data,
-            headers=headers,
-        )
-        self.request_log(response)
-        if response.status_code != 200:
-            raise VideoNotUpload(response.text, response=response, **self.last_json)
+        url = "https://{domain}/rupload_igvideo/{name}".format(domain=config.API_DOMAIN, name=upload_name)
+        video_len = path.stat().st_size
+
+        def check(response, stage: str):
+            self.request_log(response)
+            if response.status_code != 200:
+                raise VideoNotUpload(response.text, response=response, **self.last_json)
+
+        async def init():
+            response = await self.private.get(url, headers=headers)
+            check(response, "rupload_init")
+            return response
+
+        async def upload(offset: int):
+            response = await self.private.post(
+                url,
+                content=FileBody(path, offset),
+                headers={
+                    "Offset": str(offset),
+                    "X-Entity-Name": upload_name,
+                    "X-Entity-Length": str(video_len),
+                    "Content-Type": "application/octet-stream",
+                    "Content-Length": str(video_len - offset),
+                    "X-Entity-Type": "video/mp4",
+                    **headers,
+                },
+            )
+            check(response, "rupload_upload")
+            return response
+
+        if self._rupload_segmented(video_len):
+            await self._rupload_segments(path, kind, state, url, headers, check)
+        else:
+            await self._rupload(path, kind, state, init, upload)
         return upload_id, width, height, duration, Path(thumbnail)
 
     async def video_upload(
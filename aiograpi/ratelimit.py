@@ -0,0 +1,241 @@
+import asyncio
+import random
+import re
+import time
+from typing import Callable, Dict, Iterable, Optional, Tuple, Union
+
+from aiograpi.exceptions import (
+    ClientThrottledError,
+    FeedbackRequired,
+    PleaseWaitFewMinutes,
+    RateLimitError,
+)
+
+# Responses that mean "slow down" for record_response(throttled=True)
+THROTTLE_EXCEPTIONS = (ClientThrottledError, FeedbackRequired, PleaseWaitFewMinutes, RateLimitError)
+_VERSION_PREFIX = re.compile(r"^/?(?:api/)?v\d+/")
+
+
+def endpoint_family(endpoint: str) -> str:
+    """
+    Group a private API endpoint by its first path segment
+
+    ``"/v1/friendships/create/1/"`` and ``"friendships/show/1/"`` are both
+    ``"friendships"``; ``"feed/timeline/"`` is ``"feed"``.
+    """
+    endpoint = _VERSION_PREFIX.sub("", endpoint.lstrip("/"))
+    return endpoint.split("/", 1)[0] or "default"
+
+
+class RateLimiter:
+    """
+    Decides how long a client waits before each request.
+
+    ``acquire(family)`` is awaited right before a request of ``family`` (see
+    :func:`endpoint_family`, ``"login"`` for login requests, ``"graphql_www"``
+    and ``"public"`` for GraphQL and public web requests) is sent and
+    ``record_response(family, throttled)`` right after its response arrives,
+    with ``throttled=True`` when Instagram pushed back (429,
+    PleaseWaitFewMinutes, RateLimitError, FeedbackRequired). One instance can
+    be passed to several clients to pace them as a pool.
+    """
+
+    async def acquire(self, family: str = "default", cost: float = 1) -> None:
+        return None
+
+    def record_response(self, family: str = "default", throttled: bool = False) -> None:
+        return None
+
+
+class FixedDelayRateLimiter(RateLimiter):
+    """
+    Sleep ``delay`` seconds before every request (except ``exempt`` families)
+    and add a random ``burst_delay`` when the previous response arrived less
+    than ``burst_window`` seconds ago.
+
+    This is the historical aiograpi policy: ``Client`` uses it with
+    ``delay=request_timeout`` and ``last_response`` reading the client's
+    ``last_response_ts`` (stamped by private, public and public GraphQL
+    responses) unless another limiter is configured. Requests of ``unpaced``
+    families are never delayed but their responses still count for
+    ``burst_window``: public requests keep their own one-second spacing, as
+    before. ``steady`` families (``graphql_www``) only sleep ``delay`` and
+    their responses do not open the burst window.
+    """
+
+    def __init__(
+        self,
+        delay: Union[float, Callable[[], float]] = 1,
+        burst_delay: Tuple[float, float] = (0.75, 3.75),
+        burst_window: float = 1.0,
+        exempt: Iterable[str] = ("login",),
+        unpaced: Iterable[str] = ("public",),
+        steady: Iterable[str] = ("graphql_www",),
+        last_response: Optional[Callable[[], float]] = None,
+    ):
+        self.delay = delay
+        self.burst_delay = burst_delay
+        self.burst_window = burst_window
+        self.exempt = frozenset(exempt)
+        self.unpaced = frozenset(unpaced)
+        self.steady = frozenset(steady)
+        self.last_response = last_response
+        self.last_response_ts = 0.0
+
+    async def acquire(self, family: str = "default", cost: float = 1) -> None:
+        if family in self.unpaced:
+            return
+        if family not in self.steady:
+            last_response_ts = self.last_response() if self.last_response else self.last_response_ts
+            if last_response_ts and (time.time() - last_response_ts) < self.burst_window:
+                await asyncio.sleep(random.uniform(*self.burst_delay))
+        if family in self.exempt:
+            return
+        delay = self.delay() if callable(self.delay) else self.delay
+        if delay:
+            await asyncio.sleep(delay)
+
+    def record_response(self, family: str = "default", throttled: bool = False) -> None:
+        if family not in self.steady:
+            self.last_response_ts = time.time()
+
+
+class _Bucket:
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, cost: float, now: float) -> float:
+        """Take ``cost`` tokens (possibly into debt) and return the wait in seconds."""
+        self.refill(now)
+        self.tokens -= cost
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate if self.rate > 0 else float("inf")
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    """
+    Token bucket: up to ``burst`` requests go out back to back, after which
+    requests are paced at ``rate`` per second. With ``burst=1`` it behaves as
+    a leaky bucket.
+
+    ``families`` gives selected endpoint families their own
+    ``(rate, burst)`` bucket on top of the shared one, e.g.
+    ``{"friendships": (0.05, 3)}`` to follow/unfollow at most every 20 s.
+    Requests of ``exempt`` families are never delayed.
+
+    Waiting callers reserve their tokens up front, so concurrent requests
+    are released in arrival order without a lock.
+    """
+
+    def __init__(
+        self,
+        rate: float = 1.0,
+        burst: float = 10,
+        families: Optional[Dict[str, Tuple[float, float]]] = None,
+        exempt: Iterable[str] = ("login",),
+    ):
+        self.bucket = _Bucket(rate, burst)
+        self.family_buckets = {family: _Bucket(*limits) for family, limits in (families or {}).items()}
+        self.exempt = frozenset(exempt)
+
+    def delay_for(self, family: str = "default", cost: float = 1) -> float:
+        """Reserve ``cost`` tokens for ``family`` and return how long to wait."""
+        if family in self.exempt:
+            return 0.0
+        now = time.monotonic()
+        delay = self.bucket.reserve(cost, now)
+        bucket = self.family_buckets.get(family)
+        if bucket is not None:
+            delay = max(delay, bucket.reserve(cost, now))
+        return delay
+
+    async def acquire(self, family: str = "default", cost: float = 1) -> None:
+        delay = self.delay_for(family, cost)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class AdaptiveRateLimiter(TokenBucketRateLimiter):
+    """
+    Token bucket whose rate follows AIMD (additive increase, multiplicative
+    decrease), like TCP congestion control.
+
+    Every successful response raises the rate by ``increase`` requests per
+    second up to ``max_rate`` (the starting ``rate`` by default); a throttle
+    signal multiplies it by ``decrease`` (down to ``min_rate``) and drops the
+    remaining burst. Throttles within ``cooldown`` seconds of the last
+    decrease count as the same event, so a batch of concurrent requests
+    rejected together halves the rate once, not once per request.
+
+    A throttled request of a family with its own bucket (see ``families``)
+    only slows that family. Share one instance between the clients of an
+    account or a proxy to adapt them together; the current rate is
+    ``limiter.rate`` (or ``rate_for(family)``).
+    """
+
+    def __init__(
+        self,
+        rate: float = 1.0,
+        burst: float = 10,
+        min_rate: float = 0.01,
+        max_rate: Optional[float] = None,
+        increase: float = 0.01,
+        decrease: float = 0.5,
+        cooldown: float = 5.0,
+        families: Optional[Dict[str, Tuple[float, float]]] = None,
+        exempt: Iterable[str] = ("login",),
+    ):
+        super().__init__(rate=rate, burst=burst, families=families, exempt=exempt)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        # bucket key (family name, None for the shared bucket) -> ceiling / last decrease
+        self._max_rates: Dict[Optional[str], float] = {None: self.bucket.rate}
+        self._max_rates.update({family: bucket.rate for family, bucket in self.family_buckets.items()})
+        self._decreased_at: Dict[Optional[str], float] = {}
+
+    @property
+    def rate(self) -> float:
+        return self.bucket.rate
+
+    def rate_for(self, family: str = "default") -> float:
+        return self.family_buckets.get(family, self.bucket).rate
+
+    def record_response(self, family: str = "default", throttled: bool = False) -> None:
+        if family in self.exempt:
+            return
+        key = family if family in self.family_buckets else None
+        bucket = self.family_buckets[family] if key is not None else self.bucket
+        now = time.monotonic()
+        bucket.refill(now)
+        if throttled:
+            if now - self._decreased_at.get(key, float("-inf")) < self.cooldown:
+                return
+            self._decreased_at[key] = now
+            bucket.rate = max(self.min_rate, bucket.rate * self.decrease)
+            bucket.tokens = min(bucket.tokens, 0.0)
+        else:
+            max_rate = self.max_rate if self.max_rate is not None else self._max_rates[key]
+            bucket.rate = min(max_rate, bucket.rate + self.increase)
+
+
+__all__ = [
+    "AdaptiveRateLimiter",
+    "FixedDelayRateLimiter",
+    "RateLimiter",
+    "THROTTLE_EXCEPTIONS",
+    "TokenBucketRateLimiter",
+    "endpoint_family",
+]
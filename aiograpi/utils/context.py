@@ -0,0 +1,36 @@
+from contextvars import ContextVar
+from typing import Any, Dict
+
+
+class TaskLocal:
+    """
+    Client attribute whose value is local to the current asyncio task.
+
+    A value set while a request runs is visible to the code awaiting that
+    request (same task), but not to requests running concurrently in other
+    tasks (``asyncio.gather``, ``asyncio.create_task``): each task starts from
+    a copy of its parent's context, so concurrent requests on one client
+    never see each other's ``last_json`` / ``last_response``.
+    """
+
+    def __init__(self, default: Any = None):
+        self.default = default
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def _var(self, obj: Any) -> ContextVar:
+        variables: Dict[str, ContextVar] = obj.__dict__.setdefault("_task_local_vars", {})
+        var = variables.get(self.name)
+        if var is None:
+            var = variables[self.name] = ContextVar(f"{type(obj).__name__}.{self.name}")
+        return var
+
+    def __get__(self, obj: Any, objtype: Any = None) -> Any:
+        if obj is None:
+            return self
+        return self._var(obj).get(self.default)
+
+    def __set__(self, obj: Any, value: Any):
+        self._var(obj).set(value)
@@ -1,6 +1,8 @@
-from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
-from typing import TypeVar
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Iterable, Sequence
+from typing import TypeVar, cast
 
+K = TypeVar("K")
 T = TypeVar("T")
 Cursor = str | None
 PageFetcher = Callable[[Cursor, int], Awaitable[tuple[Sequence[T], Cursor]]]
@@ -38,3 +40,85 @@ async def iter_paginated(
         if not next_cursor or next_cursor == cursor:
             return
         cursor = next_cursor
+
+
+_WORKER_DONE = object()
+
+
+async def iter_concurrent(
+    fetch: Callable[[K], Awaitable[T]],
+    keys: Iterable[K],
+    concurrency: int = 4,
+) -> AsyncGenerator[tuple[K, T | Exception], None]:
+    """
+    Run ``fetch(key)`` for every key with at most ``concurrency`` calls in
+    flight and yield ``(key, result)`` pairs in completion order.
+
+    A call that raises yields ``(key, exception)`` instead of failing the
+    batch. Leaving the loop early cancels the calls still running.
+    """
+    keys = iter(keys)
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def worker():
+        try:
+            for key in keys:
+                try:
+                    result = await fetch(key)
+                except Exception as exc:
+                    result = exc
+                queue.put_nowait((key, result))
+        finally:
+            queue.put_nowait(_WORKER_DONE)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(max(1, int(concurrency)))]
+    try:
+        running = len(workers)
+        while running:
+            item = await queue.get()
+            if item is _WORKER_DONE:
+                running -= 1
+                continue
+            yield item
+        await asyncio.gather(*workers)
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+async def gather_concurrent(
+    jobs: Sequence[Callable[[], Awaitable[T]]],
+    concurrency: int = 4,
+    discard: Callable[[T], object] | None = None,
+) -> list[T]:
+    """
+    Run every job with at most ``concurrency`` in flight and return the
+    results in job order.
+
+    The first failure cancels the jobs still running, passes the finished
+    results to ``discard`` and is raised (the earliest failed job wins).
+    """
+    semaphore = asyncio.Semaphore(max(1, int(concurrency)))
+
+    async def run(job):
+        async with semaphore:
+            return await job()
+
+    tasks = [asyncio.ensure_future(run(job)) for job in jobs]
+    if not tasks:
+        return []
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    failed = [task for task in tasks if not task.cancelled() and task.exception()]
+    if failed:
+        if discard:
+            for task in tasks:
+                if not task.cancelled() and not task.exception():
+                    discard(task.result())
+        raise cast(BaseException, failed[0].exception())
+    return [task.result() for task in tasks]
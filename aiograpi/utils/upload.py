@@ -1,6 +1,122 @@
-from typing import Dict, List, Optional, Union
+import asyncio
+import hashlib
+import json
+import os
+import uuid
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional, Union
 
 COAUTHOR_EXTRA_DATA_KEYS = ("invite_coauthor_user_ids", "invite_coauthor_user_id")
+UPLOAD_CHUNK_SIZE = 256 * 1024
+
+
+class FileBody:
+    """
+    Request body that streams ``length`` bytes of a file from ``offset``.
+
+    Chunks are read in a worker thread as the request is sent, so only one
+    chunk is held in memory. Every ``async for`` reopens the file, which
+    lets a retried request send the body again. There is no ``__len__``:
+    pass the size as the ``Content-Length`` header.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        offset: int = 0,
+        length: Optional[int] = None,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+    ):
+        self.path = Path(path)
+        self.offset = offset
+        self.length = length
+        self.chunk_size = chunk_size
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        remaining = self.length
+        with open(self.path, "rb") as fp:
+            fp.seek(self.offset)
+            while remaining is None or remaining > 0:
+                size = self.chunk_size if remaining is None else min(self.chunk_size, remaining)
+                chunk = await asyncio.to_thread(fp.read, size)
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+
+@dataclass
+class RuploadState:
+    """
+    Identity of a rupload session and the last offset the server confirmed.
+
+    A segmented upload also keeps its ``stream_id``, the ``segment_size`` it
+    was cut with, the entity name of every started segment (by start
+    offset) and the start offsets of the finished ones.
+    """
+
+    upload_id: str
+    upload_name: str
+    waterfall_id: str
+    offset: int = 0
+    stream_id: str = ""
+    segment_size: int = 0
+    segments: Dict[int, str] = field(default_factory=dict)
+    segments_done: List[int] = field(default_factory=list)
+
+
+class RuploadStateStore:
+    """
+    Keeps :class:`RuploadState` as small JSON files in ``directory``.
+
+    A state is keyed by the upload kind, the resolved file path, its size
+    and its mtime, so an edited or replaced file starts a new upload. Files
+    are written through a temporary name and renamed, so a crash never
+    leaves a half-written state behind.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, path: Union[str, Path], kind: str) -> Path:
+        path = Path(path).resolve()
+        stat = path.stat()
+        key = f"{kind}\0{path}\0{stat.st_size}\0{stat.st_mtime_ns}"
+        return self.directory / (hashlib.sha256(key.encode()).hexdigest() + ".json")
+
+    def load(self, path: Union[str, Path], kind: str) -> Optional[RuploadState]:
+        try:
+            data = json.loads(self.path_for(path, kind).read_text())
+            return RuploadState(
+                upload_id=str(data["upload_id"]),
+                upload_name=str(data["upload_name"]),
+                waterfall_id=str(data["waterfall_id"]),
+                offset=int(data.get("offset", 0)),
+                stream_id=str(data.get("stream_id", "")),
+                segment_size=int(data.get("segment_size", 0)),
+                segments={int(start): str(name) for start, name in data.get("segments", {}).items()},
+                segments_done=[int(start) for start in data.get("segments_done", [])],
+            )
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+
+    def save(self, path: Union[str, Path], kind: str, state: RuploadState):
+        dest = self.path_for(path, kind)
+        tmp = dest.with_name(f".{dest.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp.write_text(json.dumps(asdict(state)))
+            os.replace(tmp, dest)
+        finally:
+            tmp.unlink(missing_ok=True)
+
+    def discard(self, path: Union[str, Path], kind: str):
+        try:
+            self.path_for(path, kind).unlink(missing_ok=True)
+        except OSError:
+            pass
 
 
 def with_coauthor_user_ids(
@@ -0,0 +1,67 @@
+"""
+Per-hit latency of ``media_info`` cache hits: deepcopy per hit (previous
+behaviour, still available as ``copy=True``) vs the shared read-only object.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+from aiograpi import Client
+from aiograpi.types import Media, Resource, UserShort, Usertag
+
+HITS = 2000
+
+
+def carousel_media(slides: int = 10, tags_per_slide: int = 5) -> Media:
+    def user(pk):
+        return UserShort(pk=str(pk), username=f"user{pk}", profile_pic_url="https://example.com/p.jpg")
+
+    return Media(
+        pk="111",
+        id="111_222",
+        code="code",
+        taken_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        media_type=8,
+        user=user(222),
+        like_count=10,
+        caption_text="caption " * 50,
+        usertags=[Usertag(user=user(i), x=0.5, y=0.5) for i in range(tags_per_slide)],
+        sponsor_tags=[],
+        resources=[
+            Resource(
+                pk=str(1000 + i),
+                media_type=2,
+                thumbnail_url=f"https://example.com/{i}.jpg",
+                video_url=f"https://example.com/{i}.mp4",
+                usertags=[Usertag(user=user(i * 10 + j), x=0.1, y=0.9) for j in range(tags_per_slide)],
+            )
+            for i in range(slides)
+        ],
+        clips_metadata={"music_info": {"music_asset_info": {"title": "t" * 200}}, "audio_type": "licensed_music"},
+    )
+
+
+async def per_hit_us(client: Client, copy: bool) -> float:
+    started = time.perf_counter()
+    for _ in range(HITS):
+        await client.media_info("111", copy=copy)
+    return (time.perf_counter() - started) / HITS * 1e6
+
+
+async def main():
+    client = Client()
+    client.authorization_data = {"sessionid": "sessionid-value", "ds_user_id": "1"}
+    client.media_info_v1 = AsyncMock(return_value=carousel_media())
+    await client.media_info("111")  # warm the cache
+
+    before = await per_hit_us(client, copy=True)
+    after = await per_hit_us(client, copy=False)
+    print(f"media_info hit, deepcopy (copy=True): {before:9.2f} us")
+    print(f"media_info hit, shared (default):     {after:9.2f} us")
+    print(f"speedup: {before / after:.0f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,104 @@
+"""
+Concurrent throughput of the curl public transport: the previous
+thread-backed session (requests + CurlCffiAdapter run through
+asyncio.to_thread, one executor thread per in-flight request) vs the
+native async CurlSession, against a local server that answers after a
+fixed latency.
+
+Needs ``pip install "aiograpi[curl]" curl-adapter``.
+"""
+
+import asyncio
+import threading
+import time
+
+from aiograpi import httpx_ext
+
+REQUESTS = 400
+CONCURRENCY = 200
+LATENCY = 0.05
+REPEATS = 3
+BODY = b'{"status":"ok"}'
+
+
+async def handle(reader, writer):
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            if not head:
+                break
+            await asyncio.sleep(LATENCY)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n%s" % (len(BODY), BODY)
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+def start_server() -> str:
+    started = threading.Event()
+    address = []
+
+    async def serve():
+        server = await asyncio.start_server(handle, "127.0.0.1", 0, backlog=1024)
+        address.append(server.sockets[0].getsockname()[1])
+        started.set()
+        await server.serve_forever()
+
+    threading.Thread(target=asyncio.run, args=(serve(),), daemon=True).start()
+    started.wait()
+    return f"http://127.0.0.1:{address[0]}/"
+
+
+class ThreadedCurlSession:
+    """The previous CurlSession request path."""
+
+    def __init__(self, impersonate="chrome136"):
+        import requests
+        from curl_adapter import CurlCffiAdapter
+
+        self._client = requests.Session()
+        adapter = CurlCffiAdapter(impersonate_browser_type=impersonate)
+        self._client.mount("https://", adapter)
+        self._client.mount("http://", adapter)
+
+    async def get(self, url):
+        return await asyncio.to_thread(self._client.request, "get", url, timeout=httpx_ext.DEFAULT_TIMEOUT)
+
+    async def _close(self):
+        self._client.close()
+
+
+async def requests_per_second(session, url: str) -> float:
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def fetch():
+        async with semaphore:
+            response = await session.get(url)
+            assert response.status_code == 200
+
+    await fetch()  # warm the connection
+    best = float("inf")
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        await asyncio.gather(*(fetch() for _ in range(REQUESTS)))
+        best = min(best, time.perf_counter() - started)
+    await session._close()
+    return REQUESTS / best
+
+
+async def main():
+    url = start_server()
+    threaded = await requests_per_second(ThreadedCurlSession(), url)
+    native = await requests_per_second(httpx_ext.CurlSession(max_clients=CONCURRENCY), url)
+    print(f"{REQUESTS} requests, {CONCURRENCY} concurrent, {LATENCY * 1000:.0f} ms server latency")
+    print(f"curl via asyncio.to_thread:  {threaded:8.0f} req/s")
+    print(f"curl AsyncSession:           {native:8.0f} req/s")
+    print(f"speedup: {native / threaded:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,78 @@
+"""
+Peak Python heap while downloading a large file from a local server:
+reading the whole body and writing it in one go (previous behaviour) vs
+streaming it to disk in fixed-size chunks.
+"""
+
+import asyncio
+import tempfile
+import threading
+import tracemalloc
+from pathlib import Path
+
+from aiograpi import Client
+
+SIZE = 64 * 1024 * 1024
+CHUNK = b"\0" * (1024 * 1024)
+
+
+async def handle(reader, writer):
+    try:
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: video/mp4\r\nContent-Length: %d\r\n\r\n" % SIZE)
+        for _ in range(SIZE // len(CHUNK)):
+            writer.write(CHUNK)
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+def start_server() -> str:
+    started = threading.Event()
+    address = []
+
+    async def serve():
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        address.append(server.sockets[0].getsockname()[1])
+        started.set()
+        await server.serve_forever()
+
+    threading.Thread(target=asyncio.run, args=(serve(),), daemon=True).start()
+    started.wait()
+    return f"http://127.0.0.1:{address[0]}/reel.mp4"
+
+
+async def buffered(client: Client, url: str, path: Path):
+    response = await client.public.get(url)
+    response.raise_for_status()
+    path.write_bytes(response.read())
+
+
+async def streamed(client: Client, url: str, path: Path):
+    await client.video_download_by_url(url, folder=path.parent)
+
+
+async def peak_mb(download, url: str) -> float:
+    client = Client()
+    with tempfile.TemporaryDirectory() as folder:
+        tracemalloc.start()
+        await download(client, url, Path(folder) / "reel.mp4")
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    await client.public._close()
+    return peak / 1024 / 1024
+
+
+async def main():
+    url = start_server()
+    before = await peak_mb(buffered, url)
+    after = await peak_mb(streamed, url)
+    print(f"{SIZE // 1024 // 1024} MB download")
+    print(f"  read body, write once:  {before:7.1f} MB peak")
+    print(f"  stream to temp file:    {after:7.1f} MB peak")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,93 @@
+"""
+Time to prepare a corpus of phone-camera photos for upload: full decode,
+crop/resize and JPEG re-encode of every image plus a second open for the
+size (previous behaviour) vs the reduced-scale JPEG decode and the
+pass-through of already compliant JPEGs.
+"""
+
+import io
+import tempfile
+import time
+from pathlib import Path
+
+from PIL import Image
+
+from aiograpi.image_util import calc_crop, calc_resize
+from aiograpi.mixins.photo import prepare_photo_upload
+
+ROUNDS = 3
+# (name, size, count): 12 MP sensors in both orientations, 16:9 crops, a
+# 48 MP sensor and photos already exported at Instagram's feed size
+CORPUS = [
+    ("12mp-landscape", (4032, 3024), 4),
+    ("12mp-portrait", (3024, 4032), 4),
+    ("16x9", (4032, 2268), 2),
+    ("48mp", (8064, 6048), 1),
+    ("exported", (1080, 1350), 4),
+]
+
+
+def photo(size) -> Image.Image:
+    detail = Image.effect_mandelbrot(size, (-2.2, -1.3, 0.9, 1.3), 64)
+    noise = Image.effect_noise(size, 48)
+    gradient = Image.linear_gradient("L").resize(size)
+    return Image.merge("RGB", (detail, noise, gradient))
+
+
+def write_corpus(folder: Path):
+    exif = Image.Exif()
+    exif[0x010F] = "Phone"  # Make
+    exif[0x0112] = 6  # Orientation
+    paths = []
+    for name, size, count in CORPUS:
+        image = photo(size)
+        for index in range(count):
+            path = folder / f"{name}-{index}.jpg"
+            image.save(path, "JPEG", quality=92, exif=exif.tobytes())
+            paths.append(path)
+    return paths
+
+
+def previous(path: str):
+    im = Image.open(path)
+    crop_box = calc_crop((4.0 / 5.0, 90.0 / 47.0), im.size)
+    if crop_box:
+        im = im.crop(crop_box)
+    new_size = calc_resize((1080, 1350), im.size, min_size=(320, 167))
+    if new_size:
+        im = im.resize(new_size)
+    if im.mode != "RGB":
+        im = im.convert("RGB")
+    b = io.BytesIO()
+    im.save(b, "JPEG")
+    with Image.open(path) as source:
+        width, height = source.size
+    return b.getvalue(), width, height
+
+
+def run(prepare, paths) -> float:
+    best = float("inf")
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        for path in paths:
+            prepare(str(path))
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    with tempfile.TemporaryDirectory() as folder:
+        paths = write_corpus(Path(folder))
+        print(f"{len(paths)} photos, best of {ROUNDS}")
+        for name, _, _ in CORPUS:
+            group = [path for path in paths if path.name.startswith(name + "-")]
+            before = run(previous, group) / len(group) * 1000
+            after = run(prepare_photo_upload, group) / len(group) * 1000
+            print(f"  {name:<15} {before:7.1f} ms -> {after:6.1f} ms per photo ({before / after:4.1f}x)")
+        before = run(previous, paths)
+        after = run(prepare_photo_upload, paths)
+        print(f"  {'corpus':<15} {before:7.2f} s  -> {after:6.2f} s  ({before / after:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
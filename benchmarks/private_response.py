@@ -0,0 +1,95 @@
+"""
+Per-response cost of turning a large private API body into ``last_json``:
+decoding the body to text for the debug log and then parsing the bytes
+(previous behaviour) vs parsing the bytes once with orjson.
+
+The bodies have the shape of a 200-user followers page and a 50-item
+timeline page, with fields and value lengths as Instagram returns them.
+"""
+
+import time
+
+import httpx
+import orjson
+
+REPEATS = 5
+ROUNDS = 50
+
+
+def followers_page(count: int = 200) -> bytes:
+    users = [
+        {
+            "pk": str(10**10 + i),
+            "pk_id": str(10**10 + i),
+            "username": f"follower_{i:05d}",
+            "full_name": f"Follower Number {i} ✨",
+            "is_private": i % 3 == 0,
+            "is_verified": False,
+            "profile_pic_id": f"{3 * 10**18 + i}_{10**10 + i}",
+            "profile_pic_url": "https://scontent-ams2-1.cdninstagram.com/v/t51.2885-19/"
+            f"{i}_n.jpg?stp=dst-jpg_s150x150&_nc_ht=scontent-ams2-1.cdninstagram.com&_nc_ohc=AbCdEf{i}&oh=00_AfD{i}",
+            "has_anonymous_profile_picture": False,
+            "latest_reel_media": 0,
+            "account_badges": [],
+        }
+        for i in range(count)
+    ]
+    return orjson.dumps({"users": users, "big_list": True, "page_size": count, "next_max_id": "QVFE", "status": "ok"})
+
+
+def timeline_page(count: int = 50) -> bytes:
+    items = [
+        {
+            "media_or_ad": {
+                "pk": str(3 * 10**18 + i),
+                "id": f"{3 * 10**18 + i}_{10**10}",
+                "code": f"C{i:09d}",
+                "taken_at": 1700000000 + i,
+                "media_type": 1,
+                "caption": {"text": "Caption with emoji \U0001f600 and #hashtags " * 8},
+                "image_versions2": {
+                    "candidates": [
+                        {
+                            "width": size,
+                            "height": size,
+                            "url": f"https://scontent.cdninstagram.com/v/t51.29350-15/{i}_{size}_n.jpg?_nc_ohc=XyZ{i}",
+                        }
+                        for size in (1080, 750, 640, 480, 320, 240, 150)
+                    ]
+                },
+                "like_count": 1000 + i,
+                "comment_count": i,
+                "user": {"pk": "10000000000", "username": "author", "full_name": "Author"},
+            }
+        }
+        for i in range(count)
+    ]
+    return orjson.dumps({"feed_items": items, "num_results": count, "more_available": True, "status": "ok"})
+
+
+def per_response_ms(content: bytes, decode_text: bool) -> float:
+    request = httpx.Request("GET", "https://i.instagram.com/api/v1/")
+    best = float("inf")
+    for _ in range(REPEATS):
+        responses = [httpx.Response(200, content=content, request=request) for _ in range(ROUNDS)]
+        started = time.perf_counter()
+        for response in responses:
+            if decode_text:
+                response.text.strip()
+            orjson.loads(response.content)
+        best = min(best, time.perf_counter() - started)
+    return best / ROUNDS * 1000
+
+
+def main():
+    for name, content in (("followers page", followers_page()), ("timeline page", timeline_page())):
+        before = per_response_ms(content, decode_text=True)
+        after = per_response_ms(content, decode_text=False)
+        print(f"{name} ({len(content) // 1024} KB)")
+        print(f"  text decode + parse:  {before:6.3f} ms")
+        print(f"  parse bytes once:     {after:6.3f} ms")
+        print(f"  speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
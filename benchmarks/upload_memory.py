@@ -0,0 +1,85 @@
+"""
+Peak Python heap while uploading a large file to a local server: reading
+the whole file into one request body (previous behaviour) vs streaming it
+from disk in fixed-size chunks.
+"""
+
+import asyncio
+import tempfile
+import threading
+import tracemalloc
+from pathlib import Path
+
+from aiograpi import Client
+from aiograpi.utils.upload import FileBody
+
+SIZE = 64 * 1024 * 1024
+
+
+async def handle(reader, writer):
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+        length = next(
+            int(line.split(b":", 1)[1]) for line in head.split(b"\r\n") if line.lower().startswith(b"content-length:")
+        )
+        while length:
+            length -= len(await reader.read(min(length, 1024 * 1024)))
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n{}")
+        await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+def start_server() -> str:
+    started = threading.Event()
+    address = []
+
+    async def serve():
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        address.append(server.sockets[0].getsockname()[1])
+        started.set()
+        await server.serve_forever()
+
+    threading.Thread(target=asyncio.run, args=(serve(),), daemon=True).start()
+    started.wait()
+    return f"http://127.0.0.1:{address[0]}/rupload_igvideo/name"
+
+
+async def buffered(client: Client, url: str, path: Path):
+    with open(path, "rb") as fp:
+        data = fp.read()
+    headers = {"Content-Length": str(len(data))}
+    await client.private.post(url, data=data, headers=headers)
+
+
+async def streamed(client: Client, url: str, path: Path):
+    headers = {"Content-Length": str(path.stat().st_size)}
+    await client.private.post(url, content=FileBody(path), headers=headers)
+
+
+async def peak_mb(upload, url: str, path: Path) -> float:
+    client = Client()
+    tracemalloc.start()
+    await upload(client, url, path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    await client.private._close()
+    return peak / 1024 / 1024
+
+
+async def main():
+    url = start_server()
+    with tempfile.TemporaryDirectory() as folder:
+        path = Path(folder) / "reel.mp4"
+        path.write_bytes(b"\0" * SIZE)
+        before = await peak_mb(buffered, url, path)
+        after = await peak_mb(streamed, url, path)
+    print(f"{SIZE // 1024 // 1024} MB upload")
+    print(f"  read file, post once:   {before:7.1f} MB peak")
+    print(f"  stream from disk:       {after:7.1f} MB peak")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
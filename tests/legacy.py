@@ -1,4 +1,5 @@
 import asyncio
+import contextlib
 import json
 import logging
 import os
@@ -1951,9 +1952,20 @@ class DownloadRegressionTestCase(unittest.IsolatedAsyncioTestCase):
         def read(self):
             return self.content
 
+        async def aiter_bytes(self, chunk_size=None):
+            yield self.content
+
         def raise_for_status(self):
             return None
 
+    @staticmethod
+    def _stream(response):
+        @contextlib.asynccontextmanager
+        async def stream(*args, **kwargs):
+            yield response
+
+        return stream
+
     async def test_photo_download_by_url_skips_existing_file_when_overwrite_disabled(
         self,
     ):
@@ -2024,7 +2036,7 @@ class DownloadRegressionTestCase(unittest.IsolatedAsyncioTestCase):
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "photo.jpg"
 
-            client.public.get = AsyncMock(return_value=response)
+            client.public.stream = self._stream(response)
             with self.assertRaises(ClientIncompleteReadError) as ctx:
                 await client.photo_download_by_url("https://example.com/photo.jpg", folder=tmpdir)
 
@@ -2049,7 +2061,7 @@ class DownloadRegressionTestCase(unittest.IsolatedAsyncioTestCase):
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "story.mp4"
 
-            client.public.get = AsyncMock(return_value=response)
+            client.public.stream = self._stream(response)
             with self.assertRaises(ClientIncompleteReadError) as ctx:
                 await client.story_download_by_url("https://example.com/story.mp4", folder=tmpdir)
 
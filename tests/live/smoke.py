@@ -101,7 +101,7 @@ async def main():
         print(f"opt anonymous_public_gql: {type(e).__name__}: {str(e)[:140]}")
 
     try:
-        import curl_adapter  # noqa: F401
+        import curl_cffi  # noqa: F401
 
         c = Client(public_transport="curl", public_request_retries_count=2)
         u = await c.user_info_by_username_gql("instagram")
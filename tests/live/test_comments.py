@@ -15,7 +15,7 @@ class ClientPublicCommentLiveTestCase(unittest.IsolatedAsyncioTestCase):
         code = "C_BM2yAN4Rm"
         transports = ["requests"]
         try:
-            import curl_adapter  # noqa: F401
+            import curl_cffi  # noqa: F401
         except ImportError:
             pass
         else:
@@ -13,7 +13,7 @@ from tests.live.smoke import _fetch_accounts
 class ClientPhotoDownloadLiveTestCase(unittest.IsolatedAsyncioTestCase):
     async def photo_clients(self, errors):
         try:
-            import curl_adapter  # noqa: F401
+            import curl_cffi  # noqa: F401
         except ImportError:
             pass
         else:
@@ -0,0 +1,360 @@
+import os
+import pickle
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+from pydantic import ValidationError
+
+from aiograpi import Client
+from aiograpi import cache as cache_module
+from aiograpi.cache import ClientCache, LRUCache, MediaFileCache, freeze, media_asset_key, mutable_copy
+from aiograpi.types import Media, Resource, UserShort
+
+
+def _carousel_media(media_pk="111"):
+    return Media(
+        pk=media_pk,
+        id=f"{media_pk}_222",
+        code="code",
+        taken_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        media_type=8,
+        user=UserShort(pk="222", username="example"),
+        like_count=0,
+        caption_text="",
+        usertags=[],
+        sponsor_tags=[],
+        resources=[Resource(pk="333", media_type=1)],
+    )
+
+
+class LRUCacheTestCase(unittest.TestCase):
+    def test_evicts_least_recently_used_entry(self):
+        cache = LRUCache(max_entries=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        self.assertEqual(cache.get("a"), 1)
+        cache["c"] = 3
+
+        self.assertEqual(sorted(cache), ["a", "c"])
+        self.assertEqual(cache.stats.evictions, 1)
+
+    def test_counts_hits_and_misses(self):
+        cache = LRUCache()
+        cache["a"] = 1
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        with self.assertRaises(KeyError):
+            cache["b"]
+
+        self.assertEqual((cache.stats.hits, cache.stats.misses), (1, 2))
+
+    def test_expires_entries_after_ttl(self):
+        cache = LRUCache(ttl=10)
+        with patch("aiograpi.cache.time.monotonic", return_value=100.0):
+            cache["a"] = 1
+        with patch("aiograpi.cache.time.monotonic", return_value=105.0):
+            self.assertIn("a", cache)
+        with patch("aiograpi.cache.time.monotonic", return_value=111.0):
+            self.assertNotIn("a", cache)
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats.expirations, 1)
+
+    def test_bounds_total_bytes(self):
+        cache = LRUCache(max_bytes=100, sizeof=lambda value: value)
+        cache["a"] = 60
+        cache["b"] = 30
+        cache["c"] = 30
+
+        self.assertEqual(sorted(cache), ["b", "c"])
+        self.assertEqual(cache.stats.bytes, 60)
+
+    def test_client_cache_accepts_per_entity_limits(self):
+        cache = ClientCache(ttl={"stories": 5}, max_entries=3)
+
+        self.assertEqual(cache["stories"].ttl, 5)
+        self.assertEqual(cache["users"].ttl, 3600)
+        self.assertEqual(cache["medias"].max_entries, 3)
+
+
+class FrozenModelTestCase(unittest.TestCase):
+    def test_freeze_blocks_nested_assignment(self):
+        media = freeze(_carousel_media())
+
+        with self.assertRaises(ValidationError):
+            media.caption_text = "changed"
+        with self.assertRaises(ValidationError):
+            media.resources[0].pk = "changed"
+
+    def test_freeze_blocks_nested_container_mutation(self):
+        media = freeze(_carousel_media())
+
+        with self.assertRaises(TypeError):
+            media.resources.append(Resource(pk="444", media_type=1))
+        with self.assertRaises(TypeError):
+            media.usertags += []
+        with self.assertRaises(TypeError):
+            media.resources[0].usertags.append(None)
+        self.assertIsInstance(media.resources, list)
+        self.assertEqual(len(media.resources), 1)
+
+    def test_freeze_leaves_the_original_mutable(self):
+        original = _carousel_media()
+        media = freeze(original)
+        original.caption_text = "changed"
+        original.resources.append(Resource(pk="444", media_type=1))
+
+        self.assertIs(type(original), Media)
+        self.assertEqual((media.caption_text, len(media.resources)), ("", 1))
+
+    def test_frozen_model_keeps_type_equality_and_pickling(self):
+        media = freeze(_carousel_media())
+
+        self.assertIsInstance(media, Media)
+        self.assertEqual(media, _carousel_media())
+        self.assertEqual(_carousel_media(), media)
+        self.assertEqual(pickle.loads(pickle.dumps(media)), media)
+        self.assertEqual(media.model_dump(), _carousel_media().model_dump())
+
+    def test_mutable_copy_thaws_every_nested_model(self):
+        media = freeze(_carousel_media())
+        copy = mutable_copy(media)
+        copy.resources[0].pk = "changed"
+        copy.resources.append(Resource(pk="444", media_type=1))
+
+        self.assertIs(type(copy), Media)
+        self.assertIs(type(copy.resources), list)
+        self.assertIs(type(copy.resources[0]), Resource)
+        self.assertEqual(media.resources[0].pk, "333")
+
+
+class ClientCacheTestCase(unittest.IsolatedAsyncioTestCase):
+    def _build_client(self, **kwargs):
+        client = Client(**kwargs)
+        client.authorization_data = {"sessionid": "sessionid-value", "ds_user_id": "1"}
+        return client
+
+    def test_clients_do_not_share_caches_by_default(self):
+        first, second = Client(), Client()
+        first._users_cache["1"] = Mock()
+
+        self.assertNotIn("1", second._users_cache)
+        self.assertIsNot(first.cache, second.cache)
+
+    def test_clients_share_an_explicit_cache(self):
+        cache = ClientCache()
+        first, second = Client(cache=cache), Client(cache=cache)
+        first._medias_cache["1"] = Mock()
+
+        self.assertIn("1", second._medias_cache)
+
+    async def test_user_info_serves_repeat_lookups_from_cache(self):
+        client = self._build_client()
+        client.user_info_v1 = AsyncMock(return_value=Mock(pk="123", username="example"))
+
+        await client.user_info("123")
+        await client.user_info("123")
+
+        client.user_info_v1.assert_awaited_once_with("123")
+        stats = client.cache_stats()["users"]
+        self.assertEqual((stats.hits, stats.misses), (1, 1))
+
+    async def test_cache_clear_forces_refetch(self):
+        client = self._build_client()
+        client.media_info_v1 = AsyncMock(return_value=Mock(pk="123"))
+
+        await client.media_info("123")
+        client.cache_clear("medias")
+        await client.media_info("123")
+
+        self.assertEqual(client.media_info_v1.await_count, 2)
+
+    async def test_user_followers_cache_respects_max_entries(self):
+        client = self._build_client(cache_max_entries={"user_followers": 1})
+        client.user_followers_v1 = AsyncMock(return_value=[Mock(pk="9")])
+        client.last_json = {}
+
+        await client.user_followers("1")
+        await client.user_followers("2")
+
+        self.assertEqual(list(client._users_followers), ["2"])
+
+    async def test_media_info_cache_hits_share_one_read_only_object(self):
+        client = self._build_client()
+        client.media_info_v1 = AsyncMock(return_value=_carousel_media())
+
+        first = await client.media_info("111")
+        second = await client.media_info("111")
+        copy = await client.media_info("111", copy=True)
+        copy.caption_text = "changed"
+
+        self.assertIs(first, second)
+        self.assertIsNot(copy, first)
+        self.assertEqual(second.caption_text, "")
+        with self.assertRaises(ValidationError):
+            first.caption_text = "changed"
+
+    async def test_media_info_nested_mutation_does_not_leak_into_cache_hits(self):
+        client = self._build_client()
+        fetched = _carousel_media()
+        client.media_info_v1 = AsyncMock(return_value=fetched)
+
+        first = await client.media_info("111")
+        fetched.resources.append(Resource(pk="444", media_type=1))
+        with self.assertRaises(TypeError):
+            first.usertags.append(None)
+        with self.assertRaises(TypeError):
+            first.resources.append(Resource(pk="555", media_type=1))
+        second = await client.media_info("111")
+
+        self.assertIs(type(fetched), Media)
+        self.assertEqual([resource.pk for resource in second.resources], ["333"])
+        self.assertEqual(second.usertags, [])
+
+
+PHOTO = "https://scontent-ams2-1.cdninstagram.com/v/t51.2885-15/123_456_n.jpg"
+
+
+class MediaFileCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.tmp = Path(self._tmp.name)
+
+    def _file(self, name, content):
+        path = self.tmp / name
+        path.write_bytes(content)
+        return path
+
+    def test_asset_key_ignores_signature_and_host_but_keeps_rendition(self):
+        key = media_asset_key(f"{PHOTO}?stp=dst-jpg_s640x640&_nc_ohc=a&oh=00_x&oe=6600")
+
+        self.assertEqual(key, "/v/t51.2885-15/123_456_n.jpg?stp=dst-jpg_s640x640")
+        self.assertEqual(
+            media_asset_key("https://scontent-lhr8-1.cdninstagram.com/v/t51.2885-15/123_456_n.jpg?oh=00_y&_nc_ht=b"),
+            "/v/t51.2885-15/123_456_n.jpg",
+        )
+        self.assertNotEqual(key, media_asset_key(f"{PHOTO}?stp=dst-jpg_s1080x1080&oh=00_x"))
+
+    def test_asset_key_keeps_the_full_path(self):
+        self.assertNotEqual(media_asset_key("https://a.com/x/photo.jpg"), media_asset_key("https://b.com/y/photo.jpg"))
+        self.assertNotEqual(
+            media_asset_key(PHOTO), media_asset_key(PHOTO.replace("t51.2885-15", "t51.29350-15") + "?oh=00_x")
+        )
+
+    def test_fetch_serves_stored_file_for_resigned_url(self):
+        cache = MediaFileCache(self.tmp / "cache")
+        cache.store(f"{PHOTO}?oh=1", self._file("a.jpg", b"photo"))
+
+        dest = cache.fetch(f"{PHOTO}?oh=2&oe=3", self.tmp / "copy.jpg")
+
+        self.assertEqual(dest.read_bytes(), b"photo")
+        self.assertIsNone(cache.fetch(PHOTO.replace("123", "999"), self.tmp / "other.jpg"))
+        self.assertEqual((cache.stats.hits, cache.stats.misses, cache.stats.entries), (1, 1, 1))
+
+    def test_fetch_copies_by_default_so_writes_do_not_reach_the_cache(self):
+        cache = MediaFileCache(self.tmp / "cache")
+        cache.store(PHOTO, self._file("a.jpg", b"photo"))
+
+        dest = cache.fetch(PHOTO, self.tmp / "copy.jpg")
+        with open(dest, "r+b") as fp:
+            fp.write(b"PHOTO")
+
+        self.assertNotEqual(os.stat(dest).st_ino, os.stat(cache.path_for(PHOTO)).st_ino)
+        self.assertEqual(cache.fetch(PHOTO, self.tmp / "again.jpg").read_bytes(), b"photo")
+
+    def test_fetch_hardlinks_when_linking_is_enabled(self):
+        cache = MediaFileCache(self.tmp / "cache", link=True)
+        cache.store(PHOTO, self._file("a.jpg", b"photo"))
+
+        dest = cache.fetch(PHOTO, self.tmp / "copy.jpg")
+
+        self.assertEqual(dest.read_bytes(), b"photo")
+        self.assertEqual(os.stat(dest).st_ino, os.stat(cache.path_for(PHOTO)).st_ino)
+
+    def test_entry_removed_before_the_copy_is_a_miss(self):
+        cache = MediaFileCache(self.tmp / "cache")
+        cache.store(PHOTO, self._file("a.jpg", b"photo"))
+
+        with patch.object(cache_module, "_place", side_effect=FileNotFoundError):
+            self.assertIsNone(cache.fetch(PHOTO, self.tmp / "copy.jpg"))
+
+        self.assertEqual((cache.stats.hits, cache.stats.misses, cache.stats.entries), (0, 1, 0))
+
+    def test_store_evicts_least_recently_used_files_over_max_bytes(self):
+        cache = MediaFileCache(self.tmp / "cache", max_bytes=10)
+        urls = [PHOTO.replace("123", str(i)) for i in range(3)]
+        cache.store(urls[0], self._file("0.jpg", b"0000"))
+        cache.store(urls[1], self._file("1.jpg", b"1111"))
+        cache.fetch(urls[0], self.tmp / "hit.jpg")
+        cache.store(urls[2], self._file("2.jpg", b"2222"))
+        cache.store(PHOTO.replace("123", "big"), self._file("big.jpg", b"x" * 11))
+
+        self.assertTrue(cache.path_for(urls[0]).exists())
+        self.assertFalse(cache.path_for(urls[1]).exists())
+        self.assertTrue(cache.path_for(urls[2]).exists())
+        self.assertFalse(cache.path_for(PHOTO.replace("123", "big")).exists())
+        self.assertEqual((cache.stats.evictions, cache.stats.bytes, cache.stats.entries), (1, 8, 2))
+
+    def test_reopened_cache_keeps_entries_and_lru_order(self):
+        cache = MediaFileCache(self.tmp / "cache", max_bytes=8)
+        old, new = PHOTO.replace("123", "1"), PHOTO.replace("123", "2")
+        cache.store(old, self._file("1.jpg", b"1111"))
+        cache.store(new, self._file("2.jpg", b"2222"))
+        os.utime(cache.path_for(old), (1, 1))
+
+        reopened = MediaFileCache(self.tmp / "cache", max_bytes=8)
+        reopened.store(PHOTO.replace("123", "3"), self._file("3.jpg", b"3333"))
+
+        self.assertEqual(reopened.stats.entries, 2)
+        self.assertFalse(reopened.path_for(old).exists())
+        self.assertTrue(reopened.path_for(new).exists())
+
+
+class MediaFileCacheDownloadTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_photo_download_by_url_is_served_from_media_cache(self):
+        requests = []
+
+        def handler(request):
+            requests.append(str(request.url))
+            return httpx.Response(200, content=b"photo")
+
+        with tempfile.TemporaryDirectory() as folder:
+            client = Client(media_cache=MediaFileCache(Path(folder) / "cache"))
+            client.public._host_clients["cdn"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+            first = await client.photo_download_by_url(f"{PHOTO}?oh=1", "first", folder)
+            second = await client.photo_download_by_url(f"{PHOTO}?oh=2", "second", folder)
+
+            self.assertEqual(len(requests), 1)
+            self.assertEqual(second.read_bytes(), b"photo")
+            self.assertNotEqual(first, second)
+            self.assertEqual(client.media_cache.stats.hits, 1)
+
+    async def test_cache_copies_run_off_the_event_loop(self):
+        threads = []
+        place = cache_module._place
+
+        def recording_place(src, dest, link=False):
+            threads.append(threading.get_ident())
+            return place(src, dest, link)
+
+        with tempfile.TemporaryDirectory() as folder:
+            client = Client(media_cache=MediaFileCache(Path(folder) / "cache"))
+            client.public._host_clients["cdn"] = httpx.AsyncClient(
+                transport=httpx.MockTransport(lambda request: httpx.Response(200, content=b"video"))
+            )
+            with patch.object(cache_module, "_place", side_effect=recording_place):
+                await client.video_download_by_url(f"{PHOTO.replace('.jpg', '.mp4')}?oh=1", "first", folder)
+                second = await client.video_download_by_url(f"{PHOTO.replace('.jpg', '.mp4')}?oh=2", "second", folder)
+
+            self.assertEqual(second.read_bytes(), b"video")
+        # the miss, the store and the hit all copied outside the loop's thread
+        self.assertEqual(len(threads), 3)
+        self.assertNotIn(threading.get_ident(), threads)
@@ -15,6 +15,12 @@ from aiograpi.exceptions import (
 )
 
 
+def _video_file(folder) -> Path:
+    path = Path(folder) / "example.mp4"
+    path.write_bytes(b"video-bytes")
+    return path
+
+
 def _build_client():
     client = Client()
     client.settings = {}
@@ -710,9 +716,9 @@ class ClipUploadRegressionTestCase(unittest.IsolatedAsyncioTestCase):
             return_value=(Path("/tmp/thumb.jpg"), 720, 1280, 6.023),
         ):
             with mock.patch("time.time", return_value=1778346423.0):
-                with mock.patch("builtins.open", mock.mock_open(read_data=b"video-bytes")):
+                with tempfile.TemporaryDirectory() as tmpdir:
                     with mock.patch("aiograpi.mixins.clip.asyncio.sleep", new=AsyncMock()):
-                        await client.clip_upload(Path("example.mp4"), "caption")
+                        await client.clip_upload(_video_file(tmpdir), "caption")
 
         post_calls = client.private.post.call_args_list
         assert len(post_calls) == 2
@@ -769,10 +775,10 @@ class ClipUploadRegressionTestCase(unittest.IsolatedAsyncioTestCase):
             "aiograpi.mixins.clip.analyze_video",
             return_value=(Path("/tmp/thumb.jpg"), 720, 1280, 6.023),
         ):
-            with mock.patch("builtins.open", mock.mock_open(read_data=b"video-bytes")):
+            with tempfile.TemporaryDirectory() as tmpdir:
                 with mock.patch("aiograpi.mixins.clip.asyncio.sleep", new=AsyncMock()):
                     await client.clip_upload(
-                        Path("example.mp4"),
+                        _video_file(tmpdir),
                         "caption",
                         trial=True,
                         trial_graduation_strategy="manual",
@@ -803,10 +809,10 @@ class ClipUploadRegressionTestCase(unittest.IsolatedAsyncioTestCase):
             "aiograpi.mixins.clip.analyze_video",
             return_value=(Path("/tmp/thumb.jpg"), 720, 1280, 6.023),
         ):
-            with mock.patch("builtins.open", mock.mock_open(read_data=b"video-bytes")):
+            with tempfile.TemporaryDirectory() as tmpdir:
                 with mock.patch("aiograpi.mixins.clip.asyncio.sleep", new=AsyncMock()):
                     await client.clip_upload(
-                        Path("example.mp4"),
+                        _video_file(tmpdir),
                         "caption",
                         trial=True,
                         extra_data=extra_data,
@@ -844,10 +850,10 @@ class ClipUploadRegressionTestCase(unittest.IsolatedAsyncioTestCase):
             "aiograpi.mixins.clip.analyze_video",
             return_value=(Path("/tmp/thumb.jpg"), 720, 1280, 6.023),
         ):
-            with mock.patch("builtins.open", mock.mock_open(read_data=b"video-bytes")):
+            with tempfile.TemporaryDirectory() as tmpdir:
                 with mock.patch("aiograpi.mixins.clip.asyncio.sleep", new=AsyncMock()):
                     await client.clip_upload(
-                        Path("example.mp4"),
+                        _video_file(tmpdir),
                         "caption",
                         share_to_facebook=True,
                         fb_destination_id="fb-destination-id",
@@ -883,10 +889,10 @@ class ClipUploadRegressionTestCase(unittest.IsolatedAsyncioTestCase):
             "aiograpi.mixins.clip.analyze_video",
             return_value=(Path("/tmp/thumb.jpg"), 720, 1280, 6.023),
         ):
-            with mock.patch("builtins.open", mock.mock_open(read_data=b"video-bytes")):
+            with tempfile.TemporaryDirectory() as tmpdir:
                 with mock.patch("aiograpi.mixins.clip.asyncio.sleep", new=AsyncMock()):
                     await client.clip_upload(
-                        Path("example.mp4"),
+                        _video_file(tmpdir),
                         "caption",
                         show_preview_in_feed=False,
                     )
@@ -0,0 +1,69 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+from aiograpi import Client
+
+
+class TaskLocalRequestStateTestCase(unittest.IsolatedAsyncioTestCase):
+    def _build_client(self):
+        client = Client()
+        client.authorization_data = {"sessionid": "sessionid-value", "ds_user_id": "1"}
+        client.request_timeout = 0
+        client.request_log = Mock()
+        return client
+
+    def _response(self, payload):
+        response = Mock(status_code=200, headers={}, url="https://i.instagram.com/api/v1/")
+        response.content = json.dumps(payload).encode()
+        response.text = response.content.decode()
+        response.json.return_value = payload
+        return response
+
+    async def test_last_json_is_local_to_each_task(self):
+        client = self._build_client()
+        client.last_json = {"owner": "parent"}
+
+        async def run(name):
+            client.last_json = {"owner": name}
+            await asyncio.sleep(0)
+            return client.last_json["owner"]
+
+        self.assertEqual(await asyncio.gather(run("a"), run("b")), ["a", "b"])
+        self.assertEqual(client.last_json, {"owner": "parent"})
+
+    async def test_concurrent_requests_keep_their_own_headers_and_results(self):
+        client = self._build_client()
+        session_headers = dict(client.private.headers)
+        release = asyncio.Event()
+        sent = {}
+
+        async def send(url, headers=None, **kwargs):
+            sent[url] = headers
+            await release.wait()
+            return self._response({"status": "ok", "url": url})
+
+        client.private.post = AsyncMock(side_effect=send)
+        client.private.get = AsyncMock(side_effect=send)
+
+        async def request(endpoint, data=None):
+            await client.private_request(endpoint, data=data, with_signature=False)
+            return client.last_json["url"], client.last_response.text
+
+        tasks = [
+            asyncio.ensure_future(request("media/1/like/", data={"a": "b"})),
+            asyncio.ensure_future(request("feed/timeline/")),
+        ]
+        while len(sent) < 2:
+            await asyncio.sleep(0)
+        release.set()
+        (post_url, post_text), (get_url, get_text) = await asyncio.gather(*tasks)
+
+        self.assertTrue(post_url.endswith("/media/1/like/"))
+        self.assertIn(post_url, post_text)
+        self.assertTrue(get_url.endswith("/feed/timeline/"))
+        self.assertIn(get_url, get_text)
+        self.assertEqual(sent[post_url]["Content-Type"], "application/x-www-form-urlencoded; charset=UTF-8")
+        self.assertIsNone(sent[get_url]["Content-Type"])
+        self.assertEqual(client.private.headers, session_headers)
@@ -1,13 +1,20 @@
+import tempfile
 import unittest
 from pathlib import Path
 from typing import Literal, Union, get_args, get_origin, get_type_hints
-from unittest.mock import AsyncMock, Mock, mock_open, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 from aiograpi import Client
 from aiograpi.exceptions import ClientError, ClientGraphqlError, CrosspostingDestinationError
 from aiograpi.extractors import extract_media_v1
 
 
+def _video_file(folder) -> Path:
+    path = Path(folder) / "example.mp4"
+    path.write_bytes(b"video-bytes")
+    return path
+
+
 class CrossPostingRegressionTestCase(unittest.IsolatedAsyncioTestCase):
     def build_client(self):
         client = Client()
@@ -832,10 +839,10 @@ class CrossPostingRegressionTestCase(unittest.IsolatedAsyncioTestCase):
             "aiograpi.mixins.clip.analyze_video",
             return_value=(Path("/tmp/thumb.jpg"), 720, 1280, 6.023),
         ):
-            with patch("builtins.open", mock_open(read_data=b"video-bytes")):
+            with tempfile.TemporaryDirectory() as tmpdir:
                 with patch("asyncio.sleep", new=AsyncMock()):
                     media = await client.clip_upload(
-                        Path("example.mp4"),
+                        _video_file(tmpdir),
                         "caption",
                         share_to_threads=True,
                         threads_destination_id="threads-destination",
@@ -572,7 +572,7 @@ class DirectMixinRegressionTestCase(unittest.IsolatedAsyncioTestCase):
 
         assert result is expected
         rupload.assert_called_once_with(
-            b"video-bytes",
+            path,
             "aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa-0-11-1234567-1234567",
             "111111111111_AAAAAAAAAAAA_Mixed_0",
         )
@@ -984,6 +984,8 @@ class DirectMixinRegressionTestCase(unittest.IsolatedAsyncioTestCase):
 
     async def test_video_rupload_delegates_base_headers_to_helper(self):
         client = _build_client()
+        path = _temp_file(".mp4", b"video-bytes")
+        self.addCleanup(path.unlink, missing_ok=True)
 
         class FakeResponse:
             status_code = 200
@@ -1004,7 +1006,7 @@ class DirectMixinRegressionTestCase(unittest.IsolatedAsyncioTestCase):
                 new=AsyncMock(side_effect=[FakeResponse({"offset": 0}), FakeResponse({"media_id": 987654321})]),
             ),
         ):
-            media_id = await client._video_rupload(b"video-bytes", "entity-name", "waterfall-id")
+            media_id = await client._video_rupload(path, "entity-name", "waterfall-id")
 
         assert media_id == 987654321
         headers.assert_called_once_with(
@@ -1020,6 +1022,8 @@ class DirectMixinRegressionTestCase(unittest.IsolatedAsyncioTestCase):
 
     async def test_video_rupload_uses_active_private_session_proxy_after_clear(self):
         client = _build_client()
+        path = _temp_file(".mp4", b"video-bytes")
+        self.addCleanup(path.unlink, missing_ok=True)
         client.set_proxy("http://proxy.example:8080")
         client.set_proxy("")
 
@@ -1031,7 +1035,7 @@ class DirectMixinRegressionTestCase(unittest.IsolatedAsyncioTestCase):
             "aiograpi.mixins.direct.httpx_ext.request",
             new=AsyncMock(side_effect=[offset_response, upload_response]),
         ) as request:
-            await client._video_rupload(b"video-bytes", "entity-name", "waterfall-id")
+            await client._video_rupload(path, "entity-name", "waterfall-id")
 
         assert client.private.proxy is None
         assert [call.kwargs["proxy"] for call in request.await_args_list] == [None, None]
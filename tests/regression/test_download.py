@@ -1,11 +1,17 @@
+import asyncio
+import re
+import tempfile
 import unittest
 from datetime import datetime, timezone
 from pathlib import Path
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
+
+import httpx
 
 from aiograpi import Client
-from aiograpi.exceptions import ClientForbiddenError
-from aiograpi.types import Media, UserShort
+from aiograpi.cache import MediaFileCache
+from aiograpi.exceptions import AlbumUnknownFormat, ClientForbiddenError, ClientIncompleteReadError
+from aiograpi.types import Media, Resource, UserShort
 
 
 class DownloadRegressionTestCase(unittest.IsolatedAsyncioTestCase):
@@ -47,6 +53,29 @@ class DownloadRegressionTestCase(unittest.IsolatedAsyncioTestCase):
             video_url="https://example.com/video.mp4",
         )
 
+    def _album_media(self, media_pk="3000000000000000000"):
+        return Media(
+            pk=media_pk,
+            id=f"{media_pk}_50838397751",
+            code="DAlbum00000",
+            taken_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            media_type=8,
+            user=UserShort(
+                pk="50838397751",
+                username="example",
+                profile_pic_url="https://example.com/profile.jpg",
+            ),
+            like_count=0,
+            caption_text="",
+            usertags=[],
+            sponsor_tags=[],
+            resources=[
+                Resource(pk="1", media_type=1, thumbnail_url="https://example.com/1.jpg"),
+                Resource(pk="2", media_type=2, video_url="https://example.com/2.mp4"),
+                Resource(pk="3", media_type=1, thumbnail_url="https://example.com/3.jpg"),
+            ],
+        )
+
     async def test_video_download_uses_private_media_info_lookup(self):
         client = Client()
         media = self._video_media()
@@ -109,3 +138,262 @@ class DownloadRegressionTestCase(unittest.IsolatedAsyncioTestCase):
             overwrite=False,
         )
         self.assertEqual(result, expected)
+
+    async def test_album_download_runs_slides_concurrently_in_resource_order(self):
+        client = Client()
+        client.media_info = AsyncMock(return_value=self._album_media())
+        in_flight = 0
+        peak = 0
+
+        async def download(url, filename, folder, overwrite=True):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # The first slide finishes last.
+            await asyncio.sleep(0.03 if filename.endswith("_1") else 0.01)
+            in_flight -= 1
+            return Path(folder) / filename
+
+        client.photo_download_by_url = AsyncMock(side_effect=download)
+        client.video_download_by_url = AsyncMock(side_effect=download)
+
+        result = await client.album_download("3000000000000000000", folder="/tmp", concurrency=2)
+
+        self.assertEqual(result, [Path("/tmp/example_1"), Path("/tmp/example_2"), Path("/tmp/example_3")])
+        self.assertEqual(peak, 2)
+        client.video_download_by_url.assert_awaited_once_with(
+            self._album_media().resources[1].video_url, "example_2", "/tmp", overwrite=True
+        )
+
+    async def test_album_download_removes_finished_slides_when_one_fails(self):
+        client = Client()
+        client.media_info = AsyncMock(return_value=self._album_media())
+        with tempfile.TemporaryDirectory() as folder:
+
+            async def photo(url, filename, folder, overwrite=True):
+                path = Path(folder) / f"{filename}.jpg"
+                path.write_bytes(b"jpg")
+                return path
+
+            client.photo_download_by_url = AsyncMock(side_effect=photo)
+            client.video_download_by_url = AsyncMock(side_effect=ClientForbiddenError("gone"))
+
+            with self.assertRaises(ClientForbiddenError):
+                await client.album_download("3000000000000000000", folder=folder, concurrency=1)
+
+            self.assertEqual(list(Path(folder).iterdir()), [])
+
+    async def test_album_download_keeps_finished_slides_without_overwrite(self):
+        client = Client()
+        client.media_info = AsyncMock(return_value=self._album_media())
+        with tempfile.TemporaryDirectory() as folder:
+            existing = Path(folder) / "example_1.jpg"
+            existing.write_bytes(b"jpg")
+            client.photo_download_by_url = AsyncMock(return_value=existing)
+            client.video_download_by_url = AsyncMock(side_effect=ClientForbiddenError("gone"))
+
+            with self.assertRaises(ClientForbiddenError):
+                await client.album_download("3000000000000000000", folder=folder, overwrite=False, concurrency=1)
+
+            self.assertTrue(existing.exists())
+
+    async def test_album_download_by_urls_rejects_unknown_format_before_downloading(self):
+        client = Client()
+        client.photo_download_by_url = AsyncMock()
+
+        with self.assertRaises(AlbumUnknownFormat):
+            await client.album_download_by_urls(["https://example.com/1.jpg", "https://example.com/2.gif"])
+
+        client.photo_download_by_url.assert_not_called()
+
+    async def test_album_download_origin_returns_bytes_in_resource_order(self):
+        client = Client()
+        client.media_info = AsyncMock(return_value=self._album_media())
+
+        async def photo(url):
+            url = str(url)
+            await asyncio.sleep(0.02 if url.endswith("1.jpg") else 0)
+            return url.encode()
+
+        client.photo_download_by_url_origin = AsyncMock(side_effect=photo)
+        client.video_download_by_url_origin = AsyncMock(return_value=b"video")
+
+        result = await client.album_download_origin("3000000000000000000")
+
+        self.assertEqual(result, [b"https://example.com/1.jpg", b"video", b"https://example.com/3.jpg"])
+
+    def _public_transport(self, client, handler):
+        client.public._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def test_photo_download_by_url_streams_body_in_chunks(self):
+        client = Client()
+        chunks = [b"a" * 1000, b"b" * 1000, b"c" * 24]
+
+        async def body():
+            for chunk in chunks:
+                yield chunk
+
+        self._public_transport(client, lambda request: httpx.Response(200, content=body()))
+        with tempfile.TemporaryDirectory() as folder:
+            path = await client.photo_download_by_url("https://example.com/photo.jpg", "slide", folder)
+
+            self.assertEqual(path, (Path(folder) / "slide.jpg").resolve())
+            self.assertEqual(path.read_bytes(), b"".join(chunks))
+            self.assertEqual(list(Path(folder).iterdir()), [path])
+
+    async def test_video_download_by_url_keeps_previous_file_on_incomplete_body(self):
+        client = Client()
+        self._public_transport(
+            client, lambda request: httpx.Response(200, headers={"Content-Length": "10"}, content=b"short")
+        )
+        with tempfile.TemporaryDirectory() as folder:
+            path = Path(folder) / "video.mp4"
+            path.write_bytes(b"previous")
+
+            with self.assertRaises(ClientIncompleteReadError):
+                await client.video_download_by_url("https://example.com/video.mp4", folder=folder)
+
+            self.assertEqual(path.read_bytes(), b"previous")
+            self.assertEqual(list(Path(folder).iterdir()), [path])
+
+    async def test_story_download_by_url_writes_nothing_on_http_error(self):
+        client = Client()
+        self._public_transport(client, lambda request: httpx.Response(404, content=b"missing"))
+        with tempfile.TemporaryDirectory() as folder:
+            with self.assertRaises(httpx.HTTPStatusError):
+                await client.story_download_by_url("https://example.com/story.mp4", folder=folder)
+
+            self.assertEqual(list(Path(folder).iterdir()), [])
+
+    def _ranged_handler(self, body, requests, ranges=True, fail_range=None):
+        def handler(request):
+            requests.append(request.headers.get("Range"))
+            match = re.fullmatch(r"bytes=(\d+)-(\d*)", request.headers.get("Range", ""))
+            if not ranges or not match:
+                return httpx.Response(200, content=body)
+            start = int(match.group(1))
+            end = int(match.group(2)) if match.group(2) else len(body) - 1
+            if start >= len(body):
+                return httpx.Response(416, headers={"Content-Range": f"bytes */{len(body)}"})
+            if fail_range == (start, end):
+                return httpx.Response(500)
+            return httpx.Response(
+                206, headers={"Content-Range": f"bytes {start}-{end}/{len(body)}"}, content=body[start : end + 1]
+            )
+
+        return handler
+
+    async def test_video_download_by_url_resumes_from_part_file(self):
+        client = Client()
+        body = bytes(range(256)) * 40
+        requests = []
+        self._public_transport(client, self._ranged_handler(body, requests))
+        with tempfile.TemporaryDirectory() as folder:
+            Path(folder, "video.mp4.part").write_bytes(body[:1000])
+
+            path = await client.video_download_by_url("https://example.com/video.mp4", folder=folder, resume=True)
+
+            self.assertEqual(requests, ["bytes=1000-"])
+            self.assertEqual(path.read_bytes(), body)
+            self.assertEqual(list(Path(folder).iterdir()), [path])
+
+    async def test_video_download_by_url_keeps_part_file_for_next_resume(self):
+        client = Client()
+        body = b"0123456789"
+        self._public_transport(
+            client, lambda request: httpx.Response(200, headers={"Content-Length": "10"}, content=body[:4])
+        )
+        with tempfile.TemporaryDirectory() as folder:
+            with self.assertRaises(ClientIncompleteReadError):
+                await client.clip_download_by_url("https://example.com/video.mp4", folder=folder, resume=True)
+            self.assertEqual(Path(folder, "video.mp4.part").read_bytes(), b"0123")
+
+            requests = []
+            self._public_transport(client, self._ranged_handler(body, requests))
+            path = await client.clip_download_by_url("https://example.com/video.mp4", folder=folder, resume=True)
+
+            self.assertEqual(requests, ["bytes=4-"])
+            self.assertEqual(path.read_bytes(), body)
+
+    async def test_video_download_by_url_restarts_when_range_is_ignored_or_unsatisfiable(self):
+        client = Client()
+        body = b"0123456789"
+        for ranges, part, expected in ((False, b"xyz", ["bytes=3-"]), (True, b"0123456789ab", ["bytes=12-", None])):
+            requests = []
+            self._public_transport(client, self._ranged_handler(body, requests, ranges=ranges))
+            with tempfile.TemporaryDirectory() as folder:
+                Path(folder, "video.mp4.part").write_bytes(part)
+
+                path = await client.video_download_by_url("https://example.com/video.mp4", folder=folder, resume=True)
+
+                self.assertEqual(requests, expected)
+                self.assertEqual(path.read_bytes(), body)
+                self.assertEqual(list(Path(folder).iterdir()), [path])
+
+    async def test_video_download_by_url_keeps_complete_part_on_unsatisfiable_range(self):
+        client = Client()
+        body = b"0123456789"
+        requests = []
+        self._public_transport(client, self._ranged_handler(body, requests))
+        with tempfile.TemporaryDirectory() as folder:
+            Path(folder, "video.mp4.part").write_bytes(body)
+
+            path = await client.video_download_by_url("https://example.com/video.mp4", folder=folder, resume=True)
+
+            self.assertEqual(requests, ["bytes=10-"])
+            self.assertEqual(path.read_bytes(), body)
+            self.assertEqual(list(Path(folder).iterdir()), [path])
+
+    async def test_video_download_by_url_fetches_ranged_segments_concurrently(self):
+        client = Client()
+        body = bytes(range(256)) * (3 * 4096 + 10)
+        requests = []
+        self._public_transport(client, self._ranged_handler(body, requests))
+        with tempfile.TemporaryDirectory() as folder:
+            path = await client.video_download_by_url("https://example.com/video.mp4", folder=folder, segments=8)
+
+            self.assertEqual(path.read_bytes(), body)
+            self.assertEqual(list(Path(folder).iterdir()), [path])
+        step = -(-len(body) // 3)
+        self.assertEqual(
+            sorted(requests[1:]),
+            sorted(f"bytes={start}-{min(start + step, len(body)) - 1}" for start in range(0, len(body), step)),
+        )
+        self.assertEqual(requests[0], "bytes=0-0")
+
+    async def test_video_download_by_url_segments_fall_back_without_range_support(self):
+        client = Client()
+        body = b"\0" * (3 * 1024 * 1024)
+        requests = []
+        self._public_transport(client, self._ranged_handler(body, requests, ranges=False))
+        with tempfile.TemporaryDirectory() as folder:
+            path = await client.video_download_by_url("https://example.com/video.mp4", folder=folder, segments=4)
+
+            self.assertEqual(path.read_bytes(), body)
+        self.assertEqual(requests, ["bytes=0-0"])
+
+    async def test_video_download_by_url_small_segmented_file_is_fetched_once_and_cached_once(self):
+        body = b"\0" * 1024
+        requests = []
+        with tempfile.TemporaryDirectory() as folder:
+            client = Client(media_cache=MediaFileCache(Path(folder) / "cache"))
+            self._public_transport(client, self._ranged_handler(body, requests))
+            with patch.object(client.media_cache, "store", wraps=client.media_cache.store) as store:
+                path = await client.video_download_by_url("https://example.com/video.mp4", folder=folder, segments=4)
+
+            self.assertEqual(path.read_bytes(), body)
+            store.assert_called_once()
+            self.assertEqual(client.media_cache.stats.misses, 1)
+        self.assertEqual(requests, ["bytes=0-0", None])
+
+    async def test_video_download_by_url_removes_part_when_a_segment_fails(self):
+        client = Client()
+        body = b"\0" * (2 * 1024 * 1024)
+        requests = []
+        fail_range = (1024 * 1024, 2 * 1024 * 1024 - 1)
+        self._public_transport(client, self._ranged_handler(body, requests, fail_range=fail_range))
+        with tempfile.TemporaryDirectory() as folder:
+            with self.assertRaises(httpx.HTTPStatusError):
+                await client.video_download_by_url("https://example.com/video.mp4", folder=folder, segments=2)
+
+            self.assertEqual(list(Path(folder).iterdir()), [])
@@ -0,0 +1,214 @@
+import asyncio
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+
+import httpx
+
+from aiograpi import Client, httpx_ext
+from aiograpi.download import DownloadManager, download_targets
+from aiograpi.exceptions import ClientIncompleteReadError, ClientNotFoundError
+from aiograpi.types import Media, Resource, Story, Track, UserShort
+
+USER = UserShort(pk="1", username="example", profile_pic_url="https://example.com/profile.jpg")
+
+
+def _album():
+    return Media(
+        pk="10",
+        id="10_1",
+        code="DAlbum00000",
+        taken_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        media_type=8,
+        user=USER,
+        like_count=0,
+        caption_text="",
+        usertags=[],
+        sponsor_tags=[],
+        resources=[
+            Resource(pk="11", media_type=1, thumbnail_url="https://cdn-a.example.com/11.jpg"),
+            Resource(pk="12", media_type=2, video_url="https://cdn-a.example.com/12.mp4"),
+        ],
+    )
+
+
+def _story():
+    return Story(
+        pk="20",
+        id="20_1",
+        code="story",
+        taken_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        media_type=2,
+        user=USER,
+        video_url="https://cdn-b.example.com/20.mp4",
+        mentions=[],
+        links=[],
+        hashtags=[],
+        locations=[],
+        stickers=[],
+        sponsor_tags=[],
+    )
+
+
+def _track():
+    return Track(
+        id="30",
+        title="title",
+        subtitle="",
+        display_artist="artist",
+        audio_cluster_id=1,
+        highlight_start_times_in_ms=[],
+        is_explicit=False,
+        dash_manifest="",
+        uri="https://cdn-b.example.com/30.m4a",
+        has_lyrics=False,
+        audio_asset_id=1,
+        duration_in_ms=1000,
+        allows_saving=True,
+        territory_validity_periods={},
+    )
+
+
+class DownloadManagerRegressionTestCase(unittest.IsolatedAsyncioTestCase):
+    def _manager(self, folder, download, **kwargs):
+        client = Client()
+        client._download_to_path = download
+        kwargs.setdefault("retry", httpx_ext.Retry(total=2, backoff_factor=0))
+        return client.download_manager(folder, **kwargs)
+
+    def test_download_targets_expand_medias_stories_tracks_and_urls(self):
+        self.assertEqual(
+            download_targets(_album()),
+            [("https://cdn-a.example.com/11.jpg", "example_11"), ("https://cdn-a.example.com/12.mp4", "example_12")],
+        )
+        self.assertEqual(download_targets(_story()), [("https://cdn-b.example.com/20.mp4", "example_20")])
+        self.assertEqual(download_targets(_track()), [("https://cdn-b.example.com/30.m4a", "track_30")])
+        self.assertEqual(download_targets("https://x.example.com/a.jpg"), [("https://x.example.com/a.jpg", "")])
+        self.assertEqual(download_targets(("https://x.example.com/a.jpg", "b")), [("https://x.example.com/a.jpg", "b")])
+        with self.assertRaises(TypeError):
+            download_targets(42)
+
+    async def test_download_respects_global_and_per_host_limits(self):
+        in_flight = {"total": 0, "a.example.com": 0, "b.example.com": 0}
+        peak = dict(in_flight)
+
+        async def download(url, path, resume=False):
+            host = httpx.URL(url).host
+            for key in ("total", host):
+                in_flight[key] += 1
+                peak[key] = max(peak[key], in_flight[key])
+            await asyncio.sleep(0.01)
+            for key in ("total", host):
+                in_flight[key] -= 1
+            path.write_bytes(b"12345")
+            return path
+
+        urls = [f"https://{host}/{i}.jpg" for i in range(12) for host in ("a.example.com", "b.example.com")]
+        with tempfile.TemporaryDirectory() as folder:
+            manager = self._manager(folder, download, concurrency=5, per_host=2)
+            results = await manager.download_all(urls)
+
+        self.assertEqual(len(results), 24)
+        self.assertEqual({result.status for result in results}, {"downloaded"})
+        self.assertEqual(peak["total"], 4)
+        self.assertEqual((peak["a.example.com"], peak["b.example.com"]), (2, 2))
+        self.assertEqual((manager.stats.files, manager.stats.downloaded, manager.stats.bytes), (24, 24, 120))
+
+    async def test_download_skips_existing_files_and_reports_progress(self):
+        progress = []
+
+        async def download(url, path, resume=False):
+            path.write_bytes(b"new")
+            return path
+
+        async def on_progress(result, stats):
+            progress.append((result.path.name, result.status, stats.files))
+
+        with tempfile.TemporaryDirectory() as folder:
+            Path(folder, "example_11.jpg").write_bytes(b"old")
+            manager = self._manager(folder, download, concurrency=1, on_progress=on_progress)
+            results = await manager.download_all([_album()])
+
+            self.assertEqual(Path(folder, "example_11.jpg").read_bytes(), b"old")
+        self.assertEqual([result.status for result in results], ["skipped", "downloaded"])
+        self.assertEqual(progress, [("example_11.jpg", "skipped", 1), ("example_12.mp4", "downloaded", 2)])
+        self.assertEqual((manager.stats.skipped, manager.stats.downloaded), (1, 1))
+        self.assertGreater(manager.stats.throughput, 0)
+
+    async def test_download_retries_transient_errors_only(self):
+        calls = {}
+        request = httpx.Request("GET", "https://cdn.example.com/")
+        errors = {
+            "flaky.jpg": [httpx_ext.ReadError("reset"), ClientIncompleteReadError("short")],
+            "busy.jpg": [httpx.HTTPStatusError("503", request=request, response=httpx.Response(503))],
+            "gone.jpg": [ClientNotFoundError("404")],
+            "down.jpg": [httpx_ext.ConnectError("refused")] * 5,
+        }
+
+        async def download(url, path, resume=False):
+            calls[path.name] = calls.get(path.name, 0) + 1
+            pending = errors[path.name]
+            if pending:
+                raise pending.pop(0)
+            path.write_bytes(b"ok")
+            return path
+
+        with tempfile.TemporaryDirectory() as folder:
+            manager = self._manager(folder, download)
+            results = {r.path.name: r for r in await manager.download_all(f"https://cdn/{name}" for name in errors)}
+
+        self.assertEqual(results["flaky.jpg"].status, "downloaded")
+        self.assertEqual(results["flaky.jpg"].attempts, 3)
+        self.assertEqual(results["busy.jpg"].status, "downloaded")
+        self.assertEqual((results["gone.jpg"].status, calls["gone.jpg"]), ("failed", 1))
+        self.assertIsInstance(results["gone.jpg"].error, ClientNotFoundError)
+        self.assertEqual((results["down.jpg"].status, calls["down.jpg"]), ("failed", 3))
+        self.assertEqual((manager.stats.failed, manager.stats.retries), (2, 5))
+
+    async def test_download_pulls_async_items_lazily_and_fails_unsupported_ones(self):
+        pulled = []
+
+        async def items():
+            for i in range(1000):
+                pulled.append(i)
+                yield object() if i == 0 else f"https://cdn.example.com/{i}.jpg"
+
+        async def download(url, path, resume=False):
+            path.write_bytes(b"ok")
+            return path
+
+        with tempfile.TemporaryDirectory() as folder:
+            manager = self._manager(folder, download, concurrency=2)
+            seen = []
+            async for result in manager.download(items()):
+                seen.append(result)
+                if len(seen) == 5:
+                    break
+
+        self.assertEqual(seen[0].status, "failed")
+        self.assertIsInstance(seen[0].error, TypeError)
+        self.assertLess(len(pulled), 10)
+
+    def test_download_manager_is_bound_to_client(self):
+        client = Client()
+        manager = client.download_manager("/tmp", concurrency=3, per_host=1)
+
+        self.assertIsInstance(manager, DownloadManager)
+        self.assertIs(manager.client, client)
+        self.assertEqual((manager.folder, manager.concurrency, manager.per_host), (Path("/tmp"), 3, 1))
+        self.assertFalse(manager.overwrite)
+
+    async def test_download_raises_errors_of_the_items_iterable(self):
+        async def items():
+            yield "https://cdn.example.com/1.jpg"
+            raise RuntimeError("queue closed")
+
+        async def download(url, path, resume=False):
+            path.write_bytes(b"ok")
+            return path
+
+        with tempfile.TemporaryDirectory() as folder:
+            manager = self._manager(folder, download, concurrency=2)
+            with self.assertRaisesRegex(RuntimeError, "queue closed"):
+                await manager.download_all(items())
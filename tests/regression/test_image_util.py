@@ -0,0 +1,130 @@
+import io
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from PIL import Image, JpegImagePlugin
+
+from aiograpi.image_util import _jpeg_without_metadata, prepare_image
+from aiograpi.mixins.photo import prepare_photo_upload
+
+
+def _jpeg(size, color="green", **params) -> bytes:
+    image = Image.new("RGB", size, color)
+    image.paste("red", (0, 0, size[0] // 8, size[1]))
+    image.paste("blue", (size[0] - size[0] // 8, 0, size[0], size[1]))
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", **params)
+    return buffer.getvalue()
+
+
+def _phone_exif() -> bytes:
+    exif = Image.Exif()
+    exif[0x010F] = "Phone"  # Make
+    exif[0x0112] = 6  # Orientation
+    return exif.tobytes()
+
+
+def _scan(data: bytes) -> bytes:
+    return data[data.index(b"\xff\xda") :]
+
+
+class PrepareImageTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+    def _write(self, name, data) -> str:
+        path = Path(self._tmp.name) / name
+        path.write_bytes(data)
+        return str(path)
+
+    def test_compliant_jpeg_is_passed_through_without_metadata(self):
+        original = _jpeg((1080, 1350), exif=_phone_exif(), comment=b"secret", progressive=True)
+        path = self._write("ready.jpg", original)
+
+        with mock.patch.object(JpegImagePlugin.JpegImageFile, "load") as load:
+            data, size = prepare_image(path)
+
+        load.assert_not_called()
+        self.assertEqual(size, (1080, 1350))
+        self.assertEqual(_scan(data), _scan(original))
+        self.assertNotIn(b"Exif", data)
+        self.assertNotIn(b"secret", data)
+        with Image.open(io.BytesIO(data)) as prepared, Image.open(io.BytesIO(original)) as source:
+            self.assertEqual(prepared.tobytes(), source.tobytes())
+
+    def test_passthrough_drops_images_appended_after_the_main_one(self):
+        original = _jpeg((1080, 1080))
+        path = self._write("mpo.jpg", original + _jpeg((320, 320), exif=_phone_exif()))
+
+        data, size = prepare_image(path)
+
+        self.assertEqual((data, size), (original, (1080, 1080)))
+
+    def test_unparseable_jpeg_is_reencoded(self):
+        self.assertIsNone(_jpeg_without_metadata(b"\xff\xd8\xff\xe1\x00"))
+        self.assertIsNone(_jpeg_without_metadata(b"\x89PNG"))
+        self.assertIsNone(_jpeg_without_metadata(_jpeg((64, 64))[:-2]))
+
+    def test_png_and_non_compliant_jpeg_are_reencoded(self):
+        buffer = io.BytesIO()
+        Image.new("RGBA", (800, 800), (0, 0, 0, 0)).save(buffer, "PNG")
+        png = self._write("alpha.png", buffer.getvalue())
+        wide = self._write("wide.jpg", _jpeg((1080, 300)))
+
+        png_data, png_size = prepare_image(png)
+        wide_data, wide_size = prepare_image(wide)
+
+        self.assertEqual(png_size, (800, 800))
+        with Image.open(io.BytesIO(png_data)) as prepared:
+            self.assertEqual((prepared.format, prepared.getpixel((10, 10))), ("JPEG", (255, 255, 255)))
+        self.assertEqual(wide_size, (575, 300))
+        with Image.open(io.BytesIO(wide_data)) as prepared:
+            self.assertEqual(prepared.size, (575, 300))
+
+    def test_large_jpeg_is_decoded_at_reduced_scale(self):
+        path = self._write("phone.jpg", _jpeg((4032, 3024), exif=_phone_exif()))
+        draft = JpegImagePlugin.JpegImageFile.draft
+
+        with mock.patch.object(JpegImagePlugin.JpegImageFile, "draft", autospec=True, side_effect=draft) as spy:
+            data, size = prepare_image(path)
+
+        self.assertEqual(spy.call_args.args[1:], ("RGB", (1080, 810)))
+        self.assertEqual(size, (1080, 810))
+        with Image.open(io.BytesIO(data)) as prepared:
+            self.assertEqual(prepared.size, (1080, 810))
+            self.assertNotIn(0x0112, prepared.getexif())
+
+    def test_reduced_decode_keeps_the_crop_centered(self):
+        # 3:1 is wider than 90:47, so both sides are cropped away
+        path = self._write("pano.jpg", _jpeg((7200, 2400)))
+
+        data, size = prepare_image(path)
+
+        self.assertEqual(size, (1080, 564))
+        with Image.open(io.BytesIO(data)) as prepared:
+            self.assertEqual(prepared.size, (1080, 564))
+            for x in (2, 540, 1077):
+                red, green, blue = prepared.getpixel((x, 280))
+                self.assertGreater(green, 100)
+                self.assertLess(max(red, blue), 40)
+
+    def test_story_size_matches_full_decode(self):
+        path = self._write("tall.jpg", _jpeg((3024, 8000)))
+
+        _, size = prepare_image(path, aspect_ratios=(9 / 16, 90 / 47), max_size=(1080, 1920))
+
+        self.assertEqual(size, (1080, 1920))
+
+    def test_photo_upload_opens_the_image_once_and_reports_the_prepared_size(self):
+        path = self._write("phone.jpg", _jpeg((4032, 3024)))
+
+        with mock.patch("aiograpi.image_util.Image.open", wraps=Image.open) as opened:
+            data, width, height = prepare_photo_upload(path)
+
+        self.assertEqual(opened.call_count, 1)
+        self.assertEqual((width, height), (1080, 810))
+        with Image.open(io.BytesIO(data)) as prepared:
+            self.assertEqual(prepared.size, (width, height))
@@ -4,6 +4,7 @@ from pathlib import Path
 from unittest.mock import AsyncMock, Mock
 
 from aiograpi import Client
+from aiograpi.exceptions import ClientError, LoginRequired, MediaNotFound, PleaseWaitFewMinutes
 from aiograpi.extractors import extract_media_gql, extract_media_v1
 from aiograpi.types import StoryMedia, UserShort
 
@@ -489,6 +490,73 @@ class MediaActionPayloadRegressionTestCase(unittest.IsolatedAsyncioTestCase):
         client.media_info_v1.assert_awaited_once_with("123")
         client.media_info_gql.assert_not_awaited()
 
+    def _media_item(self, pk):
+        return {
+            "pk": pk,
+            "id": f"{pk}_2",
+            "code": f"code{pk}",
+            "taken_at": 1710000000,
+            "media_type": 1,
+            "user": {"pk": "2", "username": "example", "profile_pic_url": "https://example.com/profile.jpg"},
+            "image_versions2": {"candidates": [{"url": "https://example.com/x.jpg", "width": 100, "height": 100}]},
+        }
+
+    async def test_media_info_many_batches_ids_and_falls_back_per_media(self):
+        client = self._build_logged_in_client()
+        client.authorization_data = {"sessionid": "sessionid-value", "ds_user_id": "1"}
+        cached = extract_media_v1(self._media_item("5"))
+        client._medias_cache = {"5": cached}
+
+        async def private_request(endpoint, params=None, **kwargs):
+            pks = params["media_ids"].split(",")
+            return {"items": [self._media_item(pk) for pk in pks if pk != "3"], "status": "ok"}
+
+        client.private_request = AsyncMock(side_effect=private_request)
+        fallback_error = MediaNotFound(media_pk="3")
+        client.media_info_v1 = AsyncMock(side_effect=fallback_error)
+        client._media_info_public = AsyncMock(side_effect=fallback_error)
+
+        medias = await client.media_info_many(["4_2", "1", "5", "3", "2", "1"], batch_size=2)
+
+        self.assertEqual(list(medias), ["4", "1", "5", "3", "2"])
+        self.assertEqual(
+            [client.private_request.await_args_list[i].kwargs["params"]["media_ids"] for i in (0, 1)], ["4,1", "3,2"]
+        )
+        self.assertIs(medias["5"], cached)
+        self.assertEqual(medias["4"].code, "code4")
+        self.assertIs(medias["3"], fallback_error)
+        client.media_info_v1.assert_awaited_once_with("3")
+        self.assertIs(client._medias_cache["2"], medias["2"])
+        self.assertNotIn("3", client._medias_cache)
+
+    async def test_media_info_many_falls_back_when_batch_fails(self):
+        client = self._build_logged_in_client()
+        client.authorization_data = {"sessionid": "sessionid-value", "ds_user_id": "1"}
+        client._medias_cache = {}
+        client.media_infos_v1 = AsyncMock(side_effect=ClientError("media/infos failed"))
+        client.media_info_v1 = AsyncMock(side_effect=lambda pk: extract_media_v1(self._media_item(pk)))
+
+        medias = await client.media_info_many(["1", "2"], copy=True)
+
+        self.assertEqual([media.pk for media in medias.values()], ["1", "2"])
+        medias["1"].caption_text = "mutable"
+        self.assertNotEqual(client._medias_cache["1"].caption_text, "mutable")
+
+    async def test_media_info_many_raises_batch_throttle_and_login_errors(self):
+        for error in (PleaseWaitFewMinutes("Please wait a few minutes"), LoginRequired("login_required")):
+            with self.subTest(error=type(error).__name__):
+                client = self._build_logged_in_client()
+                client.authorization_data = {"sessionid": "sessionid-value", "ds_user_id": "1"}
+                client._medias_cache = {}
+                client.media_infos_v1 = AsyncMock(side_effect=error)
+                client.media_info_v1 = AsyncMock()
+
+                with self.assertRaises(type(error)):
+                    await client.media_info_many(["1", "2", "3"], batch_size=2)
+
+                client.media_infos_v1.assert_awaited_once()
+                client.media_info_v1.assert_not_awaited()
+
     async def test_user_medias_uses_private_first_when_authorized(self):
         client = self._build_logged_in_client()
         client.authorization_data = {"sessionid": "sessionid-value", "ds_user_id": "1"}
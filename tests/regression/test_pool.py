@@ -0,0 +1,191 @@
+import asyncio
+import threading
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+from aiograpi import Client, httpx_ext
+
+
+def _pool_limits(client):
+    return client._transport._pool._max_connections, client._transport._pool._keepalive_expiry
+
+
+class HostClassTestCase(unittest.TestCase):
+    def test_classifies_instagram_hosts(self):
+        self.assertEqual(httpx_ext.host_class("https://i.instagram.com/api/v1/feed/"), "api")
+        self.assertEqual(httpx_ext.host_class("https://www.instagram.com/graphql/query/"), "graphql")
+        self.assertEqual(httpx_ext.host_class("https://scontent-ams2-1.cdninstagram.com/v/t51/1.jpg"), "cdn")
+        self.assertEqual(httpx_ext.host_class("https://video.xx.fbcdn.net/v/1.mp4"), "cdn")
+
+
+class SessionPoolRegressionTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_cdn_requests_use_dedicated_pool(self):
+        hosts = []
+
+        def handler(request):
+            hosts.append(request.url.host)
+            return httpx.Response(200)
+
+        session = httpx_ext.Session(host_pools={"cdn": httpx_ext.PoolConfig(max_connections=4)})
+        session.proxy = None
+        self.assertEqual(_pool_limits(session._client_for("https://a.cdninstagram.com/1.jpg")), (4, 5.0))
+
+        session._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        session._host_clients["cdn"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        await session.get("https://a.cdninstagram.com/1.jpg")
+        await session.get("https://i.instagram.com/api/v1/feed/")
+
+        self.assertEqual(hosts, ["a.cdninstagram.com", "i.instagram.com"])
+        self.assertEqual(session._host_clients["cdn"]._state, httpx_ext.ClientState.OPENED)
+        await session._close()
+        self.assertEqual(session._host_clients["cdn"]._state, httpx_ext.ClientState.CLOSED)
+
+    def test_set_pools_rebuilds_client_and_keeps_cookies(self):
+        session = httpx_ext.Session()
+        session.proxy = None
+        session._client.cookies.set("sessionid", "value")
+
+        session.set_pools(httpx_ext.PoolConfig(max_connections=7, keepalive_expiry=30))
+
+        self.assertEqual(_pool_limits(session._client), (7, 30))
+        self.assertEqual(session._client.cookies.get("sessionid"), "value")
+
+    async def test_replacing_clients_closes_the_old_ones_after_the_request_timeout(self):
+        session = httpx_ext.Session(host_pools={"cdn": httpx_ext.PoolConfig()})
+        session.proxy = None
+        old = [session._client, session._client_for("https://a.cdninstagram.com/1.jpg")]
+
+        with patch.object(
+            asyncio.get_running_loop(), "call_later", wraps=asyncio.get_running_loop().call_later
+        ) as later:
+            session.proxy = "http://127.0.0.1:8080"
+            await asyncio.sleep(0)
+            self.assertEqual(later.call_args.args[0], httpx_ext.DEFAULT_TIMEOUT)
+            self.assertFalse(any(client.is_closed for client in old))
+            later.call_args.args[1]()
+        await asyncio.sleep(0.01)
+
+        self.assertTrue(all(client.is_closed for client in old))
+        self.assertEqual(session._host_clients, {})
+        self.assertFalse(session._client.is_closed)
+
+
+class ClientPoolConfigRegressionTestCase(unittest.TestCase):
+    def test_pool_limits_configure_sessions_and_roundtrip_settings(self):
+        client = Client(pool_limits={"api": {"max_connections": 10}, "cdn": {"keepalive_expiry": 30}})
+
+        self.assertEqual(_pool_limits(client.private._client), (10, 5.0))
+        self.assertEqual(_pool_limits(client.graphql._client), (100, 5.0))
+        self.assertEqual(client.public.host_pools["cdn"].keepalive_expiry, 30)
+
+        settings = client.get_settings()
+        self.assertEqual(settings["http2"], False)
+        self.assertEqual(settings["pool_limits"]["api"], {"max_connections": 10})
+
+        restored = Client(settings=settings)
+        self.assertEqual(_pool_limits(restored.private._client), (10, 5.0))
+
+    def test_set_pool_config_updates_existing_sessions(self):
+        client = Client()
+
+        self.assertTrue(client.set_pool_config(pool_limits={"graphql": {"max_connections": 3}}))
+
+        self.assertEqual(_pool_limits(client.graphql._client), (3, 5.0))
+        self.assertEqual(_pool_limits(client.public._client), (3, 5.0))
+        self.assertEqual(client.settings["pool_limits"], {"graphql": {"max_connections": 3}})
+
+    def test_rejects_unknown_host_class(self):
+        with self.assertRaises(ValueError):
+            Client(pool_limits={"upload": {"max_connections": 1}})
+
+    def test_http2_requires_optional_extra(self):
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            with self.assertRaisesRegex(RuntimeError, "aiograpi\\[http2\\]"):
+                Client(http2=True)
+        else:
+            self.assertTrue(Client(http2=True).private.pool.http2)
+
+
+class RequestClientPoolRegressionTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_reuses_client_per_proxy_verify_and_redirect_policy(self):
+        cache = httpx_ext.RequestClientPool()
+        client = cache.get(None, True, False)
+
+        self.assertIs(cache.get(None, True, False), client)
+        self.assertIsNot(cache.get(None, True, True), client)
+        self.assertIsNot(cache.get("http://127.0.0.1:8080", True, False), client)
+
+        await cache.aclose()
+        self.assertTrue(client.is_closed)
+        self.assertIsNot(cache.get(None, True, False), client)
+        await cache.aclose()
+
+    async def test_pooled_clients_do_not_keep_cookies(self):
+        cache = httpx_ext.RequestClientPool()
+        client = cache.get()
+        request = httpx.Request("GET", "https://www.instagram.com/share/p/abc/")
+        response = httpx.Response(302, headers={"Set-Cookie": "csrftoken=abc; Domain=.instagram.com"}, request=request)
+
+        client.cookies.extract_cookies(response)
+
+        self.assertEqual(dict(client.cookies), {})
+        await cache.aclose()
+
+    async def test_closes_clients_of_a_previous_loop_that_is_still_running(self):
+        cache = httpx_ext.RequestClientPool()
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever)
+        thread.start()
+        self.addCleanup(loop.close)
+        self.addCleanup(thread.join)
+        self.addCleanup(loop.call_soon_threadsafe, loop.stop)
+
+        async def get():
+            return cache.get()
+
+        stale = asyncio.run_coroutine_threadsafe(get(), loop).result(5)
+        client = cache.get()
+
+        for _ in range(100):
+            if stale.is_closed:
+                break
+            await asyncio.sleep(0.01)
+        self.assertTrue(stale.is_closed)
+        self.assertIsNot(client, stale)
+        await cache.aclose()
+
+    async def test_drops_clients_of_a_closed_loop(self):
+        cache = httpx_ext.RequestClientPool()
+        stale = httpx.AsyncClient()
+        cache._loop = asyncio.new_event_loop()
+        cache._loop.close()
+        cache._clients = {(None, True, True): stale}
+
+        client = cache.get()
+
+        self.assertIsNot(client, stale)
+        self.assertEqual(list(cache._clients.values()), [client])
+        await cache.aclose()
+
+    async def test_public_head_reuses_pooled_client(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(302, headers={"Location": "https://www.instagram.com/p/B1LbfVPlwIA/"})
+
+        client = Client()
+        pooled = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch.object(httpx_ext.request_clients, "get", return_value=pooled) as get:
+            for _ in range(2):
+                response = await client.public_head("https://www.instagram.com/share/p/abc/")
+
+        self.assertEqual(response.headers["location"], "https://www.instagram.com/p/B1LbfVPlwIA/")
+        self.assertEqual([request.method for request in requests], ["HEAD", "HEAD"])
+        get.assert_called_with(client.public.proxy, client.public.verify, False)
+        self.assertFalse(pooled.is_closed)
+        await pooled.aclose()
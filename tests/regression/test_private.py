@@ -1,6 +1,9 @@
 import json
+import logging
 import unittest
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, PropertyMock, patch
+
+import httpx
 
 from aiograpi import Client, httpx_ext
 from aiograpi.exceptions import (
@@ -9,6 +12,7 @@ from aiograpi.exceptions import (
     AccountSuspended,
     BadPassword,
     ClientConnectionError,
+    ClientIncompleteReadError,
     ClientNotFoundError,
     DirectMessageRequestsDisabled,
 )
@@ -164,7 +168,7 @@ class PrivateRequestRegressionTestCase(unittest.IsolatedAsyncioTestCase):
         client = self._build_client()
         client._user_id = "123"
         response = self._response({"status": "ok"})
-        client.private.post = AsyncMock(
+        client.private.get = AsyncMock(
             side_effect=[
                 httpx_ext.RemoteProtocolError(
                     "peer closed connection without sending complete message body (received 207264 bytes, expected 375848)"
@@ -172,13 +176,28 @@ class PrivateRequestRegressionTestCase(unittest.IsolatedAsyncioTestCase):
                 response,
             ]
         )
+        client.private.retry.backoff = Mock(return_value=0.3)
 
         with unittest.mock.patch("aiograpi.mixins.private.asyncio.sleep", new_callable=AsyncMock) as sleep:
-            result = await client.private_request("test/", data={"_uuid": client.uuid}, with_signature=False)
+            result = await client.private_request("test/")
 
         self.assertEqual(result, {"status": "ok"})
-        self.assertEqual(client.private.post.await_count, 2)
-        self.assertEqual(sleep.await_args_list.count(unittest.mock.call(2)), 1)
+        self.assertEqual(client.private.get.await_count, 2)
+        client.private.retry.backoff.assert_called_once_with(1)
+        self.assertEqual(sleep.await_args_list.count(unittest.mock.call(0.3)), 1)
+
+    async def test_private_request_does_not_resend_post_after_remote_protocol_error(self):
+        client = self._build_client()
+        client._user_id = "123"
+        client.private.post = AsyncMock(
+            side_effect=httpx_ext.RemoteProtocolError("peer closed connection without sending complete message body")
+        )
+
+        with unittest.mock.patch("aiograpi.mixins.private.asyncio.sleep", new_callable=AsyncMock):
+            with self.assertRaises(ClientIncompleteReadError):
+                await client.private_request("test/", data={"_uuid": client.uuid}, with_signature=False)
+
+        client.private.post.assert_awaited_once()
 
     async def test_send_private_request_promotes_direct_message_requests_disabled_status_fail(self):
         client = self._build_client()
@@ -222,6 +241,29 @@ class PrivateRequestRegressionTestCase(unittest.IsolatedAsyncioTestCase):
         self.assertNotIn("X-FB-Friendly-Name", client.private.headers)
         self.assertNotEqual(client.private.headers.get("Host"), "b.i.instagram.com")
 
+    async def test_send_private_request_parses_bytes_without_decoding_text(self):
+        client = self._build_client()
+        client.logger = logging.getLogger("aiograpi.tests.private")
+        client.logger.setLevel(logging.INFO)
+        response = httpx.Response(200, content=b'{"status": "ok", "users": []}', request=httpx.Request("GET", "x"))
+        client.private.get = AsyncMock(return_value=response)
+
+        with patch.object(httpx.Response, "text", new_callable=PropertyMock) as text:
+            result = await client._send_private_request("friendships/1/followers/")
+
+        self.assertEqual(result, {"status": "ok", "users": []})
+        text.assert_not_called()
+
+    async def test_send_private_request_splits_stream_rows_when_body_is_not_json(self):
+        client = self._build_client()
+        content = b'{"user": {"pk": "1"}, "status": "ok"}\n{"user": {"pk": "2"}, "status": "ok"}\n'
+        response = httpx.Response(200, content=content, request=httpx.Request("GET", "x"))
+        client.private.get = AsyncMock(return_value=response)
+
+        result = await client._send_private_request("users/1/stream/")
+
+        self.assertEqual([row["user"]["pk"] for row in result["stream_rows"]], ["1", "2"])
+
 
 class PrivateGraphQLRequestRegressionTestCase(unittest.IsolatedAsyncioTestCase):
     def _build_client(self):
@@ -287,3 +329,33 @@ class PrivateGraphQLRequestRegressionTestCase(unittest.IsolatedAsyncioTestCase):
 
         with self.assertRaisesRegex(ClientConnectionError, "ConnectError offline"):
             await client.private_graphql_www_request("ExampleQuery", {})
+
+
+class BaseHeadersRegressionTestCase(unittest.TestCase):
+    def test_static_headers_follow_locale_user_agent_and_login(self):
+        client = Client()
+        first = client.base_headers
+        self.assertEqual(first["IG-INTENDED-USER-ID"], "0")
+        self.assertNotIn("IG-U-DS-USER-ID", first)
+
+        client.set_locale("de_DE")
+        client.set_user_agent("custom-agent")
+        client.authorization_data = {"sessionid": "sessionid-value", "ds_user_id": "42"}
+        headers = client.base_headers
+
+        self.assertEqual(headers["X-IG-App-Locale"], "de_DE")
+        self.assertEqual(headers["User-Agent"], "custom-agent")
+        self.assertEqual(headers["IG-INTENDED-USER-ID"], "42")
+        self.assertTrue(headers["IG-U-RUR"].startswith("RVA,42,"))
+
+    def test_dynamic_headers_are_fresh_and_callers_get_a_copy(self):
+        client = Client()
+        client.mid = "mid-1"
+        first = client.base_headers
+        first["X-IG-App-ID"] = "mutated"
+        client.mid = "mid-2"
+        second = client.base_headers
+
+        self.assertNotEqual(first["X-Pigeon-Session-Id"], second["X-Pigeon-Session-Id"])
+        self.assertEqual(second["X-MID"], "mid-2")
+        self.assertNotEqual(second["X-IG-App-ID"], "mutated")
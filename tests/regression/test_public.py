@@ -22,6 +22,22 @@ class PublicRequestRegressionTestCase(unittest.IsolatedAsyncioTestCase):
         with self.assertRaises(ClientLoginRequired):
             await client._send_public_request("https://www.instagram.com/graphql/query/", return_json=True)
 
+    async def test_public_request_merges_headers_into_session_unless_update_headers_is_false(self):
+        for update_headers, persisted in ((None, True), (True, True), (False, False)):
+            with self.subTest(update_headers=update_headers):
+                client = Client()
+                client.last_response_ts = 0
+                response = Mock(status_code=200, url="https://www.instagram.com/", text="ok")
+                client.public.get = AsyncMock(return_value=response)
+
+                await client._send_public_request(
+                    "https://www.instagram.com/", headers={"X-Test": "1"}, update_headers=update_headers
+                )
+
+                self.assertEqual(client.public.headers.get("X-Test") == "1", persisted)
+                sent = client.public.get.await_args.kwargs["headers"]
+                self.assertEqual(sent, None if persisted else {"X-Test": "1"})
+
     async def test_public_doc_id_graphql_request_injects_logged_in_public_cookies(self):
         client = Client()
         client.authorization_data = {"sessionid": "123:session", "ds_user_id": "123"}
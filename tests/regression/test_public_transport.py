@@ -1,8 +1,25 @@
 import sys
 from pathlib import Path
-from unittest import TestCase, mock
+from unittest import IsolatedAsyncioTestCase, TestCase, mock
 
-from aiograpi import Client
+from aiograpi import Client, httpx_ext
+
+
+class _CurlRequestException(Exception):
+    pass
+
+
+class _CurlReadTimeout(_CurlRequestException):
+    pass
+
+
+def _curl_cffi_modules(session_cls):
+    exceptions = mock.Mock(
+        RequestException=_CurlRequestException,
+        ConnectTimeout=_CurlReadTimeout,
+        ReadTimeout=_CurlReadTimeout,
+    )
+    return {"curl_cffi": mock.Mock(requests=mock.Mock(AsyncSession=session_cls, exceptions=exceptions))}
 
 
 class PublicTransportRegressionTestCase(TestCase):
@@ -19,42 +36,29 @@ class PublicTransportRegressionTestCase(TestCase):
         required_dependencies = pyproject.split("[project.optional-dependencies]", 1)[0]
         optional_dependencies = pyproject.split("[project.optional-dependencies]", 1)[1]
 
-        self.assertNotIn("curl-adapter", required_dependencies)
+        self.assertNotIn("curl_cffi", required_dependencies)
         self.assertIn("curl = [", optional_dependencies)
-        self.assertIn('"curl-adapter>=1.2.1"', optional_dependencies)
-
-    def test_curl_public_transport_uses_optional_adapter(self):
-        adapter = mock.Mock()
-        adapter_cls = mock.Mock(return_value=adapter)
-
-        with mock.patch.dict(
-            sys.modules,
-            {
-                "curl_adapter": mock.Mock(CurlCffiAdapter=adapter_cls),
-            },
-        ):
+        self.assertIn('"curl_cffi>=0.7"', optional_dependencies)
+
+    def test_curl_public_transport_uses_async_curl_session(self):
+        session = mock.Mock()
+        session_cls = mock.Mock(return_value=session)
+
+        with mock.patch.dict(sys.modules, _curl_cffi_modules(session_cls)):
             client = Client(public_transport="curl", public_transport_impersonate="chrome136")
 
         self.assertEqual(client.public_transport, "curl")
         self.assertEqual(client.public_transport_impersonate, "chrome136")
-        adapter_cls.assert_any_call(impersonate_browser_type="chrome136")
-        self.assertIs(client.public._client.adapters["https://"], adapter)
-        self.assertIs(client.public._client.adapters["http://"], adapter)
+        session_cls.assert_any_call(impersonate="chrome136", verify=True, max_clients=100)
+        self.assertIs(client.public._client, session)
 
     def test_curl_public_transport_missing_extra_has_clear_error(self):
-        with mock.patch.dict(sys.modules, {"curl_adapter": None}):
+        with mock.patch.dict(sys.modules, {"curl_cffi": None}):
             with self.assertRaisesRegex(RuntimeError, r"pip install aiograpi\[curl\]"):
                 Client(public_transport="curl")
 
     def test_public_transport_settings_roundtrip(self):
-        adapter_cls = mock.Mock(return_value=mock.Mock())
-
-        with mock.patch.dict(
-            sys.modules,
-            {
-                "curl_adapter": mock.Mock(CurlCffiAdapter=adapter_cls),
-            },
-        ):
+        with mock.patch.dict(sys.modules, _curl_cffi_modules(mock.Mock())):
             client = Client(public_transport="curl", public_transport_impersonate="chrome136")
             settings = client.get_settings()
 
@@ -69,3 +73,70 @@ class PublicTransportRegressionTestCase(TestCase):
     def test_invalid_public_transport_is_rejected(self):
         with self.assertRaisesRegex(ValueError, "public_transport must be 'requests' or 'curl'"):
             Client(public_transport="invalid")
+
+
+class CurlSessionRegressionTestCase(IsolatedAsyncioTestCase):
+    def _session(self):
+        client = mock.Mock()
+        with mock.patch.dict(sys.modules, _curl_cffi_modules(mock.Mock(return_value=client))):
+            session = httpx_ext.CurlSession()
+        session.headers = {"User-Agent": "agent", "X-Drop": "x"}
+        return session, client
+
+    async def test_request_awaits_async_curl_session(self):
+        session, client = self._session()
+        client.request = mock.AsyncMock(return_value=mock.Mock(status_code=200, content=b"{}"))
+
+        response = await session.get("https://www.instagram.com/", params={"a": 1}, headers={"X-Drop": None})
+
+        self.assertEqual(response.status_code, 200)
+        client.request.assert_awaited_once_with(
+            "GET",
+            "https://www.instagram.com/",
+            headers={"User-Agent": "agent"},
+            proxy=None,
+            params={"a": 1},
+            timeout=httpx_ext.DEFAULT_TIMEOUT,
+        )
+
+    async def test_curl_errors_map_to_httpx_errors(self):
+        session, client = self._session()
+        client.request = mock.AsyncMock(side_effect=[_CurlReadTimeout("timeout"), _CurlRequestException("reset")])
+
+        with self.assertRaises(httpx_ext.ReadError):
+            await session.get("https://www.instagram.com/")
+        with self.assertRaises(httpx_ext.ConnectError):
+            await session.get("https://www.instagram.com/")
+
+    async def test_stream_reads_curl_chunks_and_closes_response(self):
+        session, client = self._session()
+
+        async def aiter_content():
+            yield b"ab"
+            yield b"cd"
+
+        raw = mock.Mock(status_code=200, aiter_content=aiter_content, aclose=mock.AsyncMock())
+        client.request = mock.AsyncMock(return_value=raw)
+
+        async with session.stream("GET", "https://scontent.cdninstagram.com/v.mp4") as response:
+            chunks = [chunk async for chunk in response.aiter_bytes(1024)]
+
+        self.assertEqual(chunks, [b"ab", b"cd"])
+        self.assertTrue(client.request.await_args.kwargs["stream"])
+        raw.aclose.assert_awaited_once_with()
+
+    async def test_stream_maps_curl_errors_while_reading(self):
+        session, client = self._session()
+
+        async def aiter_content():
+            yield b"ab"
+            raise _CurlRequestException("reset")
+
+        raw = mock.Mock(status_code=200, aiter_content=aiter_content, aclose=mock.AsyncMock())
+        client.request = mock.AsyncMock(return_value=raw)
+
+        with self.assertRaises(httpx_ext.ReadError):
+            async with session.stream("GET", "https://scontent.cdninstagram.com/v.mp4") as response:
+                async for _ in response.aiter_bytes():
+                    pass
+        raw.aclose.assert_awaited_once_with()
@@ -0,0 +1,276 @@
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+from aiograpi import Client, httpx_ext
+from aiograpi.exceptions import ClientThrottledError
+from aiograpi.ratelimit import (
+    AdaptiveRateLimiter,
+    FixedDelayRateLimiter,
+    RateLimiter,
+    TokenBucketRateLimiter,
+    endpoint_family,
+)
+
+
+class EndpointFamilyTestCase(unittest.TestCase):
+    def test_groups_endpoints_by_first_segment(self):
+        self.assertEqual(endpoint_family("/v1/friendships/create/1/"), "friendships")
+        self.assertEqual(endpoint_family("friendships/show/1/"), "friendships")
+        self.assertEqual(endpoint_family("/v2/media/1/info/"), "media")
+        self.assertEqual(endpoint_family("feed/timeline/"), "feed")
+
+
+class TokenBucketRateLimiterTestCase(unittest.TestCase):
+    def test_allows_burst_then_paces_at_rate(self):
+        with patch("aiograpi.ratelimit.time.monotonic", return_value=100.0):
+            limiter = TokenBucketRateLimiter(rate=2, burst=3)
+            delays = [limiter.delay_for("feed") for _ in range(5)]
+
+        self.assertEqual(delays, [0.0, 0.0, 0.0, 0.5, 1.0])
+
+    def test_refills_while_idle(self):
+        with patch("aiograpi.ratelimit.time.monotonic", return_value=100.0):
+            limiter = TokenBucketRateLimiter(rate=1, burst=2)
+            limiter.delay_for()
+            limiter.delay_for()
+        with patch("aiograpi.ratelimit.time.monotonic", return_value=160.0):
+            self.assertEqual(limiter.delay_for(), 0.0)
+            self.assertEqual(limiter.delay_for(), 0.0)
+
+    def test_family_bucket_applies_on_top_of_shared_bucket(self):
+        with patch("aiograpi.ratelimit.time.monotonic", return_value=100.0):
+            limiter = TokenBucketRateLimiter(rate=10, burst=10, families={"friendships": (0.1, 1)})
+            self.assertEqual(limiter.delay_for("friendships"), 0.0)
+            self.assertEqual(limiter.delay_for("friendships"), 10.0)
+            self.assertEqual(limiter.delay_for("feed"), 0.0)
+            self.assertEqual(limiter.delay_for("login"), 0.0)
+
+
+class AdaptiveRateLimiterTestCase(unittest.TestCase):
+    def test_decreases_multiplicatively_and_recovers_additively(self):
+        with patch("aiograpi.ratelimit.time.monotonic", return_value=100.0):
+            limiter = AdaptiveRateLimiter(rate=1, increase=0.1, decrease=0.5)
+            limiter.record_response("feed", throttled=True)
+            self.assertEqual(limiter.rate, 0.5)
+            limiter.record_response("feed")
+            limiter.record_response("feed")
+        self.assertAlmostEqual(limiter.rate, 0.7)
+
+        for _ in range(10):
+            limiter.record_response("feed")
+        self.assertEqual(limiter.rate, 1)
+
+    def test_concurrent_throttles_count_as_one_event(self):
+        with patch("aiograpi.ratelimit.time.monotonic", return_value=100.0):
+            limiter = AdaptiveRateLimiter(rate=1, min_rate=0.1, cooldown=5)
+            for _ in range(3):
+                limiter.record_response("feed", throttled=True)
+            self.assertEqual(limiter.rate, 0.5)
+        with patch("aiograpi.ratelimit.time.monotonic", return_value=106.0):
+            for _ in range(3):
+                limiter.record_response("feed", throttled=True)
+            self.assertEqual(limiter.rate, 0.25)
+
+    def test_throttle_drops_burst(self):
+        with patch("aiograpi.ratelimit.time.monotonic", return_value=100.0):
+            limiter = AdaptiveRateLimiter(rate=1, burst=10)
+            limiter.record_response("feed", throttled=True)
+            self.assertEqual(limiter.delay_for("feed"), 2.0)
+
+    def test_family_throttle_only_slows_that_family(self):
+        limiter = AdaptiveRateLimiter(rate=1, families={"friendships": (0.2, 2)})
+        limiter.record_response("friendships", throttled=True)
+
+        self.assertEqual(limiter.rate_for("friendships"), 0.1)
+        self.assertEqual(limiter.rate, 1)
+
+
+class FixedDelayRateLimiterTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_sleeps_delay_and_burst_delay_after_recent_response(self):
+        limiter = FixedDelayRateLimiter(delay=lambda: 2)
+        with patch("aiograpi.ratelimit.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            await limiter.acquire("feed")
+            await limiter.acquire("login")
+            limiter.record_response("feed")
+            with patch("aiograpi.ratelimit.random.uniform", return_value=1.5):
+                await limiter.acquire("login")
+
+        self.assertEqual([call.args[0] for call in sleep.await_args_list], [2, 1.5])
+
+
+class ClientRateLimiterTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_private_request_acquires_endpoint_family(self):
+        limiter = TokenBucketRateLimiter()
+        limiter.acquire = AsyncMock()
+        client = Client(rate_limiter=limiter)
+        client.authorization_data = {"sessionid": "sessionid-value", "ds_user_id": "1"}
+        client.request_log = Mock()
+        response = Mock(status_code=200, headers={}, url="https://i.instagram.com/api/v1/")
+        response.content = response.text = '{"status":"ok"}'
+        response.json.return_value = {"status": "ok"}
+        client.private.get = AsyncMock(return_value=response)
+
+        await client.private_request("friendships/show/1/")
+
+        limiter.acquire.assert_awaited_once_with("friendships")
+
+    async def test_default_limiter_follows_request_timeout(self):
+        client = Client()
+        client.request_timeout = 3
+
+        self.assertIsInstance(client.rate_limiter, FixedDelayRateLimiter)
+        with patch("aiograpi.ratelimit.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            await client.rate_limiter.acquire("feed")
+
+        sleep.assert_awaited_once_with(3)
+
+    async def test_throttled_response_is_reported_to_limiter(self):
+        limiter = AdaptiveRateLimiter(rate=1)
+        client = Client(rate_limiter=limiter)
+        client.authorization_data = {"sessionid": "sessionid-value", "ds_user_id": "1"}
+        client.request_log = Mock()
+        response = Mock(status_code=429, headers={}, url="https://i.instagram.com/api/v1/feed/timeline/")
+        response.content = response.text = '{"status":"fail","message":"rate limited"}'
+        response.json.return_value = {"status": "fail", "message": "rate limited"}
+        response.raise_for_status.side_effect = httpx_ext.HTTPStatusError("429", request=Mock(), response=response)
+        client.private.get = AsyncMock(return_value=response)
+
+        with self.assertRaises(ClientThrottledError):
+            await client.private_request("feed/timeline/")
+
+        self.assertEqual(limiter.rate, 0.5)
+
+
+class RecordingRateLimiter(RateLimiter):
+    def __init__(self):
+        self.records = []
+
+    def record_response(self, family="default", throttled=False):
+        self.records.append((family, throttled))
+
+
+def _json_response(status_code, payload, url="https://i.instagram.com/api/v1/"):
+    response = Mock(status_code=status_code, headers={}, url=url)
+    response.content = response.text = str(payload)
+    response.json.return_value = payload
+    if status_code >= 400:
+        response.raise_for_status.side_effect = httpx_ext.HTTPStatusError(
+            str(status_code), request=Mock(), response=response
+        )
+    return response
+
+
+class ClientRateLimiterRecordTestCase(unittest.IsolatedAsyncioTestCase):
+    def build_client(self):
+        self.limiter = RecordingRateLimiter()
+        client = Client(rate_limiter=self.limiter)
+        client.authorization_data = {"sessionid": "sessionid-value", "ds_user_id": "1"}
+        client.request_log = Mock()
+        return client
+
+    async def test_success_inside_exception_handler_is_not_throttled(self):
+        client = self.build_client()
+        client.private.get = AsyncMock(return_value=_json_response(200, {"status": "ok"}))
+
+        try:
+            raise ClientThrottledError("outer")
+        except ClientThrottledError:
+            await client.private_request("feed/timeline/")
+
+        self.assertEqual(self.limiter.records, [("feed", False)])
+
+    async def test_cursor_resend_is_recorded_once(self):
+        client = self.build_client()
+        client.private.get = AsyncMock(
+            side_effect=[_json_response(500, {}), _json_response(200, {"status": "ok"})],
+        )
+
+        await client.private_request("feed/timeline/", params={"max_id": "broken"})
+
+        self.assertEqual(client.private.get.await_count, 2)
+        self.assertEqual(self.limiter.records, [("feed", False)])
+
+    async def test_graphql_www_throttle_is_recorded(self):
+        client = self.build_client()
+        client.private.post = AsyncMock(return_value=_json_response(429, {}))
+
+        with self.assertRaises(ClientThrottledError):
+            await client.private_graphql_www_request("FriendlyName")
+
+        self.assertEqual(self.limiter.records, [("graphql_www", True)])
+
+    async def test_public_requests_are_paced_and_recorded(self):
+        client = self.build_client()
+        self.limiter.acquire = AsyncMock()
+        client.last_response_ts = 0
+        client.public.get = AsyncMock(
+            side_effect=[_json_response(429, {}), _json_response(200, {"ok": True})],
+        )
+
+        with self.assertRaises(ClientThrottledError):
+            await client._send_public_request("https://www.instagram.com/api/v1/", return_json=True)
+        client.last_response_ts = 0
+        await client._send_public_request("https://www.instagram.com/api/v1/", return_json=True)
+
+        self.limiter.acquire.assert_awaited_with("public")
+        self.assertEqual(self.limiter.records, [("public", True), ("public", False)])
+
+    async def test_default_limiter_does_not_delay_public_requests(self):
+        limiter = FixedDelayRateLimiter(delay=3)
+
+        with patch("aiograpi.ratelimit.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            await limiter.acquire("public")
+            limiter.record_response("public")
+            await limiter.acquire("public")
+
+        sleep.assert_not_awaited()
+
+
+class DefaultRateLimiterTimingTestCase(unittest.IsolatedAsyncioTestCase):
+    """Sleeps of the default limiter match the pacing before it existed."""
+
+    def build_client(self):
+        client = Client()
+        client.request_timeout = 2
+        client.authorization_data = {"sessionid": "sessionid-value", "ds_user_id": "1"}
+        client.request_log = Mock()
+        client.last_response_ts = 0
+        client.private.get = AsyncMock(return_value=_json_response(200, {"status": "ok"}))
+        client.private.post = AsyncMock(return_value=_json_response(200, {"data": {}}))
+        client.graphql.get = AsyncMock(return_value=_json_response(200, {"data": {}}))
+        return client
+
+    async def sleeps(self, client, *requests):
+        result = []
+        for request in requests:
+            with patch("aiograpi.ratelimit.asyncio.sleep", new_callable=AsyncMock) as sleep:
+                with patch("aiograpi.ratelimit.random.uniform", return_value=1.5):
+                    await request(client)
+            result.append([call.args[0] for call in sleep.await_args_list])
+        return result
+
+    async def test_graphql_www_neither_gets_nor_opens_the_burst_window(self):
+        client = self.build_client()
+
+        def private(client):
+            return client.private_request("feed/timeline/")
+
+        def graphql_www(client):
+            return client.private_graphql_www_request("FriendlyName")
+
+        sleeps = await self.sleeps(client, graphql_www, private, graphql_www, private)
+
+        self.assertEqual(sleeps, [[2], [2], [2], [1.5, 2]])
+
+    async def test_public_graphql_response_opens_the_private_burst_window(self):
+        client = self.build_client()
+
+        def public_graphql(client):
+            return client._send_graphql_request(params={"query_hash": "x"}, return_json=True)
+
+        def private(client):
+            return client.private_request("feed/timeline/")
+
+        sleeps = await self.sleeps(client, public_graphql, private)
+
+        self.assertEqual(sleeps, [[], [1.5, 2]])
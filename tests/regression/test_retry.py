@@ -0,0 +1,174 @@
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+
+from aiograpi import Client, httpx_ext
+from aiograpi.exceptions import ClientIncompleteReadError, ClientThrottledError
+
+
+def _session(handler, **retry_kwargs):
+    session = httpx_ext.Session(retry=httpx_ext.Retry(**retry_kwargs))
+    session._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return session
+
+
+class SessionRetryRegressionTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_retries_transient_status_for_get(self):
+        statuses = [502, 503, 200]
+        seen_retry_headers = []
+
+        def handler(request):
+            seen_retry_headers.append(request.headers.get("X-Tigon-Is-Retry"))
+            return httpx.Response(statuses.pop(0))
+
+        session = _session(handler, retry_headers={"X-Tigon-Is-Retry": "True"})
+        session.headers["X-Tigon-Is-Retry"] = "False"
+        with patch("aiograpi.httpx_ext.asyncio.sleep", new=AsyncMock()) as sleep:
+            response = await session.get("https://i.instagram.com/api/v1/feed/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(sleep.await_count, 2)
+        self.assertTrue(all(call.args[0] <= 1 for call in sleep.await_args_list))
+        self.assertEqual(seen_retry_headers, ["False", "True", "True"])
+
+    async def test_gives_up_after_total_retries(self):
+        session = _session(lambda request: httpx.Response(500), total=2)
+        with patch("aiograpi.httpx_ext.asyncio.sleep", new=AsyncMock()) as sleep:
+            response = await session.get("https://i.instagram.com/api/v1/feed/")
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(sleep.await_count, 2)
+
+    async def test_honours_retry_after(self):
+        statuses = [httpx.Response(429, headers={"Retry-After": "3"}), httpx.Response(200)]
+        session = _session(lambda request: statuses.pop(0))
+        with patch("aiograpi.httpx_ext.asyncio.sleep", new=AsyncMock()) as sleep:
+            await session.get("https://i.instagram.com/api/v1/feed/")
+
+        sleep.assert_awaited_once_with(3.0)
+
+    async def test_does_not_block_for_long_retry_after(self):
+        session = _session(lambda request: httpx.Response(429, headers={"Retry-After": "3600"}))
+        with patch("aiograpi.httpx_ext.asyncio.sleep", new=AsyncMock()) as sleep:
+            response = await session.get("https://i.instagram.com/api/v1/feed/")
+
+        self.assertEqual(response.status_code, 429)
+        sleep.assert_not_awaited()
+
+    async def test_post_status_errors_are_not_resent(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(502)
+
+        session = _session(handler)
+        with patch("aiograpi.httpx_ext.asyncio.sleep", new=AsyncMock()):
+            response = await session.post("https://i.instagram.com/api/v1/media/1/like/", data={"a": "b"})
+
+        self.assertEqual(response.status_code, 502)
+        self.assertEqual(len(calls), 1)
+
+    async def test_post_is_resent_when_connection_was_never_established(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                raise httpx_ext.ConnectError("refused", request=request)
+            return httpx.Response(200)
+
+        session = _session(handler)
+        with patch("aiograpi.httpx_ext.asyncio.sleep", new=AsyncMock()):
+            response = await session.post("https://i.instagram.com/api/v1/media/1/like/", data={"a": "b"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(calls), 2)
+
+    async def test_post_read_error_is_resent_only_when_marked_idempotent(self):
+        def handler(request):
+            raise httpx_ext.ReadError("reset", request=request)
+
+        session = _session(handler, total=1)
+        with patch("aiograpi.httpx_ext.asyncio.sleep", new=AsyncMock()) as sleep:
+            with self.assertRaises(httpx_ext.ReadError):
+                await session.post("https://i.instagram.com/api/v1/x/", data={"a": "b"})
+            sleep.assert_not_awaited()
+            with self.assertRaises(httpx_ext.ReadError):
+                await session.post("https://i.instagram.com/api/v1/x/", data={"a": "b"}, idempotent=True)
+            sleep.assert_awaited_once()
+
+    async def test_budget_stops_retry_storms(self):
+        session = _session(
+            lambda request: httpx.Response(503),
+            budget=httpx_ext.RetryBudget(ratio=0, capacity=2),
+        )
+        with patch("aiograpi.httpx_ext.asyncio.sleep", new=AsyncMock()) as sleep:
+            await session.get("https://i.instagram.com/api/v1/feed/")
+            await session.get("https://i.instagram.com/api/v1/feed/")
+
+        self.assertEqual(sleep.await_count, 2)
+
+
+class ClientRetryConfigRegressionTestCase(unittest.TestCase):
+    def test_client_retry_settings_configure_private_transport(self):
+        client = Client(session_retry_total=5, session_retry_backoff_factor=0.25, session_retry_statuses=[503])
+
+        retry = client.private.retry
+        self.assertEqual((retry.total, retry.backoff_factor, retry.statuses), (5, 0.25, frozenset({503})))
+
+        budget = retry.budget
+        client.set_retry_config(session_retry_total=1)
+
+        self.assertEqual(client.private.retry.total, 1)
+        self.assertIs(client.private.retry.budget, budget)
+        self.assertEqual(client.get_settings()["session_retry_total"], 1)
+
+    def test_default_private_retry_leaves_throttles_to_the_caller(self):
+        self.assertEqual(Client().private.retry.statuses, frozenset({500, 502, 503, 504}))
+
+
+class PrivateRequestTimeoutRegressionTestCase(unittest.IsolatedAsyncioTestCase):
+    def build_client(self):
+        client = Client()
+        client.authorization_data = {"sessionid": "sessionid-value", "ds_user_id": "1"}
+        client.request_log = Mock()
+        client.last_response = Mock(headers={"Retry-After": "600"})
+        return client
+
+    async def test_get_is_resent_once_after_backoff(self):
+        client = self.build_client()
+        client._send_private_request = AsyncMock(side_effect=[ClientIncompleteReadError("cut"), {"status": "ok"}])
+
+        with patch("aiograpi.mixins.private.asyncio.sleep", new=AsyncMock()) as sleep:
+            await client.private_request("feed/timeline/")
+
+        self.assertEqual(client._send_private_request.await_count, 2)
+        self.assertLessEqual(sleep.await_args.args[0], client.private.retry.backoff_factor)
+
+    async def test_post_is_not_resent(self):
+        client = self.build_client()
+        client._send_private_request = AsyncMock(side_effect=ClientIncompleteReadError("cut"))
+
+        with patch("aiograpi.mixins.private.asyncio.sleep", new=AsyncMock()) as sleep:
+            with self.assertRaises(ClientIncompleteReadError):
+                await client.private_request("media/1/like/", data={"media_id": "1"})
+
+        client._send_private_request.assert_awaited_once()
+        sleep.assert_not_awaited()
+
+    async def test_throttled_get_is_not_retried_by_transport(self):
+        client = self.build_client()
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(429, json={"message": "rate limited", "status": "fail"})
+
+        client.private._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch("aiograpi.httpx_ext.asyncio.sleep", new=AsyncMock()):
+            with self.assertRaises(ClientThrottledError):
+                await client.private_request("feed/timeline/")
+
+        self.assertEqual(len(calls), 1)
@@ -0,0 +1,297 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from unittest.mock import AsyncMock, Mock
+
+from aiograpi import Client, httpx_ext
+from aiograpi.exceptions import VideoNotUpload
+from aiograpi.mixins.rupload import rupload_offset
+from aiograpi.utils.upload import RuploadState, RuploadStateStore
+
+VIDEO = b"0123456789" * 10
+
+
+def _build_client(upload_state=None):
+    client = Client(upload_state=upload_state)
+    client.settings = {}
+    client._user_id = "1"
+    client.uuid = "uuid"
+    client.android_device_id = "device"
+    client.last_json = {}
+    client.request_log = lambda response: None
+    return client
+
+
+def _offset_response(offset):
+    response = Mock(status_code=200)
+    response.json.return_value = {"offset": offset}
+    return response
+
+
+async def _body(call):
+    return b"".join([chunk async for chunk in call.kwargs["content"]])
+
+
+class RuploadStateStoreTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.video = Path(self._tmp.name) / "reel.mp4"
+        self.video.write_bytes(VIDEO)
+        self.store = RuploadStateStore(Path(self._tmp.name) / "state")
+
+    def test_save_load_and_discard(self):
+        state = RuploadState("1", "1_0_2", "waterfall", offset=40)
+
+        self.assertIsNone(self.store.load(self.video, "1:video"))
+        self.store.save(self.video, "1:video", state)
+
+        self.assertEqual(self.store.load(self.video, "1:video"), state)
+        self.assertIsNone(self.store.load(self.video, "1:clip"))
+        self.assertEqual(list(self.store.directory.glob(".*.tmp")), [])
+        self.store.discard(self.video, "1:video")
+        self.assertIsNone(self.store.load(self.video, "1:video"))
+
+    def test_changed_file_starts_a_new_upload(self):
+        self.store.save(self.video, "1:video", RuploadState("1", "1_0_2", "waterfall"))
+
+        self.video.write_bytes(VIDEO + b"more")
+        os.utime(self.video, ns=(1, 1))
+
+        self.assertIsNone(self.store.load(self.video, "1:video"))
+
+    def test_unreadable_state_is_ignored(self):
+        self.store.path_for(self.video, "1:video").write_text("{")
+
+        self.assertIsNone(self.store.load(self.video, "1:video"))
+
+    def test_rupload_offset_falls_back_to_zero(self):
+        self.assertEqual(rupload_offset(_offset_response(40), 100), 40)
+        self.assertEqual(rupload_offset(_offset_response(140), 100), 0)
+        self.assertEqual(rupload_offset(_offset_response("bad"), 100), 0)
+        self.assertEqual(rupload_offset(Mock(status_code=200), 100), 0)
+
+
+class RuploadResumeTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.video = Path(self._tmp.name) / "reel.mp4"
+        self.video.write_bytes(VIDEO)
+        self.store = RuploadStateStore(Path(self._tmp.name) / "state")
+
+    async def _video_rupload(self, client):
+        with mock.patch(
+            "aiograpi.mixins.video.analyze_video",
+            return_value=(720, 1280, 5, Path("/tmp/thumb.jpg")),
+        ):
+            with mock.patch("aiograpi.mixins.rupload.asyncio.sleep", new=AsyncMock()):
+                return await client.video_rupload(self.video)
+
+    async def test_video_rupload_continues_from_server_offset_after_network_error(self):
+        client = _build_client()
+        client.private.get = AsyncMock(side_effect=[_offset_response(0), _offset_response(40)])
+        client.private.post = AsyncMock(side_effect=[httpx_ext.WriteError("reset"), Mock(status_code=200)])
+
+        await self._video_rupload(client)
+
+        first, second = client.private.post.call_args_list
+        self.assertEqual(first.args[0], second.args[0])
+        headers = second.kwargs["headers"]
+        self.assertEqual(headers["Offset"], "40")
+        self.assertEqual(headers["X-Entity-Length"], "100")
+        self.assertEqual(headers["Content-Length"], "60")
+        self.assertEqual(await _body(second), VIDEO[40:])
+
+    async def test_video_rupload_resumes_persisted_session_in_new_client(self):
+        crashed = _build_client(self.store)
+        crashed.private.get = AsyncMock(return_value=_offset_response(30))
+        crashed.private.post = AsyncMock(side_effect=httpx_ext.WriteError("reset"))
+
+        with self.assertRaises(httpx_ext.WriteError):
+            await self._video_rupload(crashed)
+
+        saved = self.store.load(self.video, "1:video:000")
+        self.assertEqual(saved.offset, 30)
+        self.assertTrue(crashed.private.post.call_args.args[0].endswith(saved.upload_name))
+
+        client = _build_client(self.store)
+        client.private.get = AsyncMock(return_value=_offset_response(70))
+        client.private.post = AsyncMock(return_value=Mock(status_code=200))
+
+        upload_id, *_ = await self._video_rupload(client)
+
+        self.assertEqual(upload_id, saved.upload_id)
+        call = client.private.post.call_args
+        self.assertTrue(call.args[0].endswith(saved.upload_name))
+        self.assertEqual(call.kwargs["headers"]["X_FB_VIDEO_WATERFALL_ID"], saved.waterfall_id)
+        params = json.loads(call.kwargs["headers"]["X-Instagram-Rupload-Params"])
+        self.assertEqual(params["upload_id"], saved.upload_id)
+        self.assertEqual(call.kwargs["headers"]["Offset"], "70")
+        self.assertEqual(await _body(call), VIDEO[70:])
+        self.assertIsNone(self.store.load(self.video, "1:video:000"))
+
+    async def test_rejected_upload_drops_persisted_session(self):
+        client = _build_client(self.store)
+        client.private.get = AsyncMock(return_value=_offset_response(0))
+        client.private.post = AsyncMock(return_value=Mock(status_code=400, text="bad"))
+
+        with self.assertRaises(VideoNotUpload):
+            await self._video_rupload(client)
+
+        self.assertEqual(client.private.post.await_count, 1)
+        self.assertIsNone(self.store.load(self.video, "1:video:000"))
+
+    async def test_direct_video_rupload_resumes_from_server_offset(self):
+        client = _build_client(self.store)
+        client._messenger_rupload_headers = lambda extra: dict(extra)
+        uploaded = Mock(status_code=200)
+        uploaded.json.return_value = {"media_id": "987"}
+        request = AsyncMock(
+            side_effect=[_offset_response(0), httpx_ext.ReadTimeout("slow"), _offset_response(55), uploaded]
+        )
+
+        with mock.patch("aiograpi.mixins.direct.httpx_ext.request", new=request):
+            with mock.patch("aiograpi.mixins.rupload.asyncio.sleep", new=AsyncMock()):
+                media_id = await client._video_rupload(self.video, "entity-name", "111_ABC_Mixed_0")
+
+        self.assertEqual(media_id, 987)
+        post = request.await_args_list[-1]
+        self.assertEqual(post.args[:2], ("POST", "https://rupload.facebook.com/messenger_video/entity-name"))
+        self.assertEqual(post.kwargs["headers"]["offset"], "55")
+        self.assertEqual(post.kwargs["headers"]["content-length"], "45")
+        self.assertEqual(await _body(post), VIDEO[55:])
+        self.assertIsNone(self.store.load(self.video, "1:direct_video"))
+
+
+class RuploadSegmentsTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.video = Path(self._tmp.name) / "reel.mp4"
+        self.video.write_bytes(VIDEO)
+
+    def _segmented_client(self, fail_segment=None, store=None, drop_segment=None):
+        client = _build_client(store)
+        client.set_upload_segments(segment_size=32, parallelism=2, min_size=64)
+        client.private.get = AsyncMock(return_value=_offset_response(0))
+        self.segments = {}
+        self.in_flight = self.max_in_flight = 0
+
+        async def post(url, headers=None, content=None):
+            if url.endswith("phase=start"):
+                response = Mock(status_code=200)
+                response.json.return_value = {"stream_id": "stream-1"}
+                return response
+            if url.endswith("phase=end"):
+                return Mock(status_code=200)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                body = b"".join([chunk async for chunk in content])
+                await asyncio.sleep(0.01)
+            finally:
+                self.in_flight -= 1
+            start = int(headers.get("Segment-Start-Offset", 0))
+            if start == drop_segment:
+                raise httpx_ext.WriteError("reset")
+            if start == fail_segment:
+                return Mock(status_code=500, text="segment failed")
+            self.segments[start] = (url, headers, body)
+            return Mock(status_code=200)
+
+        client.private.post = AsyncMock(side_effect=post)
+        return client
+
+    async def _video_rupload(self, client):
+        with mock.patch(
+            "aiograpi.mixins.video.analyze_video",
+            return_value=(720, 1280, 5, Path("/tmp/thumb.jpg")),
+        ):
+            with mock.patch("aiograpi.mixins.rupload.asyncio.sleep", new=AsyncMock()):
+                return await client.video_rupload(self.video)
+
+    async def test_large_video_is_uploaded_as_parallel_segments(self):
+        client = self._segmented_client()
+
+        await self._video_rupload(client)
+
+        urls = [call.args[0] for call in client.private.post.call_args_list]
+        upload_url = urls[0].split("?")[0]
+        self.assertEqual(urls[0], upload_url + "?segmented=true&phase=start")
+        self.assertEqual(urls[-1], upload_url + "?segmented=true&phase=end")
+        self.assertEqual(client.private.post.call_args.kwargs["headers"]["Stream-Id"], "stream-1")
+        self.assertEqual(sorted(self.segments), [0, 32, 64, 96])
+        self.assertEqual(b"".join(self.segments[start][2] for start in sorted(self.segments)), VIDEO)
+        self.assertEqual(self.max_in_flight, 2)
+        for start, (url, headers, body) in self.segments.items():
+            self.assertTrue(url.endswith(f"-0-{len(body)}"))
+            self.assertEqual(headers["X-Entity-Name"], url.rsplit("/", 1)[-1])
+            self.assertEqual(headers["X-Entity-Length"], str(len(body)))
+            self.assertEqual(headers["Stream-Id"], "stream-1")
+            self.assertEqual(headers["Segment-Type"], "3")
+            self.assertIn("X-Instagram-Rupload-Params", headers)
+        self.assertEqual(client.private.get.await_count, 4)
+
+    async def test_small_video_keeps_single_request(self):
+        client = self._segmented_client()
+        client.set_upload_segments(segment_size=32, parallelism=2, min_size=len(VIDEO) + 1)
+
+        await self._video_rupload(client)
+
+        self.assertEqual(client.private.post.await_count, 1)
+        self.assertNotIn("?", client.private.post.call_args.args[0])
+
+    async def test_failed_segment_cancels_upload_without_end_phase(self):
+        client = self._segmented_client(fail_segment=32)
+
+        with self.assertRaises(VideoNotUpload):
+            await self._video_rupload(client)
+
+        urls = [call.args[0] for call in client.private.post.call_args_list]
+        self.assertFalse(any(url.endswith("phase=end") for url in urls))
+
+    async def test_interrupted_segmented_upload_resumes_unfinished_segments(self):
+        store = RuploadStateStore(Path(self._tmp.name) / "state")
+        crashed = self._segmented_client(store=store, drop_segment=64)
+        crashed.set_upload_segments(segment_size=32, parallelism=1, min_size=64)
+
+        with self.assertRaises(httpx_ext.WriteError):
+            await self._video_rupload(crashed)
+
+        saved = store.load(self.video, "1:video:000")
+        self.assertEqual(saved.stream_id, "stream-1")
+        self.assertEqual((saved.segment_size, sorted(saved.segments_done)), (32, [0, 32]))
+        self.assertIn(64, saved.segments)
+
+        client = self._segmented_client(store=store)
+        client.set_upload_segments(segment_size=32, parallelism=1, min_size=64)
+        upload_id, *_ = await self._video_rupload(client)
+
+        self.assertEqual(upload_id, saved.upload_id)
+        urls = [call.args[0] for call in client.private.post.call_args_list]
+        self.assertFalse(any(url.endswith("phase=start") for url in urls))
+        self.assertTrue(urls[-1].endswith("phase=end"))
+        self.assertEqual(client.private.post.call_args.kwargs["headers"]["Stream-Id"], "stream-1")
+        self.assertEqual(sorted(self.segments), [64, 96])
+        self.assertTrue(self.segments[64][0].endswith(saved.segments[64]))
+        self.assertIsNone(store.load(self.video, "1:video:000"))
+
+    async def test_changed_segment_size_starts_a_new_stream(self):
+        store = RuploadStateStore(Path(self._tmp.name) / "state")
+        crashed = self._segmented_client(store=store, drop_segment=32)
+        crashed.set_upload_segments(segment_size=32, parallelism=1, min_size=64)
+
+        with self.assertRaises(httpx_ext.WriteError):
+            await self._video_rupload(crashed)
+
+        client = self._segmented_client(store=store)
+        client.set_upload_segments(segment_size=50, parallelism=1, min_size=64)
+        await self._video_rupload(client)
+
+        self.assertTrue(client.private.post.call_args_list[0].args[0].endswith("phase=start"))
+        self.assertEqual(sorted(self.segments), [0, 50])
@@ -157,6 +157,61 @@ class StoryMixinRegressionTestCase(unittest.IsolatedAsyncioTestCase):
         self.assertFalse(story.sponsor_tags[0].friendship_status.following)
         self.assertFalse(story.sponsor_tags[0].friendship_status.incoming_request)
 
+    def _story_item(self, pk, user_pk):
+        return {
+            "pk": pk,
+            "id": f"{pk}_{user_pk}",
+            "code": f"code{pk}",
+            "taken_at": 1710000000,
+            "media_type": 1,
+            "image_versions2": {"candidates": [{"url": "https://example.com/x.jpg", "width": 720, "height": 1280}]},
+            "user": {"pk": user_pk, "username": f"user{user_pk}", "profile_pic_url": "https://example.com/p.jpg"},
+        }
+
+    async def test_users_stories_v1_fetches_many_users_from_reels_media(self):
+        client = Client()
+        client.private_request = AsyncMock(
+            return_value={
+                "reels": {
+                    "2": {"items": [self._story_item("20", "2"), self._story_item("21", "2")]},
+                    "3": {"items": [self._story_item("30", "3")]},
+                },
+                "status": "ok",
+            }
+        )
+
+        stories = await client.users_stories_v1([2, "3", "4"], amount=1)
+
+        self.assertEqual(
+            {user_id: [story.pk for story in items] for user_id, items in stories.items()},
+            {"2": ["20"], "3": ["30"], "4": []},
+        )
+        endpoint, data = client.private_request.await_args.args
+        self.assertEqual(endpoint, "feed/reels_media/")
+        self.assertEqual(data["user_ids"], ["2", "3", "4"])
+
+    async def test_users_stories_many_chunks_requests_and_streams_results(self):
+        client = Client()
+        failure = ClientNotFoundError("not found")
+
+        async def users_stories_v1(user_ids, amount=None):
+            if "5" in user_ids:
+                raise failure
+            return {user_id: [extract_story_v1(self._story_item(f"{user_id}0", user_id))] for user_id in user_ids}
+
+        client.users_stories_v1 = AsyncMock(side_effect=users_stories_v1)
+
+        results = {}
+        async for user_id, stories in client.users_stories_many(["1", "2", "3", "2", "4", "5"], chunk_size=2):
+            results[user_id] = stories
+
+        self.assertEqual(
+            sorted(call.args[0] for call in client.users_stories_v1.await_args_list), [["1", "2"], ["3", "4"], ["5"]]
+        )
+        self.assertEqual(results["3"][0].pk, "30")
+        self.assertIs(results["5"], failure)
+        self.assertEqual(sorted(results), ["1", "2", "3", "4", "5"])
+
     async def test_story_poll_vote_posts_vote_to_poll_endpoint(self):
         client = Client()
         client.authorization_data = {"sessionid": "sessionid-value", "ds_user_id": "1"}
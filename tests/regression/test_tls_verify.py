@@ -1,4 +1,6 @@
+import tempfile
 import unittest
+from pathlib import Path
 from unittest import mock
 from unittest.mock import AsyncMock
 
@@ -50,6 +52,10 @@ class ClientTLSVerifyRegressionTestCase(unittest.IsolatedAsyncioTestCase):
 
     async def test_direct_rupload_requests_use_client_tls_verify(self):
         client = Client(tls_verify=False)
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        path = Path(tmpdir.name) / "video.mp4"
+        path.write_bytes(b"video-bytes")
 
         with mock.patch(
             "aiograpi.mixins.direct.httpx_ext.request",
@@ -57,7 +63,7 @@ class ClientTLSVerifyRegressionTestCase(unittest.IsolatedAsyncioTestCase):
         ) as request:
             request.side_effect = [_FakeResponse({"offset": 0}), _FakeResponse({"media_id": 123})]
 
-            media_id = await client._video_rupload(b"video-bytes", "entity-name", "waterfall-id")
+            media_id = await client._video_rupload(path, "entity-name", "waterfall-id")
 
         self.assertEqual(media_id, 123)
         self.assertEqual(request.await_count, 2)
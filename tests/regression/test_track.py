@@ -1,8 +1,11 @@
 import tempfile
 import unittest
+from contextlib import asynccontextmanager
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
+
 from aiograpi import Client
 from aiograpi.exceptions import TrackNotFound
 
@@ -175,20 +178,27 @@ class TrackMixinRegressionTestCase(unittest.IsolatedAsyncioTestCase):
             }
         )
 
-    async def test_track_download_by_url_uses_httpx_request(self):
+    async def test_track_download_by_url_streams_through_httpx_ext(self):
         client = Client()
         client.request_timeout = 7
-        response = Mock()
-        response.read.return_value = b"track-bytes"
+        response = httpx.Response(
+            200, content=b"track-bytes", request=httpx.Request("GET", "https://example.com/audio/test-track.mp3")
+        )
+        calls = []
+
+        @asynccontextmanager
+        async def stream(*args, **kwargs):
+            calls.append((args, kwargs))
+            yield response
 
         with tempfile.TemporaryDirectory() as temp_dir:
-            with patch("aiograpi.mixins.track.httpx_ext.request", new=AsyncMock(return_value=response)) as request:
+            with patch("aiograpi.mixins.track.httpx_ext.stream", new=stream):
                 path = await client.track_download_by_url(
                     "https://example.com/audio/test-track.mp3",
                     folder=Path(temp_dir),
                 )
                 self.assertEqual(path.read_bytes(), b"track-bytes")
+                self.assertEqual(list(Path(temp_dir).iterdir()), [path])
 
-        request.assert_awaited_once_with("GET", "https://example.com/audio/test-track.mp3", timeout=7)
-        response.raise_for_status.assert_called_once_with()
+        self.assertEqual(calls, [(("GET", "https://example.com/audio/test-track.mp3"), {"timeout": 7})])
         self.assertEqual(path.name, "test-track.mp3")
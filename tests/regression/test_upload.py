@@ -1,8 +1,11 @@
+import asyncio
 import io
 import json
 import tempfile
+import threading
 import types
 import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Literal, Union, get_args, get_origin, get_type_hints
@@ -11,7 +14,15 @@ from unittest.mock import AsyncMock
 from PIL import Image
 
 from aiograpi import Client
+from aiograpi.exceptions import AlbumUnknownFormat, PhotoNotUpload
 from aiograpi.types import Media, StoryBuild, UserShort, Usertag
+from aiograpi.utils.upload import UPLOAD_CHUNK_SIZE, FileBody
+
+
+def _video_file(folder) -> Path:
+    path = Path(folder) / "example.mp4"
+    path.write_bytes(b"video-bytes")
+    return path
 
 
 class UploadRegressionTestCase(unittest.IsolatedAsyncioTestCase):
@@ -173,6 +184,45 @@ class UploadRegressionTestCase(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(extra_data["publish_mode"], "scheduled")
         self.assertEqual(json.loads(extra_data["content_scheduling_metadata"]), {"scheduled_publish_time": schedule_at})
 
+    async def test_video_rupload_streams_file_from_disk(self):
+        client = self.build_client()
+        ok_response = unittest.mock.Mock(status_code=200)
+        client.private.get = AsyncMock(return_value=ok_response)
+        client.private.post = AsyncMock(return_value=ok_response)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "example.mp4"
+            path.write_bytes(b"video-bytes" * 50000)
+            with unittest.mock.patch(
+                "aiograpi.mixins.video.analyze_video",
+                return_value=(720, 1280, 5, Path("/tmp/thumb.jpg")),
+            ):
+                with unittest.mock.patch("builtins.open", wraps=open) as opened:
+                    await client.video_rupload(path)
+                    self.assertFalse(opened.called)
+
+            call = client.private.post.call_args
+            self.assertNotIn("data", call.kwargs)
+            self.assertEqual(call.kwargs["headers"]["Content-Length"], "550000")
+            self.assertEqual(call.kwargs["headers"]["X-Entity-Length"], "550000")
+            body = call.kwargs["content"]
+            self.assertIsInstance(body, FileBody)
+            chunks = [chunk async for chunk in body]
+            self.assertTrue(all(len(chunk) <= UPLOAD_CHUNK_SIZE for chunk in chunks))
+            self.assertEqual(b"".join(chunks), path.read_bytes())
+            # a retried request sends the body again
+            self.assertEqual(b"".join([chunk async for chunk in body]), path.read_bytes())
+
+    async def test_file_body_streams_a_slice_of_the_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "example.mp4"
+            path.write_bytes(b"0123456789")
+
+            body = FileBody(path, offset=2, length=5, chunk_size=2)
+
+            self.assertEqual([chunk async for chunk in body], [b"23", b"45", b"6"])
+            self.assertEqual([chunk async for chunk in FileBody(path, offset=8)], [b"89"])
+
     async def test_album_upload_sends_scheduled_publish_metadata(self):
         client = self.build_client()
         schedule_at = 1779808917
@@ -252,6 +302,74 @@ class UploadRegressionTestCase(unittest.IsolatedAsyncioTestCase):
             client.video_configure.call_args.kwargs["extra_data"]["invite_coauthor_user_ids"], ["123", "456"]
         )
 
+    async def test_album_upload_uploads_children_concurrently_in_order(self):
+        client = self.build_client()
+        in_flight = []
+        peak = []
+
+        async def photo_rupload(path, upload_id="", to_album=False):
+            in_flight.append(path)
+            peak.append(len(in_flight))
+            # later items finish first
+            await asyncio.sleep(0.01 * (5 - len(peak)))
+            in_flight.remove(path)
+            return upload_id, 720, 720
+
+        async def video_rupload(path, to_album=False, upload_id=""):
+            return upload_id, 720, 1280, 5.0, Path("/tmp/thumb.jpg")
+
+        client.photo_rupload = AsyncMock(side_effect=photo_rupload)
+        client.video_rupload = AsyncMock(side_effect=video_rupload)
+        client.album_configure = AsyncMock(return_value={"status": "ok"})
+        client._extract_configured_media_or_raise = lambda configured, *args, **kwargs: self.build_media(media_type=8)
+        paths = [Path("one.jpg"), Path("two.mp4"), Path("three.jpg"), Path("four.jpg")]
+
+        with unittest.mock.patch("aiograpi.mixins.album.time.time", return_value=1700000000.0):
+            await client.album_upload(paths, "caption", configure_timeout=0, concurrency=2)
+
+        children = client.album_configure.call_args.args[0]
+        self.assertEqual(
+            [child["upload_id"] for child in children],
+            ["1700000000000", "1700000000001", "1700000000002", "1700000000003"],
+        )
+        self.assertIn("clips", children[1])
+        self.assertEqual(max(peak), 2)
+        client.video_rupload.assert_awaited_once_with(Path("two.mp4"), to_album=True, upload_id="1700000000001")
+
+    async def test_album_upload_cancels_children_when_one_fails(self):
+        client = self.build_client()
+        cancelled = []
+
+        async def photo_rupload(path, upload_id="", to_album=False):
+            if path.name == "bad.jpg":
+                raise PhotoNotUpload("failed")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(path)
+                raise
+            return upload_id, 720, 720
+
+        client.photo_rupload = AsyncMock(side_effect=photo_rupload)
+        client.album_configure = AsyncMock(return_value={"status": "ok"})
+
+        with self.assertRaises(PhotoNotUpload):
+            await client.album_upload(
+                [Path("one.jpg"), Path("bad.jpg"), Path("three.jpg")], "caption", configure_timeout=0
+            )
+
+        self.assertEqual(cancelled, [Path("one.jpg"), Path("three.jpg")])
+        client.album_configure.assert_not_awaited()
+
+    async def test_album_upload_rejects_unknown_format_before_uploading(self):
+        client = self.build_client()
+        client.photo_rupload = AsyncMock(return_value=("1", 720, 720))
+
+        with self.assertRaises(AlbumUnknownFormat):
+            await client.album_upload([Path("one.jpg"), Path("two.gif")], "caption", configure_timeout=0)
+
+        client.photo_rupload.assert_not_awaited()
+
     async def test_album_upload_adds_coauthor_user_ids(self):
         client = self.build_client()
         client.photo_rupload = AsyncMock(return_value=("1", 720, 720))
@@ -297,15 +415,11 @@ class UploadRegressionTestCase(unittest.IsolatedAsyncioTestCase):
             "should_use_header_over_cookies": True,
         }
         response = unittest.mock.Mock(status_code=200)
-        opened = unittest.mock.Mock()
-        opened.__enter__ = unittest.mock.Mock(return_value=unittest.mock.Mock(size=(720, 720)))
-        opened.__exit__ = unittest.mock.Mock(return_value=False)
 
         with unittest.mock.patch("aiograpi.mixins.photo.prepare_image", return_value=(b"photo-bytes", (720, 720))):
-            with unittest.mock.patch("aiograpi.mixins.photo.Image.open", return_value=opened):
-                with unittest.mock.patch("random.randint", return_value=1234567890):
-                    client.private.post = AsyncMock(return_value=response)
-                    upload_id, width, height = await client.photo_rupload(Path("image.jpg"), upload_id="upload-id")
+            with unittest.mock.patch("random.randint", return_value=1234567890):
+                client.private.post = AsyncMock(return_value=response)
+                upload_id, width, height = await client.photo_rupload(Path("image.jpg"), upload_id="upload-id")
 
         self.assertEqual((upload_id, width, height), ("upload-id", 720, 720))
         headers = client.private.post.call_args.kwargs["headers"]
@@ -346,6 +460,73 @@ class UploadRegressionTestCase(unittest.IsolatedAsyncioTestCase):
             self.assertEqual(prepared.getpixel((1070, 960)), (0, 0, 254))
             self.assertEqual(prepared.getpixel((540, 100)), (0, 0, 0))
 
+    async def test_photo_rupload_prepares_image_in_configured_executor(self):
+        client = self.build_client()
+        client.private.post = AsyncMock(return_value=unittest.mock.Mock(status_code=200))
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="image-prep")
+        self.addCleanup(executor.shutdown)
+        client.set_image_executor(executor)
+        threads = []
+
+        def prepare_image(path, **kwargs):
+            threads.append(threading.current_thread().name)
+            return b"photo-bytes", (640, 480)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "photo.jpg"
+            Image.new("RGB", (640, 480), "green").save(path)
+            with unittest.mock.patch("aiograpi.mixins.photo.prepare_image", side_effect=prepare_image):
+                upload_id, width, height = await client.photo_rupload(path, upload_id="upload-id")
+
+        self.assertEqual((upload_id, width, height), ("upload-id", 640, 480))
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads[0].startswith("image-prep"))
+        self.assertEqual(client.private.post.call_args.kwargs["data"], b"photo-bytes")
+
+    async def test_photo_rupload_prepares_image_in_process_pool(self):
+        client = Client(image_executor=ProcessPoolExecutor(max_workers=1))
+        self.addCleanup(client.image_executor.shutdown)
+        self.assertIsInstance(client.image_executor, ProcessPoolExecutor)
+        client.settings = {}
+        client.private.post = AsyncMock(return_value=unittest.mock.Mock(status_code=200))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "large.jpg"
+            Image.new("RGB", (2160, 2160), "green").save(path)
+            upload_id, width, height = await client.photo_rupload(path, upload_id="upload-id")
+
+        self.assertEqual((upload_id, width, height), ("upload-id", 1080, 1080))
+        with Image.open(io.BytesIO(client.private.post.call_args.kwargs["data"])) as prepared:
+            self.assertEqual(prepared.size, (1080, 1080))
+
+    async def test_photo_rupload_does_not_block_event_loop_while_preparing(self):
+        client = self.build_client()
+        client.private.post = AsyncMock(return_value=unittest.mock.Mock(status_code=200))
+        released = threading.Event()
+        ticks = []
+
+        def prepare_image(path, **kwargs):
+            released.wait(5)
+            return b"photo-bytes", (640, 480)
+
+        async def ticker():
+            while not released.is_set():
+                ticks.append(1)
+                if len(ticks) == 3:
+                    released.set()
+                await asyncio.sleep(0.01)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "photo.jpg"
+            Image.new("RGB", (640, 480), "green").save(path)
+            with unittest.mock.patch("aiograpi.mixins.photo.prepare_image", side_effect=prepare_image):
+                await asyncio.wait_for(
+                    asyncio.gather(client.photo_rupload(path, upload_id="upload-id"), ticker()),
+                    timeout=5,
+                )
+
+        self.assertEqual(len(ticks), 3)
+
     async def test_video_story_fit_resize_renders_canvas_before_upload(self):
         client = self.build_client()
         client.video_rupload = AsyncMock(return_value=("1", 720, 1280, 5, Path("/tmp/thumb.jpg")))
@@ -385,9 +566,9 @@ class UploadRegressionTestCase(unittest.IsolatedAsyncioTestCase):
             "aiograpi.mixins.clip.analyze_video",
             return_value=(Path("/tmp/thumb.jpg"), 720, 1280, 6.023),
         ):
-            with unittest.mock.patch("builtins.open", unittest.mock.mock_open(read_data=b"video-bytes")):
+            with tempfile.TemporaryDirectory() as tmpdir:
                 with unittest.mock.patch("asyncio.sleep", new=AsyncMock()):
-                    media = await client.clip_upload(Path("example.mp4"), "caption")
+                    media = await client.clip_upload(_video_file(tmpdir), "caption")
 
         self.assertIsInstance(media, Media)
         upload_settings_call = client.private.post.call_args_list[0]
@@ -449,10 +630,10 @@ class UploadRegressionTestCase(unittest.IsolatedAsyncioTestCase):
             "aiograpi.mixins.clip.analyze_video",
             return_value=(Path("/tmp/thumb.jpg"), 720, 1280, 6.023),
         ):
-            with unittest.mock.patch("builtins.open", unittest.mock.mock_open(read_data=b"video-bytes")):
+            with tempfile.TemporaryDirectory() as tmpdir:
                 with unittest.mock.patch("asyncio.sleep", new=AsyncMock()):
                     await client.clip_upload(
-                        Path("example.mp4"),
+                        _video_file(tmpdir),
                         "caption",
                         topics=[123, "456"],
                         extra_data=extra_data,
@@ -1,5 +1,7 @@
+import asyncio
 import json
 import unittest
+from contextlib import aclosing
 from unittest.mock import AsyncMock, Mock
 
 from aiograpi import Client
@@ -65,6 +67,59 @@ class UserMixinRegressionTestCase(unittest.IsolatedAsyncioTestCase):
         client.user_info_v1.assert_awaited_once_with("123")
         client._user_info_public.assert_not_awaited()
 
+    async def test_user_info_many_dedupes_serves_cache_and_reports_errors(self):
+        client = Client()
+        client.authorization_data = {"sessionid": "sessionid-value", "ds_user_id": "1"}
+        client._users_cache = {"1": Mock(pk="1", username="cached")}
+        client._usernames_cache = {}
+        in_flight = []
+        peak = []
+
+        async def user_info_v1(user_id):
+            in_flight.append(user_id)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.remove(user_id)
+            if user_id == "3":
+                raise UserNotFound("User not found", user_id=user_id)
+            return Mock(pk=user_id, username=f"user{user_id}")
+
+        client.user_info_v1 = AsyncMock(side_effect=user_info_v1)
+        client._user_info_public = AsyncMock(side_effect=UserNotFound("User not found"))
+
+        users = await client.user_info_many(["2", "1", "3", "2", 4, "5"], concurrency=2)
+
+        self.assertEqual(list(users), ["2", "1", "3", "4", "5"])
+        self.assertEqual(users["1"].username, "cached")
+        self.assertEqual(users["2"].username, "user2")
+        self.assertIsInstance(users["3"], UserNotFound)
+        self.assertEqual(sorted(call.args[0] for call in client.user_info_v1.await_args_list), ["2", "3", "4", "5"])
+        self.assertEqual(max(peak), 2)
+
+    async def test_iter_user_info_many_yields_cache_hits_first_and_cancels_on_break(self):
+        client = Client()
+        client._users_cache = {"1": Mock(pk="1", username="cached")}
+        client._usernames_cache = {}
+        started = []
+
+        async def user_info_public(user_id):
+            started.append(user_id)
+            await asyncio.sleep(0 if user_id == "2" else 10)
+            return Mock(pk=user_id, username=f"user{user_id}")
+
+        client._user_info_public = AsyncMock(side_effect=user_info_public)
+
+        seen = []
+        async with aclosing(client.iter_user_info_many(["2", "3", "1"], concurrency=2)) as users:
+            async for user_id, user in users:
+                seen.append((user_id, user.username))
+                if user_id == "2":
+                    break
+
+        self.assertEqual(seen, [("1", "cached"), ("2", "user2")])
+        self.assertEqual(started, ["2", "3"])
+        self.assertNotIn("3", client._users_cache)
+
     async def test_user_info_by_username_uses_private_first_when_authorized(self):
         client = Client()
         client.authorization_data = {"sessionid": "sessionid-value", "ds_user_id": "1"}